@@ -0,0 +1,54 @@
+"""Dashboard bootstrap payload, pre-encoded per dataset version."""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl, urlsplit
+
+from rich import print
+from starlette.types import ASGIApp
+
+from .config import settings
+from .services.vintages import pin_data_loader
+from .subrequests import asgi_get
+
+if TYPE_CHECKING:
+    from .services import DataLoader
+
+_build_lock = asyncio.Lock()
+
+
+async def build_bootstrap(app: ASGIApp, loader: "DataLoader") -> bytes:
+    """Render the configured bootstrap routes from a loader into one JSON document.
+
+    Each route is requested in-process with ``loader`` pinned, so the
+    payload matches the standalone responses of that dataset version even
+    before it is swapped in. Routes that fail are null. The encoded payload
+    is kept on the loader.
+    """
+    routes = settings.bootstrap_routes
+    with pin_data_loader(loader):
+        responses = await asyncio.gather(*(
+            asgi_get(app, parts.path, dict(parse_qsl(parts.query)))
+            for parts in map(urlsplit, routes.values())
+        ))
+
+    fields = [b'"dataset_version":' + json.dumps(loader.version).encode()]
+    for key, route, response in zip(routes, routes.values(), responses):
+        body = response.body
+        if response.status != 200:
+            print(f"[red]Bootstrap route {route} failed with status {response.status}[/red]")
+            body = b"null"
+        fields.append(json.dumps(key).encode() + b":" + body)
+
+    loader.bootstrap = b"{" + b",".join(fields) + b"}"
+    return loader.bootstrap
+
+
+async def get_bootstrap(app: ASGIApp, loader: "DataLoader") -> bytes:
+    """Get the bootstrap payload of a loader, building it on first use."""
+    if loader.bootstrap is None:
+        async with _build_lock:
+            if loader.bootstrap is None:
+                await build_bootstrap(app, loader)
+    return loader.bootstrap
@@ -0,0 +1,70 @@
+"""Compression of cached response bodies."""
+
+import gzip
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Callable
+
+import brotli
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=11)
+
+
+# Compressors at their highest ratio; they run once per cached body
+COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {"br": _brotli, "gzip": _gzip}
+
+
+@dataclass(frozen=True)
+class CompressedBody:
+    """A response body in one content coding and the CPU time compressing it took."""
+
+    body: bytes
+    seconds: float
+
+
+def compress_body(body: bytes, encodings: Iterable[str]) -> dict[str, CompressedBody]:
+    """Compress a body with each encoding, keeping those that make it smaller."""
+    compressed = {}
+    for encoding in encodings:
+        start = time.thread_time()
+        data = COMPRESSORS[encoding](body)
+        seconds = time.thread_time() - start
+        if len(data) < len(body):
+            compressed[encoding] = CompressedBody(data, seconds)
+    return compressed
+
+
+def negotiate_encoding(accept_encoding: str | None, available: Iterable[str]) -> str | None:
+    """Pick the content coding to send for an Accept-Encoding header.
+
+    Among the ``available`` codings the client accepts, the one with the
+    highest q-value wins and ties go to the first. None means identity.
+    """
+    qualities: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
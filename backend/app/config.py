@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 
@@ -10,6 +11,93 @@ class Settings(BaseSettings):
     # Data file path - relative to project root
     data_file: Path = Path("data/USForestResources_2022_AppendixTables.xlsx")
 
+    # Other editions of the appendix tables by name, e.g. {"2017": "data/...xlsx"};
+    # data_file is always available as the default vintage
+    vintages: dict[str, Path] = {}
+    default_vintage: str = "2022"
+    # Bytes of cached frames across loaded vintages before LRU eviction
+    vintage_memory_budget: int = 512 * 1024 * 1024
+    # Bytes of cached frames, indexes and orders per loader before LRU eviction
+    # (0 never evicts)
+    table_cache_bytes: int = 64 * 1024 * 1024
+
+    # Engine used to parse worksheets: "streaming" reads the sheet XML directly,
+    # "openpyxl" goes through pd.read_excel
+    reader_engine: Literal["openpyxl", "streaming"] = "streaming"
+
+    # Compiled columnar snapshot of the data file (None disables it)
+    snapshot_dir: Path | None = Path("data/snapshot")
+    # Share the typed tables of the workers of a host: without a matching
+    # snapshot, the first worker compiles one per dataset version into
+    # shared_tables_dir and every worker maps its column blocks read-only
+    shared_tables: bool = False
+    shared_tables_dir: Path = Path("data/shared")
+
+    # Seconds between checks of the data file for changes (0 disables reload)
+    reload_interval: float = 5.0
+
+    # Tables parsed at startup, and the number of processes parsing them
+    preload_tables: list[str] = [
+        "Table A-1a",
+        "Table A-2",
+        "Table A-3",
+        "Table A-10",
+        "Table A-17",
+        "Table A-18",
+        "Table A-19",
+        "Table A-20",
+        "Table A-33",
+        "Table A-34",
+        "Table A-35",
+    ]
+    preload_workers: int = 4
+
+    # Rendered API responses kept in memory, in bytes (0 disables the cache)
+    response_cache_bytes: int = 64 * 1024 * 1024
+    # Paths whose responses are never cached: they report live state (the table
+    # catalog has the sizes of the tables loaded so far without a snapshot)
+    response_cache_exclude: list[str] = ["/api/stats", "/api/tables"]
+    # Cache-Control lifetimes, in seconds, sent with cacheable responses
+    cache_max_age: int = 300
+    cache_stale_while_revalidate: int = 86400
+    # Content codings stored with cached responses, in order of preference,
+    # and the smallest body worth compressing, in bytes
+    compression_encodings: list[Literal["br", "gzip"]] = ["br", "gzip"]
+    compression_min_bytes: int = 1024
+
+    # Responses bundled into /api/bootstrap by key, rendered once per dataset version
+    bootstrap_routes: dict[str, str] = {
+        "land_area_summary": "/api/land-area?limit=1",
+        "regions": "/api/filters/regions",
+        "states": "/api/filters/states",
+        "years": "/api/filters/years",
+        "land_area_by_region": "/api/land-area/summary/by-region",
+        "land_area_by_state": "/api/land-area/summary/by-state",
+        "ownership_breakdown": "/api/ownership/breakdown",
+        "timber_breakdown": "/api/timber/breakdown",
+        "timber_by_region": "/api/timber/by-region",
+        "forest_area_national": "/api/trends/forest-area/national",
+        "dynamics_summary": "/api/dynamics/summary",
+        "dynamics_by_region": "/api/dynamics/by-region",
+    }
+
+    # Most sub-requests accepted by POST /api/batch
+    batch_max_requests: int = 50
+
+    # Records encoded per chunk of streamed (NDJSON/CSV) responses
+    stream_chunk_records: int = 2000
+
+    # Threads running the blocking (pandas) bodies of request handlers (0 runs
+    # them on the event loop), calls allowed to wait for one, and seconds
+    # before a call gets 503 (still waiting) or 504 (still running)
+    executor_workers: int = 4
+    executor_queue_size: int = 64
+    request_timeout: float = 30.0
+
+    # Limits of /api/query: groups returned, and cells (rows x measures) reduced
+    query_max_groups: int = 5000
+    query_max_cost: int = 10_000_000
+
     # CORS settings - allow all origins for public API
     cors_origins: list[str] = ["*"]
 
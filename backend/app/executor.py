@@ -0,0 +1,126 @@
+"""Bounded executor for the blocking bodies of request handlers."""
+
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException
+
+from .config import settings
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """Thread pool with a bounded queue and a deadline per call.
+
+    At most ``workers`` calls run at once and ``queue_size`` more wait for a
+    worker; calls beyond that are rejected at once with 503. A call still
+    waiting when its ``timeout`` expires is dropped with 503, and one still
+    running gets 504. Running calls cannot be interrupted: they keep their
+    worker until they finish, so the bound holds even after a timeout.
+    With no workers, calls run inline on the event loop without a deadline.
+    """
+
+    def __init__(self, workers: int, queue_size: int, timeout: float):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="handler") if workers else None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.expired = 0
+        self.timed_out = 0
+        self.busy_seconds = 0.0
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run ``func`` on a worker in a copy of the current context."""
+        if self._executor is None:
+            return func(*args, **kwargs)
+        with self._lock:
+            if self._pending >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise HTTPException(status_code=503, detail="Server busy", headers={"Retry-After": "1"})
+            self._pending += 1
+
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, self._timed, functools.partial(func, *args, **kwargs))
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.timeout)
+        except TimeoutError:
+            if future.cancel():
+                with self._lock:
+                    self.expired += 1
+                raise HTTPException(
+                    status_code=503, detail="No worker became free in time", headers={"Retry-After": "1"},
+                )
+            with self._lock:
+                self.timed_out += 1
+            raise HTTPException(status_code=504, detail=f"Request took longer than {self.timeout:g}s")
+
+    def _timed(self, call: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.busy_seconds += elapsed
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self.completed += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Pool size, current load and outcome counters."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "timeout": self.timeout,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "expired": self.expired,
+                "timed_out": self.timed_out,
+                "busy_seconds": round(self.busy_seconds, 3),
+            }
+
+
+_executor: BoundedExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> BoundedExecutor:
+    """Get the singleton BoundedExecutor instance."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BoundedExecutor(
+                    settings.executor_workers, settings.executor_queue_size, settings.request_timeout,
+                )
+    return _executor
+
+
+def offload(func: Callable[..., T]) -> Callable[..., Any]:
+    """Run a blocking route handler on the bounded executor.
+
+    The handler is written as a plain function; FastAPI sees an async
+    endpoint with the same signature, so parameters and dependencies
+    resolve as before and only the body runs on a worker.
+    """
+    @functools.wraps(func)
+    async def endpoint(*args: Any, **kwargs: Any) -> T:
+        return await get_executor().run(func, *args, **kwargs)
+
+    return endpoint
@@ -1,30 +1,85 @@
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import asyncio
+import threading
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from rich import print
 
 from .config import settings
-from .routers import (
-    land_area_router,
-    ownership_router,
-    trends_router,
-    timber_router,
-    dynamics_router,
-    filters_router,
-)
-from .services import get_data_loader
+from .executor import get_executor
+from .middleware import DatasetVersionMiddleware, LazyRoutesMiddleware, ResponseCacheMiddleware
+from .response_cache import ResponseCache
+from .services.vintages import get_vintage_registry
+from .warmup import WarmUp
+
+# The routers import pandas, which takes longer than the rest of the app:
+# they are included by the warm-up (or the first request needing them), so
+# the health probes answer as soon as the server starts
+_routers_lock = threading.Lock()
+_routers_included = False
+
+
+def include_routers() -> None:
+    """Import the API routers and include them in the app (once)."""
+    global _routers_included
+    with _routers_lock:
+        if _routers_included:
+            return
+        from .routers import (
+            land_area_router,
+            ownership_router,
+            trends_router,
+            timber_router,
+            dynamics_router,
+            filters_router,
+            export_router,
+            batch_router,
+            bootstrap_router,
+            query_router,
+            tables_router,
+        )
+
+        app.include_router(land_area_router, prefix="/api/land-area", tags=["Land Area"])
+        app.include_router(ownership_router, prefix="/api/ownership", tags=["Ownership"])
+        app.include_router(trends_router, prefix="/api/trends", tags=["Trends"])
+        app.include_router(timber_router, prefix="/api/timber", tags=["Timber"])
+        app.include_router(dynamics_router, prefix="/api/dynamics", tags=["Dynamics"])
+        app.include_router(filters_router, prefix="/api/filters", tags=["Filters"])
+        app.include_router(export_router, prefix="/api/export", tags=["Export"])
+        app.include_router(batch_router, prefix="/api/batch", tags=["Batch"])
+        app.include_router(bootstrap_router, prefix="/api/bootstrap", tags=["Bootstrap"])
+        app.include_router(query_router, prefix="/api/query", tags=["Query"])
+        app.include_router(tables_router, prefix="/api/tables", tags=["Tables"])
+        _routers_included = True
+
+
+async def serve_data(app: FastAPI) -> None:
+    """Warm up the default dataset, then watch the data files for new versions."""
+    await warm_up.run(app, include_routers)
+    if settings.reload_interval > 0:
+        from .bootstrap import build_bootstrap
+        from .services import DataReloader
+
+        reloader = DataReloader(settings.reload_interval, on_load=lambda new_loader: build_bootstrap(app, new_loader))
+        await reloader.run()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     print("[green]Starting U.S. Forest Resources API...[/green]")
-    # Pre-load data on startup
-    loader = get_data_loader()
-    loader.preload_all()
-    print("[green]Data loaded successfully![/green]")
+    # Import the routes, preload data and render the bootstrap payload in the
+    # background: the server is live right away and ready once warm-up
+    # finishes. Then watch the data file and hot-swap new dataset versions,
+    # each with its bootstrap payload ready
+    data_task = asyncio.create_task(serve_data(app))
+
     yield
+
     print("[yellow]Shutting down...[/yellow]")
+    data_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await data_task
 
 
 app = FastAPI(
@@ -34,6 +89,29 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Startup warm-up of the default dataset, reported by /health/ready
+warm_up = WarmUp()
+
+# Rendered responses, keyed by request and dataset version, with their
+# compressed bodies
+response_cache = ResponseCache(settings.response_cache_bytes)
+
+# Middleware added last runs first: CORS wraps the cache so that cached
+# responses get CORS headers too, and the routes are included innermost
+app.add_middleware(LazyRoutesMiddleware, include=include_routers)
+app.add_middleware(DatasetVersionMiddleware)
+app.add_middleware(
+    ResponseCacheMiddleware,
+    cache=response_cache,
+    cache_control=(
+        f"public, max-age={settings.cache_max_age}, "
+        f"stale-while-revalidate={settings.cache_stale_while_revalidate}"
+    ),
+    exclude=settings.response_cache_exclude,
+    compression_encodings=settings.compression_encodings,
+    compression_min_bytes=settings.compression_min_bytes,
+)
+
 # Configure CORS - allow all origins for public API
 app.add_middleware(
     CORSMiddleware,
@@ -41,17 +119,9 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Dataset-Version", "ETag"],
 )
 
-# Include routers
-app.include_router(land_area_router, prefix="/api/land-area", tags=["Land Area"])
-app.include_router(ownership_router, prefix="/api/ownership", tags=["Ownership"])
-app.include_router(trends_router, prefix="/api/trends", tags=["Trends"])
-app.include_router(timber_router, prefix="/api/timber", tags=["Timber"])
-app.include_router(dynamics_router, prefix="/api/dynamics", tags=["Dynamics"])
-app.include_router(filters_router, prefix="/api/filters", tags=["Filters"])
-
-
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -59,6 +129,7 @@ async def root():
         "name": settings.app_name,
         "version": settings.app_version,
         "docs": "/docs",
+        "dataset_version": get_vintage_registry().version_of(),
         "endpoints": {
             "land_area": "/api/land-area",
             "ownership": "/api/ownership",
@@ -66,11 +137,46 @@ async def root():
             "timber": "/api/timber",
             "dynamics": "/api/dynamics",
             "filters": "/api/filters",
+            "export": "/api/export/{table}",
+            "batch": "/api/batch",
+            "bootstrap": "/api/bootstrap",
+            "query": "/api/query/{table}",
+            "tables": "/api/tables",
         },
     }
 
 
+@app.get("/api/stats")
+async def stats():
+    """Cache and loader statistics."""
+    from .services.query import compile_query
+
+    registry = get_vintage_registry()
+    return {
+        "vintages": registry.stats(),
+        "tables": {name: loader.stats() for name, loader in registry.loaded()},
+        "response_cache": response_cache.stats(),
+        "executor": get_executor().stats(),
+        "query_plans": compile_query.cache_info()._asdict(),
+        "warm_up": warm_up.status(),
+    }
+
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint (the server is up; see /health/ready for the data)."""
     return {"status": "healthy"}
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the server is up and answering requests."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness(response: Response):
+    """Readiness probe: 200 once the data is warmed up, else 503 with the warm-up progress."""
+    if not warm_up.ready:
+        response.status_code = 503
+    return warm_up.status()
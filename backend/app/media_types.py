@@ -0,0 +1,20 @@
+"""Media types of API responses and their negotiation.
+
+Kept apart from ``serialization`` so that the middleware can negotiate
+without importing pandas.
+"""
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """MessagePack if the Accept header asks for it, JSON otherwise."""
+    for part in (accept or "").split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        if media_type.lower() in _MSGPACK_MEDIA_TYPES and "q=0" not in params:
+            return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
@@ -0,0 +1,223 @@
+"""ASGI middleware."""
+
+from collections.abc import Callable
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .compression import compress_body, negotiate_encoding
+from .media_types import negotiate_media_type
+from .response_cache import CachedResponse, ResponseCache, encoded_etag, make_etag
+from .services.vintages import get_vintage_registry, pinned_data_loader, track_dataset_versions
+
+DATASET_VERSION_HEADER = "X-Dataset-Version"
+
+
+class DatasetVersionMiddleware:
+    """Tag every response with the dataset version it was computed from."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        versions = track_dataset_versions()
+
+        async def send_with_version(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Before the default vintage is loaded, no version is known yet
+                version = versions[0] if versions else get_vintage_registry().version_of()
+                if version is not None:
+                    MutableHeaders(scope=message)[DATASET_VERSION_HEADER] = version
+            await send(message)
+
+        await self.app(scope, receive, send_with_version)
+
+
+class LazyRoutesMiddleware:
+    """Include the API routes on the first request that may need them.
+
+    Importing the routers pulls in pandas; ``include`` does it in a worker
+    thread, so requests under ``skip_prefix`` (the health probes) are
+    answered before it finishes. ``include`` must be idempotent.
+    """
+
+    def __init__(self, app: ASGIApp, include: Callable[[], None], skip_prefix: str = "/health"):
+        self.app = app
+        self.include = include
+        self.skip_prefix = skip_prefix
+        self.included = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.included and scope["type"] == "http" and not scope["path"].startswith(self.skip_prefix):
+            await run_in_threadpool(self.include)
+            self.included = True
+        await self.app(scope, receive, send)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header matches an entity tag (weak comparison)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class ResponseCacheMiddleware:
+    """Serve repeated API GET requests from a ResponseCache.
+
+    Responses are keyed by path, normalized query parameters, negotiated
+    media type and the dataset version of the requested vintage. Cacheable responses carry a strong
+    ETag and a Cache-Control header, and a matching If-None-Match is answered
+    with 304 Not Modified. Streamed and non-200 responses pass through.
+
+    Bodies of at least ``compression_min_bytes`` are compressed once per
+    encoding when stored, and each request gets the one its Accept-Encoding
+    prefers, under its own ETag.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache,
+        cache_control: str,
+        exclude: list[str] | None = None,
+        prefix: str = "/api/",
+        compression_encodings: list[str] | None = None,
+        compression_min_bytes: int = 1024,
+    ):
+        self.app = app
+        self.cache = cache
+        self.cache_control = cache_control
+        self.exclude = set(exclude or ())
+        self.prefix = prefix
+        self.compression_encodings = list(compression_encodings or ())
+        self.compression_min_bytes = compression_min_bytes
+
+    def _cache_key(self, scope: Scope) -> tuple | None:
+        """Key of a request, or None if its response must not be cached."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or self.cache.max_bytes <= 0
+            or not scope["path"].startswith(self.prefix)
+            or scope["path"] in self.exclude
+            # Responses of a pinned loader may not match the registered version
+            or pinned_data_loader() is not None
+        ):
+            return None
+
+        query = sorted(parse_qsl(scope["query_string"].decode("latin-1")))
+        try:
+            version = get_vintage_registry().version_of(dict(query).get("vintage"))
+        except KeyError:
+            # Unknown vintage; let the endpoint report it
+            return None
+        if version is None:
+            # Vintage not loaded yet; the endpoint loads it for the next request
+            return None
+        media_type = negotiate_media_type(Headers(scope=scope).get("accept"))
+        return scope["path"], urlencode(query), media_type, version
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self._cache_key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        accept_encoding = request_headers.get("accept-encoding")
+        entry = self.cache.get(key)
+        if entry is not None:
+            await self._send_entry(entry, if_none_match, accept_encoding, send)
+            return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+        streaming = False
+
+        async def send_and_store(message: Message) -> None:
+            nonlocal start, streaming
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                # Hold the headers back until the ETag of the body is known
+                start = message
+                MutableHeaders(scope=start)["cache-control"] = self.cache_control
+                return
+
+            if message["type"] != "http.response.body" or start is None or streaming:
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                # Streamed responses are passed through without caching
+                streaming = True
+                await send(start)
+                await send({"type": "http.response.body", "body": b"".join(chunks), "more_body": True})
+                return
+
+            body = b"".join(chunks)
+            headers = MutableHeaders(scope=start)
+            headers["etag"] = make_etag(body)
+            encodings = {}
+            if self.compression_encodings and len(body) >= self.compression_min_bytes:
+                encodings = await run_in_threadpool(compress_body, body, self.compression_encodings)
+                self.cache.record_compression(encodings)
+                headers.add_vary_header("Accept-Encoding")
+            version = headers.get(DATASET_VERSION_HEADER.lower(), key[-1])
+            entry = CachedResponse(
+                body=body, headers=list(start["headers"]), etag=headers["etag"], version=version, encodings=encodings,
+            )
+            self.cache.put(key[:-1] + (version,), entry)
+            await self._send_entry(entry, if_none_match, accept_encoding, send, stored=False)
+
+        await self.app(scope, receive, send_and_store)
+
+    async def _send_entry(
+        self,
+        entry: CachedResponse,
+        if_none_match: str | None,
+        accept_encoding: str | None,
+        send: Send,
+        stored: bool = True,
+    ) -> None:
+        """Send a cached response in the encoding the client prefers, or 304 if it has it."""
+        encoding = negotiate_encoding(accept_encoding, (e for e in self.compression_encodings if e in entry.encodings))
+        etag = encoded_etag(entry.etag, encoding) if encoding else entry.etag
+
+        if _etag_matches(if_none_match, etag):
+            self.cache.not_modified += 1
+            headers = [
+                (b"etag", etag.encode()),
+                (b"cache-control", self.cache_control.encode()),
+                (DATASET_VERSION_HEADER.lower().encode(), entry.version.encode()),
+            ]
+            # A 304 carries the Vary of the 200 it stands for (RFC 9110, 15.4.5)
+            headers += [(name, value) for name, value in entry.headers if name == b"vary"]
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if encoding is None:
+            await send({"type": "http.response.start", "status": 200, "headers": entry.headers})
+            await send({"type": "http.response.body", "body": entry.body})
+            return
+
+        body = entry.encodings[encoding].body
+        message = {"type": "http.response.start", "status": 200, "headers": list(entry.headers)}
+        headers = MutableHeaders(scope=message)
+        headers["content-length"] = str(len(body))
+        headers["content-encoding"] = encoding
+        headers["etag"] = etag
+        self.cache.record_encoded(entry, encoding, stored)
+        await send(message)
+        await send({"type": "http.response.body", "body": body})
@@ -1,9 +1,18 @@
 from .common import RegionInfo, StateInfo, FilterOptions
 from .land_area import LandAreaRecord, LandAreaResponse
-from .ownership import OwnershipRecord, OwnershipResponse, OwnershipTrendRecord
-from .trends import ForestAreaTrendRecord, ForestAreaTrendResponse, GrowingStockTrendRecord
+from .ownership import (
+    OwnershipRecord,
+    OwnershipResponse,
+    OwnershipTrendRecord,
+    TimberlandOwnershipRecord,
+    TimberlandOwnershipResponse,
+)
+from .trends import ForestAreaTrendRecord, ForestAreaTrendResponse, GrowingStockTrendRecord, GrowingStockTrendResponse
 from .timber import TimberVolumeRecord, TimberVolumeResponse
 from .dynamics import DynamicsRecord, DynamicsResponse
+from .batch import BatchQuery, BatchRequest, BatchResult, BatchResponse
+from .query import QueryResponse
+from .tables import ColumnMetadata, TableCatalogResponse, TableMetadata, TableSummary
 
 __all__ = [
     "RegionInfo",
@@ -14,11 +23,23 @@ __all__ = [
     "OwnershipRecord",
     "OwnershipResponse",
     "OwnershipTrendRecord",
+    "TimberlandOwnershipRecord",
+    "TimberlandOwnershipResponse",
     "ForestAreaTrendRecord",
     "ForestAreaTrendResponse",
     "GrowingStockTrendRecord",
+    "GrowingStockTrendResponse",
     "TimberVolumeRecord",
     "TimberVolumeResponse",
     "DynamicsRecord",
     "DynamicsResponse",
+    "BatchQuery",
+    "BatchRequest",
+    "BatchResult",
+    "BatchResponse",
+    "QueryResponse",
+    "ColumnMetadata",
+    "TableCatalogResponse",
+    "TableMetadata",
+    "TableSummary",
 ]
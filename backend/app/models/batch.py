@@ -0,0 +1,28 @@
+"""Batch query Pydantic models."""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class BatchQuery(BaseModel):
+    """One GET request of a batch."""
+    id: str
+    route: str = Field(description="API path, e.g. /api/land-area or /api/land-area?limit=2")
+    params: dict[str, str | int | float | bool | list[str] | None] = {}
+
+
+class BatchRequest(BaseModel):
+    """Requests to run together."""
+    requests: list[BatchQuery]
+
+
+class BatchResult(BaseModel):
+    """Status and JSON body of one request of a batch."""
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Results of a batch keyed by request id."""
+    results: dict[str, BatchResult]
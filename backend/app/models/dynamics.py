@@ -8,6 +8,7 @@ class DynamicsRecord(BaseModel):
     region: str
     subregion: str | None = None
     species_group: str
+    ownership: str = "All owners"
     year: int
     growth: float | None = None
     mortality: float | None = None
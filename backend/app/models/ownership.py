@@ -52,3 +52,20 @@ class OwnershipTrendRecord(BaseModel):
     total_private: float | None = None
     private_corporate: float | None = None
     private_noncorporate: float | None = None
+
+
+class TimberlandOwnershipRecord(BaseModel):
+    """Timberland area of one ownership class for a specific year."""
+    region: str
+    subregion: str | None = None
+    state: str | None = None
+    ownership: str
+    year: int
+    area: float | None = None
+
+
+class TimberlandOwnershipResponse(BaseModel):
+    """Response containing timberland ownership trend data."""
+    data: list[TimberlandOwnershipRecord]
+    years: list[int]
+    total_records: int
@@ -0,0 +1,17 @@
+"""Aggregate query Pydantic models."""
+
+from pydantic import BaseModel
+
+
+class QueryResponse(BaseModel):
+    """Grouped aggregates of a table.
+
+    Each row holds the group keys and one ``<measure>_<func>`` value per
+    aggregate, e.g. ``total_forest_land_sum``.
+    """
+    table: str
+    group_by: list[str]
+    aggregates: list[str]
+    data: list[dict[str, str | int | float | None]]
+    total_records: int
+    rows_scanned: int
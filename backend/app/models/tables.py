@@ -0,0 +1,48 @@
+"""Table catalog Pydantic models."""
+
+from pydantic import BaseModel
+
+
+class ColumnMetadata(BaseModel):
+    """A column of a table.
+
+    Measures (numeric columns) have a value range; dimensions have a count
+    of distinct values.
+    """
+    name: str
+    dtype: str
+    kind: str
+    non_null: int
+    distinct: int | None = None
+    min: float | None = None
+    max: float | None = None
+
+
+class TableSummary(BaseModel):
+    """Catalog entry of a table.
+
+    Sizes are read from the compiled snapshot, so listing the catalog
+    parses no table; without a snapshot only the tables loaded so far have
+    them. Which tables are cached right now is reported by /api/stats.
+    """
+    id: str
+    name: str
+    title: str | None = None
+    rows: int | None = None
+    columns: int | None = None
+
+
+class TableMetadata(BaseModel):
+    """Catalog entry of a worksheet with its columns."""
+    id: str
+    name: str
+    title: str | None = None
+    rows: int
+    memory_bytes: int
+    columns: list[ColumnMetadata]
+
+
+class TableCatalogResponse(BaseModel):
+    """Catalog of all worksheets of the data file."""
+    data: list[TableSummary]
+    total_records: int
@@ -23,12 +23,20 @@ class GrowingStockTrendRecord(BaseModel):
     """Growing stock volume for a specific year."""
     region: str
     subregion: str | None = None
+    state: str | None = None
     species_group: str
     year: int
     volume: float | None = None
     ownership: str | None = None
 
 
+class GrowingStockTrendResponse(BaseModel):
+    """Response containing growing stock trend data."""
+    data: list[GrowingStockTrendRecord]
+    years: list[int]
+    total_records: int
+
+
 class TimeSeriesPoint(BaseModel):
     """Single point in a time series."""
     year: int
@@ -0,0 +1,84 @@
+"""Pagination, sorting and field projection of list responses."""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+from .serialization import Records
+from .services import DataLoader
+from .services.sorting import ordered_positions
+
+
+@dataclass(frozen=True)
+class Page:
+    """Rows, order and fields requested from a list endpoint."""
+
+    limit: int | None = None
+    offset: int = 0
+    sort: str | None = None
+    fields: tuple[str, ...] | None = None
+
+    def records(
+        self,
+        loader: DataLoader,
+        table_name: str,
+        df: pd.DataFrame,
+        positions: np.ndarray | None,
+        model: type[BaseModel],
+    ) -> Records:
+        """Take the requested page of the rows at ``positions`` (all rows if None).
+
+        Sorting uses the loader's precomputed order of the column, and only
+        the rows of the page and the requested columns are taken.
+        """
+        if self.fields is not None:
+            unknown = [name for name in self.fields if name not in model.model_fields]
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        if self.sort is None and self.limit is None and not self.offset and self.fields is None:
+            return Records(df if positions is None else df.take(positions), model)
+
+        if positions is None:
+            positions = np.arange(len(df))
+        if self.sort is not None:
+            column = self.sort.removeprefix("-")
+            sortable = [
+                name for name in model.model_fields
+                if name in df.columns and pd.api.types.is_numeric_dtype(df[name])
+            ]
+            if column not in sortable:
+                raise HTTPException(
+                    status_code=400, detail=f"Cannot sort by {column}; numeric fields: {', '.join(sortable)}",
+                )
+            order = loader.get_sort_order(table_name, column, descending=self.sort.startswith("-"))
+            positions = ordered_positions(order, positions)
+
+        stop = None if self.limit is None else self.offset + self.limit
+        positions = positions[self.offset:stop]
+        columns = [name for name in (self.fields or model.model_fields) if name in df.columns]
+        return Records(df[columns].take(positions), model, self.fields)
+
+
+def page_params(
+    limit: int | None = Query(None, ge=1, description="Maximum number of records to return"),
+    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    sort: str | None = Query(None, description="Numeric field to sort by; prefix with - for descending"),
+    fields: str | None = Query(None, description="Comma-separated record fields to return"),
+) -> Page:
+    """Dependency resolving the pagination, sorting and projection parameters."""
+    # An empty selection (?fields=) means no projection, like an empty sort
+    names = tuple(name.strip() for name in (fields or "").split(",") if name.strip())
+    return Page(limit, offset, sort or None, names or None)
+
+
+def column_sum(df: pd.DataFrame, column: str, positions: np.ndarray | None) -> float:
+    """Sum of a column over the rows at ``positions`` (all rows if None)."""
+    values = df[column] if positions is None else df[column].take(positions)
+    return values.sum()
+
+
+def row_count(df: pd.DataFrame, positions: np.ndarray | None) -> int:
+    return len(df) if positions is None else len(positions)
@@ -0,0 +1,142 @@
+"""In-memory cache of rendered API responses."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .compression import CompressedBody
+
+# Rough per-entry overhead on top of the body and headers
+ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A rendered 200 response, its strong validator and its compressed bodies."""
+
+    body: bytes
+    headers: list[tuple[bytes, bytes]]
+    etag: str
+    version: str
+    encodings: dict[str, CompressedBody] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return (
+            len(self.body)
+            + sum(len(compressed.body) for compressed in self.encodings.values())
+            + sum(len(k) + len(v) for k, v in self.headers)
+            + ENTRY_OVERHEAD
+        )
+
+
+def make_etag(body: bytes) -> str:
+    """Strong entity tag of a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """Strong entity tag of a response body in a content coding, e.g. ``"abc-br"``."""
+    return etag[:-1] + "-" + encoding + '"'
+
+
+class ResponseCache:
+    """Size-bounded LRU of responses keyed by request and dataset version.
+
+    Keys include the dataset version, so entries of a replaced version are
+    never served again and age out of the LRU.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.not_modified = 0
+        # Per content coding: responses sent, their bytes before and after
+        # compression, CPU seconds spent compressing bodies and CPU seconds
+        # saved by sending stored bodies instead of compressing each response
+        self.compression: dict[str, dict[str, float]] = {}
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        """Get a cached response, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: CachedResponse) -> None:
+        """Store a response, evicting the least recently used ones to fit."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.size
+            self._entries[key] = entry
+            self.nbytes += entry.size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.size
+                self.evictions += 1
+
+    def _compression_stats(self, encoding: str) -> dict[str, float]:
+        return self.compression.setdefault(encoding, {
+            "responses": 0,
+            "identity_bytes": 0,
+            "encoded_bytes": 0,
+            "compress_seconds": 0.0,
+            "seconds_saved": 0.0,
+        })
+
+    def record_compression(self, encodings: dict[str, CompressedBody]) -> None:
+        """Count the CPU time spent compressing a body."""
+        with self._lock:
+            for encoding, compressed in encodings.items():
+                self._compression_stats(encoding)["compress_seconds"] += compressed.seconds
+
+    def record_encoded(self, entry: CachedResponse, encoding: str, stored: bool) -> None:
+        """Count a response sent in a content coding; ``stored`` if it was not compressed for it."""
+        compressed = entry.encodings[encoding]
+        with self._lock:
+            stats = self._compression_stats(encoding)
+            stats["responses"] += 1
+            stats["identity_bytes"] += len(entry.body)
+            stats["encoded_bytes"] += len(compressed.body)
+            if stored:
+                stats["seconds_saved"] += compressed.seconds
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counters, memory usage and compression metrics."""
+        with self._lock:
+            compression = {
+                encoding: {
+                    **stats,
+                    "ratio": round(stats["identity_bytes"] / stats["encoded_bytes"], 2) if stats["encoded_bytes"] else None,
+                }
+                for encoding, stats in self.compression.items()
+            }
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self.nbytes,
+                "memory_budget": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "not_modified": self.not_modified,
+                "compression": compression,
+            }
@@ -4,6 +4,11 @@ from .trends import router as trends_router
 from .timber import router as timber_router
 from .dynamics import router as dynamics_router
 from .filters import router as filters_router
+from .export import router as export_router
+from .batch import router as batch_router
+from .bootstrap import router as bootstrap_router
+from .query import router as query_router
+from .tables import router as tables_router
 
 __all__ = [
     "land_area_router",
@@ -12,4 +17,9 @@ __all__ = [
     "timber_router",
     "dynamics_router",
     "filters_router",
+    "export_router",
+    "batch_router",
+    "bootstrap_router",
+    "query_router",
+    "tables_router",
 ]
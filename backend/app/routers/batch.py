@@ -0,0 +1,65 @@
+"""Batch query API endpoint."""
+
+import asyncio
+import json
+from urllib.parse import parse_qsl, urlsplit
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..config import settings
+from ..models.batch import BatchQuery, BatchRequest, BatchResponse
+from ..subrequests import asgi_get
+
+router = APIRouter()
+
+
+def _json_body(status: int, detail: str) -> tuple[int, bytes]:
+    return status, json.dumps({"detail": detail}).encode()
+
+
+def _query_params(query: BatchQuery) -> tuple[str, dict]:
+    """Split a query's route into its path and parameters, ``params`` taking precedence."""
+    parts = urlsplit(query.route)
+    params: dict[str, list[str]] = {}
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        params.setdefault(key, []).append(value)
+    merged = {key: values[0] if len(values) == 1 else values for key, values in params.items()}
+    return parts.path, {**merged, **query.params}
+
+
+async def _run_query(app, query: BatchQuery) -> tuple[int, bytes]:
+    """Run one query of a batch through the app; return its status and JSON body."""
+    path, params = _query_params(query)
+    if not path.startswith("/api/"):
+        return _json_body(400, f"Not an API route: {query.route}")
+    try:
+        response = await asgi_get(app, path, params)
+    except Exception:
+        return _json_body(500, "Internal Server Error")
+    if not response.headers.get("content-type", "").startswith("application/json"):
+        return _json_body(406, f"{query.route} does not return JSON")
+    return response.status, response.body
+
+
+@router.post("", response_model=BatchResponse)
+async def run_batch(batch: BatchRequest, request: Request) -> Response:
+    """Run several GET requests in one round-trip.
+
+    Each query goes through the same routing, handlers and response cache as
+    a separate request, concurrently with the others. Results are keyed by
+    query id, each with its own status and JSON body.
+    """
+    if len(batch.requests) > settings.batch_max_requests:
+        raise HTTPException(status_code=400, detail=f"At most {settings.batch_max_requests} requests per batch")
+    ids = [query.id for query in batch.requests]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Request ids must be unique")
+
+    results = await asyncio.gather(*(_run_query(request.app, query) for query in batch.requests))
+
+    # Bodies are already JSON; splice them in instead of parsing them again
+    parts = [
+        json.dumps(query_id, ensure_ascii=False).encode() + b':{"status":' + str(status).encode() + b',"body":' + body + b"}"
+        for query_id, (status, body) in zip(ids, results)
+    ]
+    return Response(b'{"results":{' + b",".join(parts) + b"}}", media_type="application/json")
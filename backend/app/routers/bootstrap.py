@@ -0,0 +1,21 @@
+"""Dashboard bootstrap API endpoint."""
+
+from fastapi import APIRouter, Depends, Request, Response
+
+from ..bootstrap import get_bootstrap
+from ..services import DataLoader, get_data_loader
+
+router = APIRouter()
+
+
+@router.get("", responses={200: {"content": {"application/json": {}}, "description": "Bootstrap payload"}})
+async def get_dashboard_bootstrap(
+    request: Request,
+    loader: DataLoader = Depends(get_data_loader),
+) -> Response:
+    """Get everything the dashboard needs for its first paint in one response.
+
+    The payload holds the responses of the routes in ``bootstrap_routes`` by
+    key, plus the dataset version; it is rendered once per dataset version.
+    """
+    return Response(await get_bootstrap(request.app, loader), media_type="application/json")
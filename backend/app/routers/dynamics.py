@@ -1,160 +1,116 @@
 """Forest dynamics API endpoints (growth, mortality, removals)."""
 
-from fastapi import APIRouter, Depends, Query
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 
+from ..config import settings
+from ..executor import offload
 from ..models.dynamics import DynamicsRecord, DynamicsResponse, DynamicsSummary, RegionalDynamics
+from ..paging import Page, page_params
+from ..serialization import (
+    ENCODED_RESPONSES,
+    STREAMED_RESPONSES,
+    ResponseFormat,
+    StreamFormat,
+    response_format,
+    stream_records,
+)
 from ..services import DataLoader, get_data_loader
+from ..services.dynamics import ALL_OWNERS, METRICS, NATION
 
 router = APIRouter()
 
+OWNERSHIP_DESCRIPTION = "Ownership class (All owners, National forest, Other public, Total private, ...)"
 
-def parse_dynamics_table(df, metric_name: str) -> list[dict]:
-    """Parse the complex dynamics table structure."""
-    # These tables have: Region, Subregion, Species class, then year columns for different ownerships
-    # For now, we'll extract the "All owners" columns
-    records = []
-
-    for _, row in df.iterrows():
-        region = row.get("Region")
-        subregion = row.get("Subregion")
-        species = row.get("Species class")
-
-        if region is None:
-            continue
-
-        # Look for "All owners: YEAR" columns
-        for col in df.columns:
-            if "All owners:" in str(col):
-                try:
-                    year = int(col.split(":")[1].strip())
-                    value = row.get(col)
-                    if value is not None and not (isinstance(value, float) and value != value):
-                        records.append({
-                            "region": region,
-                            "subregion": subregion if subregion and str(subregion) != "nan" else None,
-                            "species_group": species,
-                            "year": year,
-                            metric_name: float(value),
-                        })
-                except (ValueError, IndexError):
-                    continue
-
-    return records
-
-
-@router.get("", response_model=DynamicsResponse)
-async def get_dynamics(
+
+def dynamics_positions(
+    loader: DataLoader,
+    region: str | None = None,
+    year: int | None = None,
+    species: str | None = None,
+    ownership: str = ALL_OWNERS,
+) -> np.ndarray:
+    """Row positions of the dynamics cube matching the filters, looked up in its index."""
+    index = loader.get_table_index("dynamics_cube")
+    positions = index.lookup(region=region, year=year, species_group=species, ownership=ownership)
+    return np.arange(len(index.df)) if positions is None else positions
+
+
+def slice_dynamics(
+    loader: DataLoader,
+    region: str | None = None,
+    year: int | None = None,
+    species: str | None = None,
+    ownership: str = ALL_OWNERS,
+) -> pd.DataFrame:
+    """Select the rows of the dynamics cube matching the filters."""
+    return loader.get_dynamics_cube().take(dynamics_positions(loader, region, year, species, ownership))
+
+
+@router.get("", response_model=DynamicsResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_dynamics(
     region: str | None = Query(None, description="Filter by region"),
     year: int | None = Query(None, description="Filter by year"),
     species: str | None = Query(None, description="Filter by species group (Softwood, Hardwood, Total)"),
+    ownership: str = Query(ALL_OWNERS, description=OWNERSHIP_DESCRIPTION),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
     loader: DataLoader = Depends(get_data_loader),
-) -> DynamicsResponse:
-    """Get forest dynamics data (growth, mortality, removals)."""
-    # Get all three datasets
-    mortality_df = loader.get_mortality_data()
-    growth_df = loader.get_growth_data()
-    removals_df = loader.get_removals_data()
-
-    # Parse each table
-    mortality_data = parse_dynamics_table(mortality_df, "mortality")
-    growth_data = parse_dynamics_table(growth_df, "growth")
-    removals_data = parse_dynamics_table(removals_df, "removals")
-
-    # Combine data by region, year, species
-    combined = {}
-    for item in mortality_data:
-        key = (item["region"], item.get("subregion"), item["species_group"], item["year"])
-        if key not in combined:
-            combined[key] = {
-                "region": item["region"],
-                "subregion": item.get("subregion"),
-                "species_group": item["species_group"],
-                "year": item["year"],
-                "growth": None,
-                "mortality": None,
-                "removals": None,
-            }
-        combined[key]["mortality"] = item.get("mortality")
-
-    for item in growth_data:
-        key = (item["region"], item.get("subregion"), item["species_group"], item["year"])
-        if key not in combined:
-            combined[key] = {
-                "region": item["region"],
-                "subregion": item.get("subregion"),
-                "species_group": item["species_group"],
-                "year": item["year"],
-                "growth": None,
-                "mortality": None,
-                "removals": None,
-            }
-        combined[key]["growth"] = item.get("growth")
-
-    for item in removals_data:
-        key = (item["region"], item.get("subregion"), item["species_group"], item["year"])
-        if key not in combined:
-            combined[key] = {
-                "region": item["region"],
-                "subregion": item.get("subregion"),
-                "species_group": item["species_group"],
-                "year": item["year"],
-                "growth": None,
-                "mortality": None,
-                "removals": None,
-            }
-        combined[key]["removals"] = item.get("removals")
-
-    # Convert to records
-    records = []
-    for data in combined.values():
-        # Calculate net change
-        growth = data.get("growth") or 0
-        mortality = data.get("mortality") or 0
-        removals = data.get("removals") or 0
-        net_change = growth - mortality - removals if growth else None
-
-        record = DynamicsRecord(
-            region=data["region"],
-            subregion=data.get("subregion"),
-            species_group=data["species_group"],
-            year=data["year"],
-            growth=data.get("growth"),
-            mortality=data.get("mortality"),
-            removals=data.get("removals"),
-            net_change=net_change,
-        )
-
-        # Apply filters
-        if region and record.region != region:
-            continue
-        if year and record.year != year:
-            continue
-        if species and record.species_group != species:
-            continue
+) -> Response:
+    """Get forest dynamics data (growth, mortality, removals).
+
+    ``years`` and ``total_records`` cover every matching record, not only the page.
+    """
+    cube = loader.get_dynamics_cube()
+    positions = dynamics_positions(loader, region, year, species, ownership)
+
+    return fmt.render(
+        DynamicsResponse,
+        data=page.records(loader, "dynamics_cube", cube, positions, DynamicsRecord),
+        years=np.unique(cube["year"].to_numpy()[positions]).tolist(),
+        total_records=len(positions),
+    )
 
-        records.append(record)
 
-    # Get unique years
-    years = sorted(set(r.year for r in records))
+@router.get("/stream", response_class=StreamingResponse, responses=STREAMED_RESPONSES)
+@offload
+def stream_dynamics(
+    region: str | None = Query(None, description="Filter by region"),
+    year: int | None = Query(None, description="Filter by year"),
+    species: str | None = Query(None, description="Filter by species group (Softwood, Hardwood, Total)"),
+    ownership: str = Query(ALL_OWNERS, description=OWNERSHIP_DESCRIPTION),
+    format: StreamFormat = Query("ndjson", description="ndjson (default) or csv"),
+    loader: DataLoader = Depends(get_data_loader),
+) -> StreamingResponse:
+    """Stream forest dynamics records as NDJSON or CSV, one per line.
 
-    return DynamicsResponse(
-        data=records,
-        years=years,
-        total_records=len(records),
-    )
+    Matching rows are taken from the cube a chunk at a time while the
+    response is sent, instead of copying the whole slice first.
+    """
+    cube = loader.get_dynamics_cube()
+    positions = dynamics_positions(loader, region, year, species, ownership)
+    size = settings.stream_chunk_records
+    chunks = (cube.take(positions[start:start + size]) for start in range(0, len(positions), size))
+    return stream_records(chunks, DynamicsRecord, format)
 
 
 @router.get("/summary")
-async def get_dynamics_summary(
+@offload
+def get_dynamics_summary(
     year: int = Query(2022, description="Year for summary"),
+    ownership: str = Query(ALL_OWNERS, description=OWNERSHIP_DESCRIPTION),
     loader: DataLoader = Depends(get_data_loader),
 ) -> DynamicsSummary:
-    """Get dynamics summary for a specific year."""
-    response = await get_dynamics(year=year, species="Total", loader=loader)
+    """Get national dynamics totals for a specific year."""
+    df = slice_dynamics(loader, NATION, year, "Total", ownership)
+    totals = df[METRICS].sum()
 
-    total_growth = sum(r.growth or 0 for r in response.data if r.subregion is None)
-    total_mortality = sum(r.mortality or 0 for r in response.data if r.subregion is None)
-    total_removals = sum(r.removals or 0 for r in response.data if r.subregion is None)
+    total_growth = float(totals["growth"])
+    total_mortality = float(totals["mortality"])
+    total_removals = float(totals["removals"])
     net_change = total_growth - total_mortality - total_removals
 
     drain = total_mortality + total_removals
@@ -171,41 +127,28 @@ async def get_dynamics_summary(
 
 
 @router.get("/by-region")
-async def get_dynamics_by_region(
+@offload
+def get_dynamics_by_region(
     year: int = Query(2022, description="Year for data"),
     species: str = Query("Total", description="Species group"),
+    ownership: str = Query(ALL_OWNERS, description=OWNERSHIP_DESCRIPTION),
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[RegionalDynamics]:
     """Get dynamics summary by region."""
-    response = await get_dynamics(year=year, species=species, loader=loader)
-
-    # Group by region (only top-level, where subregion is None)
-    regional_data = {}
-    for record in response.data:
-        if record.subregion is not None:
-            continue
-
-        region = record.region
-        if region not in regional_data:
-            regional_data[region] = {
-                "growth": 0,
-                "mortality": 0,
-                "removals": 0,
-            }
-
-        regional_data[region]["growth"] += record.growth or 0
-        regional_data[region]["mortality"] += record.mortality or 0
-        regional_data[region]["removals"] += record.removals or 0
-
-    results = []
-    for region, data in regional_data.items():
-        net_change = data["growth"] - data["mortality"] - data["removals"]
-        results.append(RegionalDynamics(
+    index = loader.get_table_index("dynamics_cube")
+    # Region totals are the rows without a subregion; the nation is not a region
+    positions = index.missing("subregion", dynamics_positions(loader, year=year, species=species, ownership=ownership))
+    df = index.df.take(positions)
+    df = df[df["region"] != NATION]
+    totals = df.groupby("region", sort=False, observed=True)[METRICS].sum()
+
+    return [
+        RegionalDynamics(
             region=region,
-            growth=data["growth"],
-            mortality=data["mortality"],
-            removals=data["removals"],
-            net_change=net_change,
-        ))
-
-    return results
+            growth=row.growth,
+            mortality=row.mortality,
+            removals=row.removals,
+            net_change=row.growth - row.mortality - row.removals,
+        )
+        for region, row in zip(totals.index, totals.itertuples())
+    ]
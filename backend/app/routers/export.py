@@ -0,0 +1,68 @@
+"""Bulk export API endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from ..executor import offload
+from ..services import DataLoader, get_data_loader
+from ..services.export import (
+    EXPORT_MEDIA_TYPES,
+    FILE_EXTENSIONS,
+    PARQUET_MEDIA_TYPE,
+    ExportFormat,
+    encode_table,
+    to_arrow,
+)
+
+router = APIRouter()
+
+
+def _sheet_name(table: str, loader: DataLoader) -> str:
+    """Resolve ``A-1a`` or ``Table A-1a`` to a worksheet of the data file."""
+    name = table if table.startswith("Table ") else f"Table {table}"
+    if name not in loader.sheet_names:
+        raise HTTPException(status_code=404, detail=f"Unknown table: {table}")
+    return name
+
+
+@router.get(
+    "/{table}",
+    response_class=Response,
+    responses={200: {
+        "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+        "description": "The table as an Arrow IPC stream or a Parquet file",
+    }},
+)
+@offload
+def export_table(
+    request: Request,
+    table: str,
+    format: ExportFormat | None = Query(
+        None, description="arrow (IPC stream) or parquet; defaults from the Accept header, else arrow",
+    ),
+    region: str | None = Query(None, description="Filter by region"),
+    subregion: str | None = Query(None, description="Filter by subregion"),
+    state: str | None = Query(None, description="Filter by state"),
+    loader: DataLoader = Depends(get_data_loader),
+) -> Response:
+    """Export a whole appendix table (e.g. ``A-1a``), summary rows included."""
+    name = _sheet_name(table, loader)
+    if format is None:
+        format = "parquet" if PARQUET_MEDIA_TYPE in request.headers.get("accept", "") else "arrow"
+
+    filters = {"region": region, "subregion": subregion, "state": state}
+    index = loader.get_sheet_index(name)
+    columns = {col.lower(): col for col in index.columns}
+    for key, value in filters.items():
+        if value and key not in columns:
+            raise HTTPException(status_code=400, detail=f"{name} has no {key} column")
+    df = index.select(**{columns[key]: value for key, value in filters.items() if value})
+
+    body = encode_table(to_arrow(df), format)
+    return Response(
+        memoryview(body),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}{FILE_EXTENSIONS[format]}"',
+            "Vary": "Accept",
+        },
+    )
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, Depends
 
+from ..executor import offload
 from ..models.common import RegionInfo, FilterOptions
 from ..services import DataLoader, get_data_loader
 
@@ -9,7 +10,8 @@ router = APIRouter()
 
 
 @router.get("/regions", response_model=list[RegionInfo])
-async def get_regions(
+@offload
+def get_regions(
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[RegionInfo]:
     """Get available regions with their subregions."""
@@ -18,7 +20,8 @@ async def get_regions(
 
 
 @router.get("/states")
-async def get_states(
+@offload
+def get_states(
     region: str | None = None,
     subregion: str | None = None,
     loader: DataLoader = Depends(get_data_loader),
@@ -1,70 +1,42 @@
 """Ownership API endpoints."""
 
-from fastapi import APIRouter, Depends, Query
-import pandas as pd
+from fastapi import APIRouter, Depends, Query, Response
 
+from ..executor import offload
 from ..models.ownership import OwnershipRecord, OwnershipResponse, OwnershipBreakdown
+from ..paging import Page, column_sum, page_params, row_count
+from ..serialization import ENCODED_RESPONSES, ResponseFormat, response_format
 from ..services import DataLoader, get_data_loader
 
 router = APIRouter()
 
 
-def to_float_or_none(value) -> float | None:
-    """Convert pandas value to float or None."""
-    if pd.isna(value):
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
-@router.get("", response_model=OwnershipResponse)
-async def get_ownership(
+@router.get("", response_model=OwnershipResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_ownership(
     region: str | None = Query(None, description="Filter by region"),
     subregion: str | None = Query(None, description="Filter by subregion"),
     state: str | None = Query(None, description="Filter by state"),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
     loader: DataLoader = Depends(get_data_loader),
-) -> OwnershipResponse:
-    """Get ownership data with optional filters."""
-    df = loader.get_ownership_data()
-
-    # Apply filters
-    if region:
-        df = df[df["region"] == region]
-    if subregion:
-        df = df[df["subregion"] == subregion]
-    if state:
-        df = df[df["state"] == state]
-
-    # Convert to records
-    records = []
-    for _, row in df.iterrows():
-        records.append(OwnershipRecord(
-            region=row["region"],
-            subregion=row["subregion"],
-            state=row["state"],
-            all_ownerships=to_float_or_none(row.get("all_ownerships")),
-            total_public=to_float_or_none(row.get("total_public")),
-            total_federal=to_float_or_none(row.get("total_federal")),
-            national_forest=to_float_or_none(row.get("national_forest")),
-            blm=to_float_or_none(row.get("blm")),
-            other_federal=to_float_or_none(row.get("other_federal")),
-            state_owned=to_float_or_none(row.get("state_owned")),
-            county_municipal=to_float_or_none(row.get("county_municipal")),
-            total_private=to_float_or_none(row.get("total_private")),
-            private_corporate=to_float_or_none(row.get("private_corporate")),
-            private_noncorporate=to_float_or_none(row.get("private_noncorporate")),
-        ))
+) -> Response:
+    """Get ownership data with optional filters.
 
-    # Calculate summaries
-    total_public = df["total_public"].sum()
-    total_private = df["total_private"].sum()
-    total_federal = df["total_federal"].sum()
+    Summaries and ``total_records`` cover every matching state, not only the page.
+    """
+    index = loader.get_table_index("Table A-2")
+    positions = index.lookup(region=region, subregion=subregion, state=state)
 
-    return OwnershipResponse(
-        data=records,
-        total_records=len(records),
+    # Calculate summaries
+    total_public = column_sum(index.df, "total_public", positions)
+    total_private = column_sum(index.df, "total_private", positions)
+    total_federal = column_sum(index.df, "total_federal", positions)
+
+    return fmt.render(
+        OwnershipResponse,
+        data=page.records(loader, "Table A-2", index.df, positions, OwnershipRecord),
+        total_records=row_count(index.df, positions),
         total_public=total_public,
         total_private=total_private,
         total_federal=total_federal,
@@ -72,15 +44,13 @@ async def get_ownership(
 
 
 @router.get("/breakdown", response_model=list[OwnershipBreakdown])
-async def get_ownership_breakdown(
+@offload
+def get_ownership_breakdown(
     region: str | None = Query(None, description="Filter by region"),
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[OwnershipBreakdown]:
     """Get ownership breakdown for visualization."""
-    df = loader.get_ownership_data()
-
-    if region:
-        df = df[df["region"] == region]
+    df = loader.get_table_index("Table A-2").select(region=region)
 
     # Calculate totals for each category
     categories = {
@@ -109,19 +79,17 @@ async def get_ownership_breakdown(
 
 
 @router.get("/by-region")
-async def get_ownership_by_region(
+@offload
+def get_ownership_by_region(
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[dict]:
     """Get ownership summary by region."""
-    df = loader.get_ownership_data()
+    rollup = loader.get_rollup("Table A-2", "region")
 
     results = []
-    for region in df["region"].unique():
-        region_df = df[df["region"] == region]
-        total = region_df["all_ownerships"].sum()
-        public = region_df["total_public"].sum()
-        private = region_df["total_private"].sum()
-
+    for region, total, public, private in zip(
+        rollup["region"], rollup["all_ownerships"], rollup["total_public"], rollup["total_private"],
+    ):
         results.append({
             "region": region,
             "total": total,
@@ -0,0 +1,88 @@
+"""Aggregate query API endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ..config import settings
+from ..executor import offload
+from ..models.query import QueryResponse
+from ..services import DataLoader, get_data_loader
+from ..services.query import (
+    DATASETS,
+    QueryError,
+    UnknownMemberError,
+    compile_query,
+    normalize_query,
+    table_measures,
+)
+
+router = APIRouter()
+
+
+def _split(value: str | None) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()] if value else []
+
+
+@router.get("/{table}", response_model=QueryResponse)
+@offload
+def run_query(
+    table: str,
+    group_by: str | None = Query(
+        None, description="Comma-separated keys: region, subregion, state, species, ownership, year",
+    ),
+    agg: str | None = Query(
+        None, description="Comma-separated func:measure with func sum, mean, min, max or share "
+        "(percent of the filtered total); defaults to the sum of every measure",
+    ),
+    region: list[str] | None = Query(None, description="Filter by region (repeat for several)"),
+    subregion: list[str] | None = Query(None, description="Filter by subregion"),
+    state: list[str] | None = Query(None, description="Filter by state"),
+    species: list[str] | None = Query(None, description="Filter by species group (dynamics, growing_stock)"),
+    ownership: list[str] | None = Query(None, description="Filter by ownership class (A-10, dynamics, growing_stock)"),
+    year: list[int] | None = Query(None, description="Filter by year"),
+    year_min: int | None = Query(None, description="First year to include"),
+    year_max: int | None = Query(None, description="Last year to include"),
+    loader: DataLoader = Depends(get_data_loader),
+) -> QueryResponse:
+    """Group and aggregate a table (A-1a, A-2, A-3, A-10, A-17, dynamics or growing_stock).
+
+    Totals stored as rows (regions, all owners, all species) are left out
+    unless filtered on, so aggregates never count a value twice. Filtering
+    on a value the table does not have (e.g. a total left out) is a 422.
+    """
+    name = table.removeprefix("Table ")
+    filters = {
+        "region": region, "subregion": subregion, "state": state,
+        "species": species, "ownership": ownership, "year": year,
+    }
+    try:
+        spec = normalize_query(name, filters, year_min, year_max, _split(group_by), _split(agg))
+    except KeyError:
+        raise HTTPException(
+            status_code=404, detail=f"Unknown table: {table}; tables: {', '.join(DATASETS)}",
+        )
+    except QueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    df = loader.get_listing(DATASETS[name].table)
+    try:
+        plan = compile_query(spec, tuple(df.columns), table_measures(df))
+        positions = plan.select(df)
+        if plan.cost(len(positions)) > settings.query_max_cost:
+            raise QueryError(
+                f"Query reduces {plan.cost(len(positions))} cells; at most {settings.query_max_cost} are allowed",
+            )
+        result = plan.execute(df, positions, settings.query_max_groups)
+    except UnknownMemberError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except QueryError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    records = result.astype(object).where(result.notna(), None).to_dict("records")
+    return QueryResponse(
+        table=name,
+        group_by=list(spec.group_by),
+        aggregates=plan.output_columns,
+        data=records,
+        total_records=len(records),
+        rows_scanned=len(positions),
+    )
@@ -0,0 +1,52 @@
+"""Table catalog API endpoints."""
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from ..executor import offload
+from ..models.tables import ColumnMetadata, TableCatalogResponse, TableMetadata, TableSummary
+from ..services import DataLoader, get_data_loader
+from ..services.catalog import INDEX_SHEET, table_id
+
+router = APIRouter()
+
+
+@router.get("", response_model=TableCatalogResponse)
+@offload
+def list_tables(loader: DataLoader = Depends(get_data_loader)) -> TableCatalogResponse:
+    """List every table with its title, and its size where known without parsing it."""
+    titles = loader.get_table_titles()
+    tables = []
+    for name in loader.sheet_names:
+        if name == INDEX_SHEET:
+            continue
+        shape = loader.get_table_shape(name)
+        tables.append(TableSummary(
+            id=table_id(name),
+            name=name,
+            title=titles.get(name),
+            rows=shape[0] if shape else None,
+            columns=shape[1] if shape else None,
+        ))
+    return TableCatalogResponse(data=tables, total_records=len(tables))
+
+
+@router.get("/{table}", response_model=TableMetadata)
+@offload
+def get_table_metadata(table: str, loader: DataLoader = Depends(get_data_loader)) -> TableMetadata:
+    """Get the columns, types and value ranges of a worksheet (e.g. ``A-1a``)."""
+    names = {table_id(name): name for name in loader.sheet_names}
+    name = names.get(table_id(table))
+    if name is None:
+        raise HTTPException(status_code=404, detail=f"Unknown table: {table}")
+
+    info = loader.get_table_info(name)
+    return TableMetadata(
+        id=table_id(name),
+        name=name,
+        title=loader.get_table_titles().get(name),
+        rows=info.rows,
+        memory_bytes=info.memory_bytes,
+        columns=[ColumnMetadata(**asdict(column)) for column in info.columns],
+    )
@@ -1,73 +1,44 @@
 """Timber volume API endpoints."""
 
-from fastapi import APIRouter, Depends, Query
-import pandas as pd
+from fastapi import APIRouter, Depends, Query, Response
 
+from ..executor import offload
 from ..models.timber import TimberVolumeRecord, TimberVolumeResponse, TimberBreakdown
+from ..paging import Page, column_sum, page_params, row_count
+from ..serialization import ENCODED_RESPONSES, ResponseFormat, response_format
 from ..services import DataLoader, get_data_loader
 
 router = APIRouter()
 
 
-def to_float_or_none(value) -> float | None:
-    """Convert pandas value to float or None."""
-    if pd.isna(value):
-        return None
-    try:
-        return float(value)
-    except (ValueError, TypeError):
-        return None
-
-
-@router.get("", response_model=TimberVolumeResponse)
-async def get_timber_volume(
+@router.get("", response_model=TimberVolumeResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_timber_volume(
     region: str | None = Query(None, description="Filter by region"),
     subregion: str | None = Query(None, description="Filter by subregion"),
     state: str | None = Query(None, description="Filter by state"),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
     loader: DataLoader = Depends(get_data_loader),
-) -> TimberVolumeResponse:
-    """Get timber volume data with optional filters."""
-    df = loader.get_timber_volume()
-
-    # Apply filters
-    if region:
-        df = df[df["region"] == region]
-    if subregion:
-        df = df[df["subregion"] == subregion]
-    if state:
-        df = df[df["state"] == state]
-
-    # Convert to records
-    records = []
-    for _, row in df.iterrows():
-        records.append(TimberVolumeRecord(
-            region=row["region"],
-            subregion=row["subregion"],
-            state=row["state"],
-            all_timber_total=to_float_or_none(row.get("all_timber_total")),
-            all_timber_softwoods=to_float_or_none(row.get("all_timber_softwoods")),
-            all_timber_hardwoods=to_float_or_none(row.get("all_timber_hardwoods")),
-            growing_stock_total=to_float_or_none(row.get("growing_stock_total")),
-            growing_stock_softwoods=to_float_or_none(row.get("growing_stock_softwoods")),
-            growing_stock_hardwoods=to_float_or_none(row.get("growing_stock_hardwoods")),
-            cull_total=to_float_or_none(row.get("cull_total")),
-            cull_softwoods=to_float_or_none(row.get("cull_softwoods")),
-            cull_hardwoods=to_float_or_none(row.get("cull_hardwoods")),
-            sound_dead_total=to_float_or_none(row.get("sound_dead_total")),
-            sound_dead_softwoods=to_float_or_none(row.get("sound_dead_softwoods")),
-            sound_dead_hardwoods=to_float_or_none(row.get("sound_dead_hardwoods")),
-        ))
+) -> Response:
+    """Get timber volume data with optional filters.
+
+    Summaries and ``total_records`` cover every matching state, not only the page.
+    """
+    index = loader.get_table_index("Table A-17")
+    positions = index.lookup(region=region, subregion=subregion, state=state)
 
     # Calculate summaries
-    total_volume = df["all_timber_total"].sum()
-    softwood_volume = df["all_timber_softwoods"].sum()
-    hardwood_volume = df["all_timber_hardwoods"].sum()
+    total_volume = column_sum(index.df, "all_timber_total", positions)
+    softwood_volume = column_sum(index.df, "all_timber_softwoods", positions)
+    hardwood_volume = column_sum(index.df, "all_timber_hardwoods", positions)
     softwood_percent = (softwood_volume / total_volume * 100) if total_volume > 0 else 0
     hardwood_percent = (hardwood_volume / total_volume * 100) if total_volume > 0 else 0
 
-    return TimberVolumeResponse(
-        data=records,
-        total_records=len(records),
+    return fmt.render(
+        TimberVolumeResponse,
+        data=page.records(loader, "Table A-17", index.df, positions, TimberVolumeRecord),
+        total_records=row_count(index.df, positions),
         total_volume=total_volume,
         softwood_volume=softwood_volume,
         hardwood_volume=hardwood_volume,
@@ -77,15 +48,13 @@ async def get_timber_volume(
 
 
 @router.get("/breakdown", response_model=list[TimberBreakdown])
-async def get_timber_breakdown(
+@offload
+def get_timber_breakdown(
     region: str | None = Query(None, description="Filter by region"),
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[TimberBreakdown]:
     """Get timber volume breakdown for visualization."""
-    df = loader.get_timber_volume()
-
-    if region:
-        df = df[df["region"] == region]
+    df = loader.get_table_index("Table A-17").select(region=region)
 
     # Calculate totals
     softwood = df["all_timber_softwoods"].sum()
@@ -107,19 +76,17 @@ async def get_timber_breakdown(
 
 
 @router.get("/by-region")
-async def get_timber_by_region(
+@offload
+def get_timber_by_region(
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[dict]:
     """Get timber volume summary by region."""
-    df = loader.get_timber_volume()
+    rollup = loader.get_rollup("Table A-17", "region")
 
     results = []
-    for region in df["region"].unique():
-        region_df = df[df["region"] == region]
-        total = region_df["all_timber_total"].sum()
-        softwood = region_df["all_timber_softwoods"].sum()
-        hardwood = region_df["all_timber_hardwoods"].sum()
-
+    for region, total, softwood, hardwood in zip(
+        rollup["region"], rollup["all_timber_total"], rollup["all_timber_softwoods"], rollup["all_timber_hardwoods"],
+    ):
         results.append({
             "region": region,
             "total": total,
@@ -133,15 +100,13 @@ async def get_timber_by_region(
 
 
 @router.get("/by-state")
-async def get_timber_by_state(
+@offload
+def get_timber_by_state(
     region: str | None = Query(None, description="Filter by region"),
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[dict]:
     """Get timber volume by state."""
-    df = loader.get_timber_volume()
-
-    if region:
-        df = df[df["region"] == region]
+    df = loader.get_table_index("Table A-17").select(region=region)
 
     results = []
     for _, row in df.iterrows():
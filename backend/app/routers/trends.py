@@ -1,77 +1,102 @@
 """Trends API endpoints."""
 
-from fastapi import APIRouter, Depends, Query
-
-from ..models.trends import ForestAreaTrendRecord, ForestAreaTrendResponse, TimeSeriesPoint, RegionalTrend
+import numpy as np
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+
+from ..config import settings
+from ..executor import offload
+from ..models.ownership import TimberlandOwnershipRecord, TimberlandOwnershipResponse
+from ..models.trends import (
+    ForestAreaTrendRecord,
+    ForestAreaTrendResponse,
+    GrowingStockTrendRecord,
+    GrowingStockTrendResponse,
+    TimeSeriesPoint,
+    RegionalTrend,
+)
+from ..paging import Page, page_params, row_count
+from ..serialization import (
+    ENCODED_RESPONSES,
+    STREAMED_RESPONSES,
+    ResponseFormat,
+    StreamFormat,
+    iter_chunks,
+    response_format,
+    stream_records,
+)
 from ..services import DataLoader, get_data_loader
+from ..services.dynamics import ALL_OWNERS, NATION
+from ..services.indexes import TableIndex
+from ..services.trends import forest_area_records, year_columns
 
 router = APIRouter()
 
+GROWING_STOCK_OWNERSHIP_DESCRIPTION = (
+    "Ownership group (All owners, National forest, Other public, Total private, ...)"
+)
+TIMBERLAND_OWNERSHIP_DESCRIPTION = (
+    "Ownership class (All owners, Total public, National forest, Total private, ...; default: all)"
+)
+
 
-@router.get("/forest-area", response_model=ForestAreaTrendResponse)
-async def get_forest_area_trends(
+@router.get("/forest-area", response_model=ForestAreaTrendResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_forest_area_trends(
     region: str | None = Query(None, description="Filter by region"),
     subregion: str | None = Query(None, description="Filter by subregion"),
     state: str | None = Query(None, description="Filter by state"),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
     loader: DataLoader = Depends(get_data_loader),
-) -> ForestAreaTrendResponse:
-    """Get forest area trends from 1630 to 2022."""
-    df = loader.get_forest_area_trends()
-
-    # Apply filters
-    if region:
-        df = df[df["region"] == region]
-    if subregion:
-        df = df[df["subregion"] == subregion]
-    if state:
-        df = df[df["state"] == state]
-
-    # Get year columns (they should be strings like "2022", "2017", etc.)
-    year_columns = [col for col in df.columns if col not in ["region", "subregion", "state"]]
-
-    # Convert to records
-    records = []
-    for _, row in df.iterrows():
-        for year_col in year_columns:
-            try:
-                year = int(float(year_col))
-                area = row.get(year_col)
-                if area is not None and not (isinstance(area, float) and area != area):  # check for NaN
-                    records.append(ForestAreaTrendRecord(
-                        region=row["region"],
-                        subregion=row["subregion"],
-                        state=row["state"],
-                        year=year,
-                        area=float(area) if area else None,
-                    ))
-            except (ValueError, TypeError):
-                continue
+) -> Response:
+    """Get forest area trends from 1630 to 2022.
+
+    ``years`` and ``total_records`` cover every matching record, not only the page.
+    """
+    index = loader.get_table_index("forest_area_records")
+    positions = index.lookup(region=region, subregion=subregion, state=state)
+    years = index.df["year"].to_numpy()
+
+    return fmt.render(
+        ForestAreaTrendResponse,
+        data=page.records(loader, "forest_area_records", index.df, positions, ForestAreaTrendRecord),
+        years=np.unique(years if positions is None else years[positions]).tolist(),
+        total_records=row_count(index.df, positions),
+    )
 
-    # Get unique years
-    years = sorted(set(r.year for r in records))
 
-    return ForestAreaTrendResponse(
-        data=records,
-        years=years,
-        total_records=len(records),
-    )
+@router.get("/forest-area/stream", response_class=StreamingResponse, responses=STREAMED_RESPONSES)
+@offload
+def stream_forest_area_trends(
+    region: str | None = Query(None, description="Filter by region"),
+    subregion: str | None = Query(None, description="Filter by subregion"),
+    state: str | None = Query(None, description="Filter by state"),
+    format: StreamFormat = Query("ndjson", description="ndjson (default) or csv"),
+    loader: DataLoader = Depends(get_data_loader),
+) -> StreamingResponse:
+    """Stream forest area trend records as NDJSON or CSV, one per line.
+
+    States are unpivoted a chunk at a time while the response is sent.
+    """
+    df = loader.get_table_index("Table A-3").select(region=region, subregion=subregion, state=state)
+    states_per_chunk = max(1, settings.stream_chunk_records // max(1, len(year_columns(df))))
+    chunks = (forest_area_records(part) for part in iter_chunks(df, states_per_chunk))
+    return stream_records(chunks, ForestAreaTrendRecord, format)
 
 
 @router.get("/forest-area/national")
-async def get_national_forest_area_trend(
+@offload
+def get_national_forest_area_trend(
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[TimeSeriesPoint]:
     """Get national total forest area trend."""
-    df = loader.get_forest_area_trends()
-
-    # Get year columns
-    year_columns = [col for col in df.columns if col not in ["region", "subregion", "state"]]
+    rollup = loader.get_rollup("Table A-3", "nation")
 
     points = []
-    for year_col in year_columns:
+    for year_col, total in rollup.iloc[0].items():
         try:
             year = int(float(year_col))
-            total = df[year_col].sum()
             points.append(TimeSeriesPoint(year=year, value=total))
         except (ValueError, TypeError):
             continue
@@ -82,23 +107,24 @@ async def get_national_forest_area_trend(
 
 
 @router.get("/forest-area/by-region")
-async def get_forest_area_by_region(
+@offload
+def get_forest_area_by_region(
     loader: DataLoader = Depends(get_data_loader),
 ) -> list[RegionalTrend]:
     """Get forest area trends by region."""
-    df = loader.get_forest_area_trends()
+    rollup = loader.get_rollup("Table A-3", "region")
 
     # Get year columns
-    year_columns = [col for col in df.columns if col not in ["region", "subregion", "state"]]
+    year_columns = [col for col in rollup.columns if col != "region"]
 
     regional_trends = []
-    for region in df["region"].unique():
-        region_df = df[df["region"] == region]
+    for _, row in rollup.iterrows():
+        region = row["region"]
         points = []
         for year_col in year_columns:
             try:
                 year = int(float(year_col))
-                total = region_df[year_col].sum()
+                total = row[year_col]
                 points.append(TimeSeriesPoint(year=year, value=total))
             except (ValueError, TypeError):
                 continue
@@ -109,18 +135,73 @@ async def get_forest_area_by_region(
     return regional_trends
 
 
-@router.get("/growing-stock")
-async def get_growing_stock_trends(
+def _area_positions(
+    index: TableIndex, region: str | None, subregion: str | None, state: str | None, **filters: str | None,
+) -> np.ndarray:
+    """Rows of one area of a cube: a state, else the totals of a subregion, region or the nation."""
+    if not (region or subregion or state):
+        region = NATION
+    positions = index.lookup(region=region, subregion=subregion, state=state, **filters)
+    if positions is None:
+        positions = np.arange(len(index.df))
+    if not state:
+        positions = index.missing("state", positions)
+        if not subregion:
+            positions = index.missing("subregion", positions)
+    # Oldest year first; rows of a year keep the table order
+    return positions[np.argsort(index.df["year"].to_numpy()[positions], kind="stable")]
+
+
+@router.get("/growing-stock", response_model=GrowingStockTrendResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_growing_stock_trends(
     region: str | None = Query(None, description="Filter by region"),
+    subregion: str | None = Query(None, description="Filter by subregion"),
+    state: str | None = Query(None, description="Filter by state"),
+    ownership: str = Query(ALL_OWNERS, description=GROWING_STOCK_OWNERSHIP_DESCRIPTION),
+    species: str | None = Query(None, description="Softwood, Hardwood or Total (default: all three)"),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
     loader: DataLoader = Depends(get_data_loader),
-) -> list[dict]:
-    """Get growing stock volume trends."""
-    # This would use Table A-20, which has a complex structure
-    # For now, return sample data structure
-    years = [1953, 1963, 1977, 1987, 1997, 2007, 2012, 2017, 2022]
-
-    # Return placeholder data - would need to parse A-20 properly
-    return [
-        {"year": year, "softwood": None, "hardwood": None, "total": None}
-        for year in years
-    ]
+) -> Response:
+    """Get growing stock volume trends, 1953-2022 (Tables A-18 to A-20).
+
+    Volumes are for the most specific area given (state, subregion or
+    region), or for the nation.
+    """
+    index = loader.get_table_index("growing_stock_cube")
+    positions = _area_positions(index, region, subregion, state, ownership=ownership, species_group=species)
+
+    return fmt.render(
+        GrowingStockTrendResponse,
+        data=page.records(loader, "growing_stock_cube", index.df, positions, GrowingStockTrendRecord),
+        years=np.unique(index.df["year"].to_numpy()[positions]).tolist(),
+        total_records=len(positions),
+    )
+
+
+@router.get("/timberland-ownership", response_model=TimberlandOwnershipResponse, responses=ENCODED_RESPONSES)
+@offload
+def get_timberland_ownership_trends(
+    region: str | None = Query(None, description="Filter by region"),
+    subregion: str | None = Query(None, description="Filter by subregion"),
+    state: str | None = Query(None, description="Filter by state"),
+    ownership: str | None = Query(None, description=TIMBERLAND_OWNERSHIP_DESCRIPTION),
+    page: Page = Depends(page_params),
+    fmt: ResponseFormat = Depends(response_format),
+    loader: DataLoader = Depends(get_data_loader),
+) -> Response:
+    """Get timberland area trends by ownership class, 1953-2022 (Table A-10).
+
+    Areas are for the most specific area given (state, subregion or
+    region), or for the nation.
+    """
+    index = loader.get_table_index("timberland_cube")
+    positions = _area_positions(index, region, subregion, state, ownership=ownership)
+
+    return fmt.render(
+        TimberlandOwnershipResponse,
+        data=page.records(loader, "timberland_cube", index.df, positions, TimberlandOwnershipRecord),
+        years=np.unique(index.df["year"].to_numpy()[positions]).tolist(),
+        total_records=len(positions),
+    )
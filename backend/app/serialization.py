@@ -0,0 +1,308 @@
+"""Encoding of DataFrame slices for API responses.
+
+Building one Pydantic model per row and validating the response again is by
+far the slowest part of the list endpoints. ``encode_records`` instead turns
+each column into JSON text in one pass (strings are encoded once per
+distinct value) and lays the rows out with NumPy. ``model_response`` wraps
+the records in the response model's envelope. The output is byte-for-byte
+what FastAPI renders for the equivalent models, and routes keep their
+``response_model`` for the OpenAPI schema.
+
+List endpoints can also answer in a columnar shape (``?shape=columnar``:
+``{"row_count": n, "columns": {name: [...]}}`` in place of the records) and
+as MessagePack (``Accept: application/msgpack``); see ``ResponseFormat``.
+Long-format data can be streamed as NDJSON or CSV with ``stream_records``.
+"""
+
+import json
+import types
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Literal, Union, get_args, get_origin
+
+import msgpack
+import numpy as np
+import pandas as pd
+from fastapi import Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from .media_types import CSV_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, NDJSON_MEDIA_TYPE, negotiate_media_type
+
+Shape = Literal["records", "columnar"]
+StreamFormat = Literal["ndjson", "csv"]
+
+# Same string escaping as JSONResponse (ensure_ascii=False)
+_encode_str = json.encoder.encode_basestring
+
+
+def to_float_or_none(value) -> float | None:
+    """Convert pandas value to float or None."""
+    if pd.isna(value):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _base_type(annotation: Any) -> Any:
+    """The type of a field annotation without ``None``, e.g. float for ``float | None``."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _json_column(values: pd.Series, kind: Any) -> np.ndarray:
+    """Encode a column as an object array of JSON texts, with missing values as null."""
+    if kind is float:
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        encoded = np.array(list(map(float.__repr__, numbers.tolist())), dtype=object)
+        encoded[~np.isfinite(numbers)] = "null"
+        return encoded
+
+    if kind is int:
+        missing = values.isna().to_numpy()
+        numbers = values.to_numpy(dtype=np.float64, na_value=0) if missing.any() else values.to_numpy()
+        encoded = np.array(list(map(repr, numbers.astype(np.int64).tolist())), dtype=object)
+        encoded[missing] = "null"
+        return encoded
+
+    # Strings and anything else: encode each distinct value once, then take
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    if kind is str:
+        texts = [_encode_str(str(value)) for value in uniques]
+    else:
+        texts = [_dumps(_to_python(value)) for value in uniques]
+    # Code -1 (missing) picks the trailing null
+    return np.array(texts + ["null"], dtype=object)[codes]
+
+
+def _python_column(values: pd.Series, kind: Any) -> list:
+    """Convert a column to a list of Python values, with missing values as None."""
+    if kind is float:
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        converted = numbers.astype(object)
+        converted[~np.isfinite(numbers)] = None
+        return converted.tolist()
+
+    if kind is int:
+        missing = values.isna().to_numpy()
+        numbers = values.to_numpy(dtype=np.float64, na_value=0) if missing.any() else values.to_numpy()
+        converted = numbers.astype(np.int64).astype(object)
+        converted[missing] = None
+        return converted.tolist()
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    convert = str if kind is str else _to_python
+    return np.array([convert(value) for value in uniques] + [None], dtype=object)[codes].tolist()
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _dumps(value: Any) -> str:
+    """Encode a value the way JSONResponse renders it."""
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+def _record_grid(df: pd.DataFrame, fields: dict[str, Any]) -> np.ndarray:
+    """Lay out the rows of a frame as JSON object texts, without the closing braces.
+
+    One row is '{"a":' 1 ',"b":' 2 '}', so the grid holds a key and a value
+    column per field plus a last column for the closing brace.
+    """
+    grid = np.empty((len(df), 2 * len(fields) + 1), dtype=object)
+    for i, (name, info) in enumerate(fields.items()):
+        grid[:, 2 * i] = ("{" if i == 0 else ",") + _encode_str(name) + ":"
+        if name in df.columns:
+            grid[:, 2 * i + 1] = _json_column(df[name], _base_type(info.annotation))
+        else:
+            grid[:, 2 * i + 1] = "null"
+    return grid
+
+
+def _model_fields(model: type[BaseModel], names: tuple[str, ...] | None = None) -> dict[str, Any]:
+    """Fields of a model, or only the named ones (still in model order)."""
+    if names is None:
+        return model.model_fields
+    return {name: info for name, info in model.model_fields.items() if name in names}
+
+
+def encode_records(df: pd.DataFrame, model: type[BaseModel], names: tuple[str, ...] | None = None) -> bytes:
+    """Encode the rows of a frame as a JSON array of ``model`` objects.
+
+    Fields are taken from the columns of the same name, in the model's field
+    order; fields without a column are null. ``names`` limits the fields.
+    """
+    fields = _model_fields(model, names)
+    n_rows = len(df)
+    if not n_rows or not fields:
+        return b"[" + b",".join([b"{}"] * n_rows) + b"]"
+
+    grid = _record_grid(df, fields)
+    grid[:, -1] = "},"
+    grid[-1, -1] = "}"
+    return ("[" + "".join(grid.ravel().tolist()) + "]").encode()
+
+
+def encode_ndjson(df: pd.DataFrame, model: type[BaseModel]) -> bytes:
+    """Encode the rows of a frame as newline-delimited JSON ``model`` objects."""
+    fields = model.model_fields
+    if not len(df) or not fields:
+        return b"{}\n" * len(df)
+
+    grid = _record_grid(df, fields)
+    grid[:, -1] = "}\n"
+    return "".join(grid.ravel().tolist()).encode()
+
+
+def encode_csv(df: pd.DataFrame, model: type[BaseModel], header: bool = True) -> bytes:
+    """Encode the rows of a frame as CSV with a column per ``model`` field.
+
+    Missing values and fields without a column are empty.
+    """
+    columns = {name: df[name] if name in df.columns else None for name in model.model_fields}
+    frame = pd.DataFrame(columns, index=df.index)
+    return frame.to_csv(index=False, header=header, lineterminator="\n").encode()
+
+
+def encode_columns(df: pd.DataFrame, model: type[BaseModel], names: tuple[str, ...] | None = None) -> bytes:
+    """Encode a frame as JSON column arrays of ``model``'s fields plus the row count."""
+    columns = []
+    for name, info in _model_fields(model, names).items():
+        if name in df.columns:
+            values = ",".join(_json_column(df[name], _base_type(info.annotation)).tolist())
+        else:
+            values = ",".join(["null"] * len(df))
+        columns.append(_encode_str(name) + ":[" + values + "]")
+    return ('{"row_count":' + str(len(df)) + ',"columns":{' + ",".join(columns) + "}}").encode()
+
+
+def _python_records(
+    df: pd.DataFrame, model: type[BaseModel], shape: Shape, names: tuple[str, ...] | None = None,
+) -> list | dict:
+    """Rows of a frame as Python objects of the given shape, for MessagePack."""
+    columns = {
+        name: _python_column(df[name], _base_type(info.annotation)) if name in df.columns else [None] * len(df)
+        for name, info in _model_fields(model, names).items()
+    }
+    if shape == "columnar":
+        return {"row_count": len(df), "columns": columns}
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+@dataclass(frozen=True)
+class Records:
+    """Rows of a frame to be encoded as a list of ``model`` objects.
+
+    ``fields`` limits the encoded fields (all of the model's if None).
+    """
+
+    df: pd.DataFrame
+    model: type[BaseModel]
+    fields: tuple[str, ...] | None = None
+
+
+@lru_cache(maxsize=None)
+def _adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _field_values(model: type[BaseModel], fields: dict[str, Any]):
+    """Yield each field of a response model with its value in JSON-compatible form.
+
+    ``Records`` and ``bytes`` values are yielded as is; other values are
+    validated against their field's type, as the response model would.
+    """
+    for name, info in model.model_fields.items():
+        value = fields[name] if name in fields else info.get_default(call_default_factory=True)
+        if not isinstance(value, (Records, bytes)):
+            adapter = _adapter(info.annotation)
+            value = adapter.dump_python(adapter.validate_python(value), mode="json")
+        yield name, value
+
+
+def model_response(model: type[BaseModel], **fields: Any) -> Response:
+    """Render a response model as JSON, with records in the default shape.
+
+    ``bytes`` values (e.g. from ``encode_records``) are inserted as is.
+    """
+    return ResponseFormat().render(model, **fields)
+
+
+@dataclass(frozen=True)
+class ResponseFormat:
+    """Shape and media type requested for a list response."""
+
+    shape: Shape = "records"
+    media_type: str = JSON_MEDIA_TYPE
+
+    def render(self, model: type[BaseModel], **fields: Any) -> Response:
+        """Render a response model whose list fields are given as ``Records``."""
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            content = {
+                name: _python_records(value.df, value.model, self.shape, value.fields)
+                if isinstance(value, Records) else value
+                for name, value in _field_values(model, fields)
+            }
+            body = msgpack.packb(content)
+        else:
+            encode = encode_columns if self.shape == "columnar" else encode_records
+            parts = []
+            for name, value in _field_values(model, fields):
+                if isinstance(value, Records):
+                    value = encode(value.df, value.model, value.fields)
+                elif not isinstance(value, bytes):
+                    value = _dumps(value).encode()
+                parts.append(_encode_str(name).encode() + b":" + value)
+            body = b"{" + b",".join(parts) + b"}"
+        return Response(body, media_type=self.media_type, headers={"Vary": "Accept"})
+
+
+def iter_chunks(df: pd.DataFrame, rows: int) -> Iterator[pd.DataFrame]:
+    """Yield consecutive slices of at most ``rows`` rows of a frame."""
+    for start in range(0, len(df), rows):
+        yield df.iloc[start:start + rows]
+
+
+def stream_records(chunks: Iterable[pd.DataFrame], model: type[BaseModel], fmt: StreamFormat) -> StreamingResponse:
+    """Stream frames of records as NDJSON or CSV ``model`` rows.
+
+    ``chunks`` is consumed lazily, one frame per body chunk, so only one
+    chunk of records is built and encoded at a time. CSV starts with the
+    header line, which goes out before the first chunk is built.
+    """
+    def body() -> Iterator[bytes]:
+        if fmt == "csv":
+            yield (",".join(model.model_fields) + "\n").encode()
+        for chunk in chunks:
+            if len(chunk):
+                yield encode_csv(chunk, model, header=False) if fmt == "csv" else encode_ndjson(chunk, model)
+
+    media_type = CSV_MEDIA_TYPE if fmt == "csv" else NDJSON_MEDIA_TYPE
+    return StreamingResponse(body(), media_type=media_type)
+
+
+def response_format(
+    request: Request,
+    shape: Shape = Query("records", description="records (default) or columnar (arrays per field)"),
+) -> ResponseFormat:
+    """Dependency resolving the ``shape`` parameter and the Accept header."""
+    return ResponseFormat(shape, negotiate_media_type(request.headers.get("accept")))
+
+
+# Extra OpenAPI response content of endpoints rendered with ResponseFormat
+ENCODED_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {MSGPACK_MEDIA_TYPE: {}}, "description": "Records, or columns with ?shape=columnar"},
+}
+
+# OpenAPI response content of endpoints rendered with stream_records
+STREAMED_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {NDJSON_MEDIA_TYPE: {}, CSV_MEDIA_TYPE: {}}, "description": "One record per line"},
+}
@@ -1,3 +1,28 @@
-from .data_loader import DataLoader, get_data_loader
+"""Data services.
 
-__all__ = ["DataLoader", "get_data_loader"]
+The names below are imported on first use (PEP 562), so that importing a
+light submodule such as ``vintages`` does not load pandas.
+"""
+
+from importlib import import_module
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "DataLoader": ".data_loader",
+    "VintageRegistry": ".vintages",
+    "get_data_loader": ".vintages",
+    "get_vintage_registry": ".vintages",
+    "pin_data_loader": ".vintages",
+    "set_data_loader": ".vintages",
+    "DataReloader": ".reloader",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
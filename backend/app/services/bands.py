@@ -0,0 +1,68 @@
+"""Unpivoting of the appendix's banded column headers.
+
+Many appendix tables spread one measure over column bands, e.g. an
+ownership band per owner group with one column per year ("All owners:
+2022", "All owners: 2017", ..., "National forest: 2022", ...), or one column
+per ownership class with the years as rows. These helpers turn such tables
+into long-format frames in a single reshape of the value block.
+"""
+
+import re
+from collections.abc import Hashable
+
+import numpy as np
+import pandas as pd
+
+# Banded headers are "<band>: <year>", e.g. "All owners: 2022"
+BAND_HEADER = re.compile(r"^(?P<band>.+):\s*(?P<year>\d{4})$")
+
+
+def band_columns(df: pd.DataFrame) -> dict[Hashable, tuple[str, int]]:
+    """Map the "<band>: <year>" columns of a table to their band and year."""
+    columns = {}
+    for col in df.columns:
+        match = BAND_HEADER.match(str(col))
+        if match:
+            columns[col] = (match["band"], int(match["year"]))
+    return columns
+
+
+def _labels(values: tuple) -> np.ndarray:
+    labels = np.array(values)
+    # Text labels stay Python strings, as in the dimension columns
+    return labels.astype(object) if labels.dtype.kind == "U" else labels
+
+
+def melt_columns(
+    df: pd.DataFrame,
+    id_columns: list[str],
+    value_columns: dict[Hashable, tuple],
+    names: list[str],
+    value_name: str,
+) -> pd.DataFrame:
+    """Unpivot value columns into one row per cell, missing values included.
+
+    ``value_columns`` maps each column to its labels, which fill the
+    ``names`` columns. Each row repeats once per value column, in column
+    order, with its ``id_columns``.
+    """
+    n_rows, n_values = len(df), len(value_columns)
+    values = df[list(value_columns)].to_numpy(dtype=np.float64)
+    labels = list(zip(*value_columns.values())) if value_columns else [()] * len(names)
+
+    long = {col: np.repeat(df[col].to_numpy(), n_values) for col in id_columns}
+    for name, column_labels in zip(names, labels):
+        long[name] = np.tile(_labels(column_labels), n_rows)
+    long[value_name] = values.reshape(-1)
+    return pd.DataFrame(long)
+
+
+def melt_bands(df: pd.DataFrame, id_columns: list[str], band_name: str, value_name: str) -> pd.DataFrame:
+    """Unpivot the "<band>: <year>" columns of a table into band, year and value columns."""
+    return melt_columns(df, id_columns, band_columns(df), [band_name, "year"], value_name)
+
+
+def as_categories(df: pd.DataFrame, columns: list[str]) -> None:
+    """Store dimension columns as categoricals ordered by first appearance."""
+    for col in columns:
+        df[col] = pd.Categorical(df[col], categories=pd.unique(df[col].dropna()))
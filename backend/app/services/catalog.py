@@ -0,0 +1,72 @@
+"""Catalog metadata of the appendix tables."""
+
+from dataclasses import dataclass
+
+import pandas as pd
+
+# Worksheet listing the number and title of every table
+INDEX_SHEET = "Appendix Tables"
+
+
+@dataclass(frozen=True)
+class ColumnInfo:
+    """Type, fill and value range of one column."""
+
+    name: str
+    dtype: str
+    kind: str
+    non_null: int
+    distinct: int | None = None
+    min: float | None = None
+    max: float | None = None
+
+
+@dataclass(frozen=True)
+class TableInfo:
+    """Size and column metadata of a loaded table."""
+
+    rows: int
+    memory_bytes: int
+    columns: tuple[ColumnInfo, ...]
+
+
+def _number(value: object) -> float | None:
+    return None if pd.isna(value) else float(value)
+
+
+def describe_table(df: pd.DataFrame) -> TableInfo:
+    """Compute the metadata of a table: one reduction per statistic over all columns.
+
+    Numeric columns are measures with a min and max; the others are
+    dimensions with a count of distinct values.
+    """
+    numeric = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
+    dimensions = [col for col in df.columns if col not in set(numeric)]
+    non_null = df.count()
+    lows, highs = df[numeric].min(), df[numeric].max()
+    distinct = df[dimensions].nunique()
+
+    columns = []
+    for col in df.columns:
+        if col in lows.index:
+            extra = {"kind": "measure", "min": _number(lows[col]), "max": _number(highs[col])}
+        else:
+            extra = {"kind": "dimension", "distinct": int(distinct[col])}
+        columns.append(ColumnInfo(name=str(col), dtype=str(df[col].dtype), non_null=int(non_null[col]), **extra))
+    return TableInfo(
+        rows=len(df),
+        memory_bytes=int(df.memory_usage(deep=True).sum()),
+        columns=tuple(columns),
+    )
+
+
+def table_titles(index: pd.DataFrame) -> dict[str, str]:
+    """Map table names to titles, from the index sheet read with its first entry as header."""
+    names = [index.columns[0], *index.iloc[:, 0]]
+    titles = [index.columns[1], *index.iloc[:, 1]]
+    return {str(name): str(title) for name, title in zip(names, titles) if pd.notna(name) and pd.notna(title)}
+
+
+def table_id(table_name: str) -> str:
+    """Short id of a table, e.g. ``A-1a`` for "Table A-1a"."""
+    return table_name.removeprefix("Table ")
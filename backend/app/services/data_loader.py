@@ -1,170 +1,332 @@
 """Data loading service with caching for Excel data."""
 
-from functools import lru_cache
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, TypeVar
 
+import numpy as np
 import pandas as pd
 from rich import print
 
 from ..config import settings
+from .catalog import INDEX_SHEET, TableInfo, describe_table, table_titles
+from .dynamics import build_dynamics_cube
+from .growing_stock import SPECIES_TABLES, build_growing_stock_cube
+from .indexes import LOOKUP_COLUMNS, TableIndex, geography_columns
+from .readers import SheetReader, get_reader
+from .rollups import RollupLevel, build_rollup
+from .schema import NA_MARKERS, apply_schema, get_schema
+from .snapshot import Snapshot, file_checksum, publish_snapshot
+from .sorting import sort_order
+from .timberland import build_timberland_cube
+from .trends import forest_area_records
+
+T = TypeVar("T")
 
 
 class DataLoader:
-    """Loads and caches data from the U.S. Forest Resources Excel file."""
+    """Loads and caches data from the U.S. Forest Resources Excel file.
+
+    A loader is one immutable version of the dataset: picking up a changed
+    data file means building a new loader and swapping it in.
+
+    Loaders are thread-safe. Concurrent requests for the same table share a
+    single load: the first caller parses it and the others wait for its
+    result (or its exception; a failed load is retried by the next caller).
 
-    def __init__(self, data_file: Path | None = None):
+    Any worksheet loads lazily on first use. Cached frames, indexes and
+    orders are evicted least recently used first once they take more than
+    ``memory_budget`` bytes (0 never evicts); an evicted entry is loaded
+    again on its next use. The catalog metadata of each table is kept.
+    """
+
+    def __init__(
+        self, data_file: Path | None = None, use_snapshot: bool = True, memory_budget: int | None = None,
+    ):
         self.data_file = data_file or settings.data_file
-        self._excel_file: pd.ExcelFile | None = None
-        self._cache: dict[str, pd.DataFrame] = {}
+        self.checksum = file_checksum(self.data_file)
+        self.use_snapshot = use_snapshot
+        self._reader: SheetReader | None = None
+        self._snapshot: Snapshot | None = None
+        self._snapshot_checked = False
+        self._cache: OrderedDict[str, pd.DataFrame | TableIndex | np.ndarray] = OrderedDict()
+        # Objects kept alive by each entry, and the bytes and entry count of each object
+        self._held: dict[str, tuple[int, ...]] = {}
+        self._objects: dict[int, list] = {}
+        self._table_info: dict[str, TableInfo] = {}
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._open_lock = threading.Lock()
+        self.nbytes = 0
+        self.loads = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.evictions = 0
+        self.memory_budget = settings.table_cache_bytes if memory_budget is None else memory_budget
+        # Pre-encoded /api/bootstrap response of this dataset version
+        self.bootstrap: bytes | None = None
+        # Called with the loader after it caches an entry (set by the VintageRegistry)
+        self.on_store: Callable[[DataLoader], None] | None = None
 
     @property
-    def excel_file(self) -> pd.ExcelFile:
-        """Lazy load the Excel file."""
-        if self._excel_file is None:
-            print(f"[blue]Loading Excel file: {self.data_file}[/blue]")
-            self._excel_file = pd.ExcelFile(self.data_file)
-        return self._excel_file
-
-    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean DataFrame by handling missing values and converting types."""
-        # Replace "--" and similar markers with NaN
-        df = df.replace(["--", "-", "N/A", "n/a", ""], pd.NA)
-
-        # Convert numeric columns
-        for col in df.columns:
-            if df[col].dtype == object:
-                try:
-                    df[col] = pd.to_numeric(df[col], errors="ignore")
-                except (ValueError, TypeError):
-                    pass
+    def reader(self) -> SheetReader:
+        """Lazy open the Excel file with the configured reader engine."""
+        with self._open_lock:
+            if self._reader is None:
+                print(f"[blue]Loading Excel file: {self.data_file} ({settings.reader_engine})[/blue]")
+                self._reader = get_reader(settings.reader_engine, self.data_file)
+        return self._reader
 
-        return df
+    @property
+    def snapshot(self) -> Snapshot | None:
+        """Lazy open the compiled snapshot, if one matches the Excel file.
+
+        With ``shared_tables`` set and no matching snapshot, one is published
+        per dataset version (see ``publish_snapshot``) for all workers to map.
+        """
+        with self._open_lock:
+            if not self._snapshot_checked:
+                if self.use_snapshot and settings.snapshot_dir is not None:
+                    self._snapshot = Snapshot.open(settings.snapshot_dir, self.checksum)
+                    if self._snapshot is not None:
+                        print(f"[blue]Using snapshot: {settings.snapshot_dir}[/blue]")
+                if self._snapshot is None and self.use_snapshot and settings.shared_tables:
+                    workbook = DataLoader(data_file=self.data_file, use_snapshot=False)
+                    self._snapshot = publish_snapshot(workbook, settings.shared_tables_dir / self.version)
+                    print(f"[blue]Using shared tables: {self._snapshot.snapshot_dir}[/blue]")
+                self._snapshot_checked = True
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        """Dataset version identifier derived from the data file checksum."""
+        return self.checksum[:12]
+
+    @property
+    def sheet_names(self) -> list[str]:
+        """Names of all worksheets in the data file."""
+        if self.snapshot is not None:
+            return self.snapshot.sheet_names
+        return self.reader.sheet_names
 
     def get_table(self, table_name: str, header_row: int = 1) -> pd.DataFrame:
         """Get a table by name with caching."""
         cache_key = f"{table_name}_{header_row}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        return self._get_or_load(cache_key, lambda: self._load_table(cache_key, table_name, header_row))
+
+    def _get_or_load(self, cache_key: str, load: Callable[[], T]) -> T:
+        """Get a cached frame or index, running ``load`` once across concurrent callers."""
+        df = self._cache.get(cache_key)
+        if df is not None:
+            if self.memory_budget:
+                with self._lock:
+                    if cache_key in self._cache:
+                        self._cache.move_to_end(cache_key)
+            return df
+
+        with self._lock:
+            df = self._cache.get(cache_key)
+            if df is not None:
+                return df
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = self._inflight[cache_key] = Future()
+                self.loads += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            # Another thread is loading this frame; share its result
+            return future.result()
+
+        try:
+            df = load()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[cache_key]
+                self.failures += 1
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._store(cache_key, df)
+            del self._inflight[cache_key]
+        future.set_result(df)
+        if self.on_store is not None:
+            self.on_store(self)
+        return df
+
+    def _load_table(self, cache_key: str, table_name: str, header_row: int) -> pd.DataFrame:
+        """Load a table from the snapshot if it has it, else from the Excel file.
 
-        df = pd.read_excel(self.excel_file, table_name, header=header_row)
-        df = self._clean_dataframe(df)
-        self._cache[cache_key] = df
+        Tables read with their default header also get their catalog metadata.
+        """
+        if self.snapshot is not None and cache_key in self.snapshot:
+            df = self.snapshot.load(cache_key)
+        else:
+            df = self._read_table(table_name, header_row)
+        if header_row == 1:
+            self._table_info[table_name] = describe_table(df)
         return df
 
+    def _store(self, cache_key: str, value: pd.DataFrame | TableIndex | np.ndarray) -> None:
+        """Add a table, index or sort order to the cache and account for its memory.
+
+        An index keeps its frame alive, so the frame is charged while any
+        entry holds it, and only once however many do. Called with the lock
+        held; evicts other entries to stay within the budget.
+        """
+        if cache_key in self._cache:
+            self._release(cache_key)
+        self._cache[cache_key] = value
+        self._held[cache_key] = tuple(self._hold(obj, size) for obj, size in _footprint(value))
+        self._evict(keep=cache_key)
+
+    def _hold(self, obj: object, size: int) -> int:
+        """Count one more entry holding ``obj``; charge its size to the first one."""
+        held = self._objects.get(id(obj))
+        if held is None:
+            held = self._objects[id(obj)] = [obj, size, 0]
+            self.nbytes += size
+        held[2] += 1
+        return id(obj)
+
+    def _release(self, cache_key: str) -> None:
+        """Drop an entry; objects no other entry holds stop being charged."""
+        del self._cache[cache_key]
+        for obj_id in self._held.pop(cache_key):
+            held = self._objects[obj_id]
+            held[2] -= 1
+            if not held[2]:
+                del self._objects[obj_id]
+                self.nbytes -= held[1]
+
+    def _evict(self, keep: str) -> None:
+        """Drop least recently used entries, except ``keep``, while over the memory budget."""
+        if not self.memory_budget:
+            return
+        for cache_key in list(self._cache):
+            if self.nbytes <= self.memory_budget:
+                break
+            if cache_key == keep:
+                continue
+            self._release(cache_key)
+            self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Table load counters and cache size."""
+        with self._lock:
+            return {
+                "tables": len(self._cache),
+                "loading": len(self._inflight),
+                "loads": self.loads,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+                "evictions": self.evictions,
+                "memory_bytes": self.nbytes,
+                "memory_budget": self.memory_budget,
+                "cached_tables": [name for name in self._table_info if f"{name}_1" in self._cache],
+            }
+
+    def _read_table(self, table_name: str, header_row: int = 1) -> pd.DataFrame:
+        """Parse and type a table from the Excel file, bypassing the cache."""
+        schema = get_schema(table_name)
+        na_values = list(schema.na_values if schema else NA_MARKERS)
+        df = self.reader.read(table_name, header=header_row, na_values=na_values)
+        return apply_schema(df, schema)
+
+    def get_table_info(self, table_name: str) -> TableInfo:
+        """Get the catalog metadata of a table, loading the table if it never was."""
+        info = self._table_info.get(table_name)
+        if info is None:
+            df = self.get_table(table_name)
+            info = self._table_info.setdefault(table_name, describe_table(df))
+        return info
+
+    def get_table_shape(self, table_name: str) -> tuple[int, int] | None:
+        """Get the rows and columns of a table if they are known without parsing it.
+
+        They come from the snapshot manifest, else from the catalog metadata
+        of a cached table; None otherwise.
+        """
+        cache_key = f"{table_name}_1"
+        if self.snapshot is not None and cache_key in self.snapshot:
+            return self.snapshot.table_shape(cache_key)
+        if cache_key in self._cache:
+            info = self.get_table_info(table_name)
+            return info.rows, len(info.columns)
+        return None
+
+    def get_table_titles(self) -> dict[str, str]:
+        """Get the titles of the tables, from the index sheet of the workbook."""
+        if INDEX_SHEET not in self.sheet_names:
+            return {}
+        return table_titles(self.get_table(INDEX_SHEET))
+
+    def is_loaded(self, table_name: str) -> bool:
+        """Whether a table is in the cache."""
+        return f"{table_name}_1" in self._cache
+
+    def _get_state_rows(
+        self, table_name: str, prepare: Callable[[pd.DataFrame], pd.DataFrame] | None = None
+    ) -> pd.DataFrame:
+        """Get the state rows of a table, cached so row positions are stable."""
+        def load() -> pd.DataFrame:
+            df = self.get_table(table_name)
+            if prepare is not None:
+                df = prepare(df)
+            # Filter out summary rows (where state is NaN but region is not)
+            return df[df["state"].notna()]
+
+        return self._get_or_load(f"{table_name}:states", load)
+
     def get_land_area_data(self) -> pd.DataFrame:
         """Get Table A-1a: Land area by state."""
-        df = self.get_table("Table A-1a")
-        # Rename columns to be more consistent
-        column_mapping = {
-            "Region": "region",
-            "Subregion": "subregion",
-            "State": "state",
-            "Total land area": "total_land_area",
-            "Total forest land": "total_forest_land",
-            "Total timberland": "total_timberland",
-            "Total planted timberland": "planted_timberland",
-            "Natural origin timberland": "natural_timberland",
-            "Productive reserved": "productive_reserved",
-            "Unproductive reserved": "unproductive_reserved",
-            "Other forest": "other_forest",
-            "Woodland area": "woodland_area",
-            "Other land": "other_land",
-        }
-        df = df.rename(columns=column_mapping)
-        # Filter out summary rows (where state is NaN but region is not)
-        df = df[df["state"].notna()].copy()
-        return df
+        return self._get_state_rows("Table A-1a")
 
     def get_ownership_data(self) -> pd.DataFrame:
         """Get Table A-2: Forest ownership by state."""
-        df = self.get_table("Table A-2")
-        column_mapping = {
-            "Region": "region",
-            "Subregion": "subregion",
-            "State": "state",
-            "All ownerships": "all_ownerships",
-            "Total public": "total_public",
-            "Total federal": "total_federal",
-            "National forest": "national_forest",
-            "Bureau of land management": "blm",
-            "Bureau of Land Management": "blm",
-            "Other": "other_federal",
-            "State own": "state_owned",
-            "State owned": "state_owned",
-            "County and municipal": "county_municipal",
-            "Total private": "total_private",
-            "Private corporate": "private_corporate",
-            "Private noncorporate": "private_noncorporate",
-            "Woodland": "woodland",
-        }
-        df = df.rename(columns=column_mapping)
-        df = df[df["state"].notna()].copy()
-        return df
+        return self._get_state_rows("Table A-2")
 
     def get_forest_area_trends(self) -> pd.DataFrame:
         """Get Table A-3: Forest area trends 1630-2022."""
-        df = self.get_table("Table A-3")
-        # This table has years as columns
-        df = df.rename(columns={
-            "Region": "region",
-            "Subregion": "subregion",
-            "State": "state",
-        })
-        # Convert year columns to strings for consistency
-        year_cols = [col for col in df.columns if isinstance(col, (int, float)) and col > 1600]
-        for col in year_cols:
-            if col in df.columns:
-                df = df.rename(columns={col: str(int(col))})
-        df = df[df["state"].notna()].copy()
-        return df
+        def year_columns_to_str(df: pd.DataFrame) -> pd.DataFrame:
+            # This table has years as columns; convert them to strings for consistency
+            year_cols = [col for col in df.columns if isinstance(col, (int, float)) and col > 1600]
+            return df.rename(columns={col: str(int(col)) for col in year_cols})
+
+        return self._get_state_rows("Table A-3", year_columns_to_str)
+
+    def get_forest_area_records(self) -> pd.DataFrame:
+        """Get Table A-3 as one (state, year, area) row per known area.
+
+        See ``forest_area_records``; the records are built once per loader.
+        """
+        return self._get_or_load("forest_area_records", lambda: forest_area_records(self.get_forest_area_trends()))
 
     def get_timberland_ownership_trends(self) -> pd.DataFrame:
         """Get Table A-10: Timberland by ownership 1953-2022."""
         df = self.get_table("Table A-10")
-        column_mapping = {
-            "Region": "region",
-            "Subregion": "subregion",
-            "State": "state",
-            "Year": "year",
-            "All ownerships": "all_ownerships",
-            "Total public": "total_public",
-            "Total Federal": "total_federal",
-            "National forest": "national_forest",
-            "Bureau of Land Management": "blm",
-            "Other": "other_federal",
-            "State owned": "state_owned",
-            "County and municipal": "county_municipal",
-            "Total private": "total_private",
-            "Private corporate": "private_corporate",
-            "Private noncorporate": "private_noncorporate",
-        }
-        df = df.rename(columns=column_mapping)
         return df
 
+    def get_timberland_cube(self) -> pd.DataFrame:
+        """Get Table A-10 as one row per area, ownership class and year.
+
+        See ``build_timberland_cube``; the cube is built once per loader.
+        """
+        return self._get_or_load("timberland_cube", lambda: build_timberland_cube(
+            self.get_timberland_ownership_trends(),
+        ))
+
     def get_timber_volume(self) -> pd.DataFrame:
         """Get Table A-17: Timber volume by species."""
-        df = self.get_table("Table A-17")
-        column_mapping = {
-            "Region": "region",
-            "Subregion": "subregion",
-            "State": "state",
-            "All timber total": "all_timber_total",
-            "All timber softwoods": "all_timber_softwoods",
-            "All timber hardwoods": "all_timber_hardwoods",
-            "Total growing stock": "growing_stock_total",
-            "Softwoods growing stock": "growing_stock_softwoods",
-            "Hardwoods growing stock": "growing_stock_hardwoods",
-            "Total cull": "cull_total",
-            "Softwoods cull": "cull_softwoods",
-            "Hardwoods cull": "cull_hardwoods",
-            "Total sound dead": "sound_dead_total",
-            "Softwoods sound dead": "sound_dead_softwoods",
-            "Hardwoods sound dead": "sound_dead_hardwoods",
-        }
-        df = df.rename(columns=column_mapping)
-        df = df[df["state"].notna()].copy()
-        return df
+        return self._get_state_rows("Table A-17")
 
     def get_growing_stock_trends(self) -> pd.DataFrame:
         """Get Table A-20: Growing stock by ownership 1953-2022."""
@@ -172,6 +334,15 @@ class DataLoader:
         # This table has complex structure with year and ownership columns
         return df
 
+    def get_growing_stock_cube(self) -> pd.DataFrame:
+        """Get Tables A-18 to A-20 as one row per area, ownership, species group and year.
+
+        See ``build_growing_stock_cube``; the cube is built once per loader.
+        """
+        return self._get_or_load("growing_stock_cube", lambda: build_growing_stock_cube({
+            species: self.get_table(table_name) for species, table_name in SPECIES_TABLES.items()
+        }))
+
     def get_mortality_data(self) -> pd.DataFrame:
         """Get Table A-33: Annual mortality 1952-2022."""
         df = self.get_table("Table A-33")
@@ -187,6 +358,80 @@ class DataLoader:
         df = self.get_table("Table A-35")
         return df
 
+    def get_dynamics_cube(self) -> pd.DataFrame:
+        """Get growth, mortality and removals as one long-format cube.
+
+        See ``build_dynamics_cube``; the cube is built once per loader.
+        """
+        return self._get_or_load("dynamics_cube", lambda: build_dynamics_cube(
+            self.get_growth_data(), self.get_mortality_data(), self.get_removals_data(),
+        ))
+
+    def get_rollup(self, table_name: str, level: RollupLevel) -> pd.DataFrame:
+        """Get the numeric columns of a state-level table summed at one level.
+
+        Rollups are available for Tables A-1a, A-2, A-3 and A-17 and are
+        computed once per loader; see ``build_rollup``.
+        """
+        source = self._state_tables()[table_name]
+        return self._get_or_load(f"rollup:{table_name}:{level}", lambda: build_rollup(source(), level))
+
+    def get_table_index(self, table_name: str) -> TableIndex:
+        """Get the index of a listed table (see ``_listings``).
+
+        Indexes cover region, subregion and state, plus ownership, species
+        group and year where the table has them, over the rows returned by
+        the table's getter (e.g. ``get_land_area_data``).
+        """
+        source = self._listings()[table_name]
+        return self._get_or_load(f"index:{table_name}", lambda: TableIndex(source(), LOOKUP_COLUMNS))
+
+    def get_sort_order(self, table_name: str, column: str, descending: bool = False) -> np.ndarray:
+        """Get the row positions of a listed table sorted by a numeric column.
+
+        Orders are computed once per loader and column; see ``sort_order``.
+        """
+        source = self._listings()[table_name]
+        direction = "desc" if descending else "asc"
+        return self._get_or_load(
+            f"order:{table_name}:{column}:{direction}", lambda: sort_order(source()[column], descending),
+        )
+
+    def get_sheet_index(self, table_name: str) -> TableIndex:
+        """Get the region/subregion/state index of a whole table.
+
+        Unlike ``get_table_index`` this covers every row of ``get_table``,
+        summary rows included, and works for any sheet with geography columns.
+        """
+        def load() -> TableIndex:
+            df = self.get_table(table_name)
+            return TableIndex(df, list(geography_columns(df).values()))
+
+        return self._get_or_load(f"index:{table_name}:sheet", load)
+
+    def get_listing(self, table_name: str) -> pd.DataFrame:
+        """Get a frame served by the list endpoints (see ``get_sort_order``)."""
+        return self._listings()[table_name]()
+
+    def _listings(self) -> dict[str, Callable[[], pd.DataFrame]]:
+        """Getters of the frames served by the list endpoints."""
+        return {
+            **self._state_tables(),
+            "forest_area_records": self.get_forest_area_records,
+            "dynamics_cube": self.get_dynamics_cube,
+            "growing_stock_cube": self.get_growing_stock_cube,
+            "timberland_cube": self.get_timberland_cube,
+        }
+
+    def _state_tables(self) -> dict[str, Callable[[], pd.DataFrame]]:
+        """Getters of the tables with one row per state."""
+        return {
+            "Table A-1a": self.get_land_area_data,
+            "Table A-2": self.get_ownership_data,
+            "Table A-3": self.get_forest_area_trends,
+            "Table A-17": self.get_timber_volume,
+        }
+
     def get_regions(self) -> list[dict[str, Any]]:
         """Get unique regions with their subregions."""
         df = self.get_land_area_data()
@@ -200,35 +445,93 @@ class DataLoader:
 
     def get_states(self, region: str | None = None, subregion: str | None = None) -> list[str]:
         """Get states, optionally filtered by region or subregion."""
-        df = self.get_land_area_data()
-        if region:
-            df = df[df["region"] == region]
-        if subregion:
-            df = df[df["subregion"] == subregion]
+        df = self.get_table_index("Table A-1a").select(region=region, subregion=subregion)
         states = df["state"].unique().tolist()
         return [s for s in states if pd.notna(s)]
 
-    def preload_all(self) -> None:
-        """Preload all commonly used tables into cache."""
-        tables_to_load = [
-            ("Table A-1a", self.get_land_area_data),
-            ("Table A-2", self.get_ownership_data),
-            ("Table A-3", self.get_forest_area_trends),
-            ("Table A-17", self.get_timber_volume),
+    def preload_all(self, workers: int | None = None, progress: Callable[[int, int], None] | None = None) -> None:
+        """Preload all configured tables into cache.
+
+        Without a snapshot, the sheets are parsed concurrently in a process
+        pool where each worker opens the Excel file on its own. The pool is
+        never larger than the number of CPUs. ``progress`` is called with the
+        numbers of loaded and configured tables, first for the tables already
+        cached and then after each load.
+        """
+        workers = settings.preload_workers if workers is None else workers
+        workers = min(workers, os.cpu_count() or 1)
+        start = time.perf_counter()
+        pending = [
+            name for name in settings.preload_tables
+            if not self.is_loaded(name)
         ]
-        for name, loader in tables_to_load:
-            print(f"[blue]Preloading {name}...[/blue]")
-            loader()
-        print(f"[green]Preloaded {len(tables_to_load)} tables[/green]")
+        total = len(settings.preload_tables)
+        loaded = total - len(pending)
+        if progress is not None:
+            progress(loaded, total)
+
+        if self.snapshot is None and workers > 1 and len(pending) > 1:
+            tables = self._preload_parallel(pending, workers)
+        else:
+            tables = self._preload_serial(pending)
+        for _ in tables:
+            loaded += 1
+            if progress is not None:
+                progress(loaded, total)
+
+        elapsed = time.perf_counter() - start
+        print(f"[green]Preloaded {len(pending)} tables in {elapsed:.3f}s[/green]")
+
+    def _preload_serial(self, table_names: list[str]) -> Iterator[str]:
+        """Load tables one by one, yielding each name once it is cached."""
+        for name in table_names:
+            table_start = time.perf_counter()
+            self.get_table(name)
+            elapsed = time.perf_counter() - table_start
+            print(f"[blue]Preloaded {name} in {elapsed:.3f}s[/blue]")
+            yield name
+
+    def _preload_parallel(self, table_names: list[str], workers: int) -> Iterator[str]:
+        """Parse tables in a process pool and merge them into the cache, yielding each name."""
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(table_names)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_preload_worker,
+            initargs=(self.data_file,),
+        ) as pool:
+            results = pool.map(_preload_worker_parse, table_names)
+            for name, (df, elapsed) in zip(table_names, results):
+                self._table_info[name] = describe_table(df)
+                with self._lock:
+                    self.loads += 1
+                    self._store(f"{name}_1", df)
+                if self.on_store is not None:
+                    self.on_store(self)
+                print(f"[blue]Preloaded {name} in {elapsed:.3f}s[/blue]")
+                yield name
+
+
+# Per-process loader used by preload workers
+_worker_loader: DataLoader | None = None
+
+
+def _footprint(value: pd.DataFrame | TableIndex | np.ndarray) -> list[tuple[object, int]]:
+    """Objects a cache entry keeps alive, with their sizes in bytes."""
+    if isinstance(value, pd.DataFrame):
+        return [(value, int(value.memory_usage(deep=True).sum()))]
+    if isinstance(value, TableIndex):
+        return [(value, value.nbytes), *_footprint(value.df)]
+    return [(value, value.nbytes)]
 
 
-# Singleton instance
-_data_loader: DataLoader | None = None
+def _init_preload_worker(data_file: Path) -> None:
+    """Open the Excel file once per preload worker process."""
+    global _worker_loader
+    _worker_loader = DataLoader(data_file=data_file, use_snapshot=False)
 
 
-def get_data_loader() -> DataLoader:
-    """Get the singleton DataLoader instance."""
-    global _data_loader
-    if _data_loader is None:
-        _data_loader = DataLoader()
-    return _data_loader
+def _preload_worker_parse(table_name: str) -> tuple[pd.DataFrame, float]:
+    """Parse one table in a preload worker and time it."""
+    start = time.perf_counter()
+    df = _worker_loader._read_table(table_name)
+    return df, time.perf_counter() - start
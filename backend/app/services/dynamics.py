@@ -0,0 +1,56 @@
+"""Long-format cube of forest dynamics (Tables A-33, A-34 and A-35)."""
+
+import numpy as np
+import pandas as pd
+
+from .bands import as_categories, melt_bands
+
+DIMENSIONS = ["region", "subregion", "species_group", "ownership", "year"]
+METRICS = ["growth", "mortality", "removals"]
+
+NATION = "United States"
+ALL_OWNERS = "All owners"
+
+
+def _melt(df: pd.DataFrame, metric: str) -> pd.DataFrame:
+    """Unpivot the "<ownership>: <year>" columns of one dynamics table."""
+    rows = df[df["region"].notna()]
+    return melt_bands(rows, ["region", "subregion", "species_group"], "ownership", metric)
+
+
+def build_dynamics_cube(
+    growth: pd.DataFrame, mortality: pd.DataFrame, removals: pd.DataFrame
+) -> pd.DataFrame:
+    """Normalize the three dynamics tables into one long-format frame.
+
+    There is one row per (region, subregion, species_group, ownership, year)
+    that has at least one metric, with growth, mortality, removals and
+    net_change columns. Subregion is missing on region totals, and the nation
+    is the region "United States". Rows keep the order of the source tables.
+    """
+    parts = [
+        _melt(mortality, "mortality"),
+        _melt(growth, "growth"),
+        _melt(removals, "removals"),
+    ]
+    combined = pd.concat(parts, ignore_index=True)
+    for metric in METRICS:
+        if metric not in combined:
+            combined[metric] = np.nan
+
+    # Each metric comes from one table, so first() merges the three per key
+    cube = (
+        combined.groupby(DIMENSIONS, sort=False, dropna=False)[METRICS]
+        .first()
+        .dropna(how="all")
+        .reset_index()
+    )
+
+    # Net change is only defined where growth is known
+    growth_values = cube["growth"]
+    net_change = growth_values - cube["mortality"].fillna(0) - cube["removals"].fillna(0)
+    cube["net_change"] = net_change.where(growth_values.notna() & (growth_values != 0))
+
+    as_categories(cube, ["region", "subregion", "species_group", "ownership"])
+    cube["year"] = cube["year"].astype(np.int64)
+    return cube[DIMENSIONS + METRICS + ["net_change"]]
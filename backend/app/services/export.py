@@ -0,0 +1,45 @@
+"""Arrow IPC and Parquet encoding of whole appendix tables."""
+
+from typing import Literal
+
+import pandas as pd
+import pyarrow as pa
+
+ExportFormat = Literal["arrow", "parquet"]
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "arrow": ARROW_STREAM_MEDIA_TYPE,
+    "parquet": PARQUET_MEDIA_TYPE,
+}
+
+FILE_EXTENSIONS: dict[ExportFormat, str] = {
+    "arrow": ".arrows",
+    "parquet": ".parquet",
+}
+
+
+def to_arrow(df: pd.DataFrame) -> pa.Table:
+    """Convert a frame to an Arrow table.
+
+    Numeric columns wrap the frame's NumPy buffers (only a validity bitmap is
+    added for NaNs), string columns backed by Arrow are reused as is and
+    categoricals become dictionary arrays.
+    """
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def encode_table(table: pa.Table, fmt: ExportFormat) -> pa.Buffer:
+    """Write a table as an Arrow IPC stream or a Parquet file into one buffer."""
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        # Imported on first use: only Parquet exports need the writer
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue()
@@ -0,0 +1,36 @@
+"""Long-format cube of growing stock volume (Tables A-18, A-19 and A-20)."""
+
+import numpy as np
+import pandas as pd
+
+from .bands import as_categories, melt_bands
+
+DIMENSIONS = ["region", "subregion", "state", "ownership", "species_group", "year"]
+
+# Table holding the growing stock of each species group
+SPECIES_TABLES = {
+    "Softwood": "Table A-18",
+    "Hardwood": "Table A-19",
+    "Total": "Table A-20",
+}
+
+
+def build_growing_stock_cube(tables: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Normalize the growing stock tables of each species group into one frame.
+
+    ``tables`` maps species groups to their tables (see ``SPECIES_TABLES``).
+    There is one row per (region, subregion, state, ownership,
+    species_group, year) with a known volume. State is missing on subregion
+    and region totals, subregion on region totals, and the nation is the
+    region "United States".
+    """
+    parts = []
+    for species, df in tables.items():
+        long = melt_bands(df[df["region"].notna()], ["region", "subregion", "state"], "ownership", "volume")
+        long["species_group"] = np.full(len(long), species, dtype=object)
+        parts.append(long[long["volume"].notna()])
+
+    cube = pd.concat(parts, ignore_index=True)
+    as_categories(cube, ["region", "subregion", "state", "ownership", "species_group"])
+    cube["year"] = cube["year"].astype(np.int64)
+    return cube[DIMENSIONS + ["volume"]]
@@ -0,0 +1,94 @@
+"""Hash indexes of the geographic dimensions of a table."""
+
+import numpy as np
+import pandas as pd
+
+INDEXED_COLUMNS = ["region", "subregion", "state"]
+
+# Columns indexed in the frames served by the list endpoints, where present
+LOOKUP_COLUMNS = INDEXED_COLUMNS + ["ownership", "species_group", "year"]
+
+
+def geography_columns(df: pd.DataFrame) -> dict[str, str]:
+    """Map ``region``/``subregion``/``state`` to the columns of a table that hold them.
+
+    Registered tables use the lowercase names; other tables keep the
+    workbook headers (``Region``, ``Subregion``, ``State``).
+    """
+    columns = {}
+    for col in df.columns:
+        name = str(col).lower()
+        if name in INDEXED_COLUMNS and name not in columns:
+            columns[name] = col
+    return columns
+
+
+class _ColumnIndex:
+    """Row positions of each distinct value of one column."""
+
+    def __init__(self, values: pd.Series):
+        self.codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        # Positions grouped by value; missing values (code -1) sort first
+        # and are skipped, and each group stays in row order
+        order = np.argsort(self.codes, kind="stable")
+        counts = np.bincount(self.codes[self.codes >= 0], minlength=len(uniques))
+        starts = np.count_nonzero(self.codes < 0) + np.cumsum(counts) - counts
+        self.positions: dict[object, tuple[int, np.ndarray]] = {
+            value: (code, order[start:start + count])
+            for code, (value, start, count) in enumerate(zip(uniques, starts, counts))
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(positions.nbytes for _, positions in self.positions.values())
+
+
+class TableIndex:
+    """Maps each value of the indexed columns of a table to its row positions.
+
+    Region, subregion and state are indexed unless ``columns`` says otherwise.
+
+    Filtering starts from the positions of the most selective value and
+    checks the remaining filters on just those rows, then takes the matching
+    rows once, instead of comparing every row of each column and copying the
+    frame after every filter.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list[str] = INDEXED_COLUMNS):
+        self.df = df
+        self.columns = {col: _ColumnIndex(df[col]) for col in columns if col in df.columns}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the index arrays."""
+        return sum(index.nbytes for index in self.columns.values())
+
+    def lookup(self, **filters: str | int | None) -> np.ndarray | None:
+        """Row positions matching all given values, or None if no filter is set."""
+        matches = []
+        for col, value in filters.items():
+            if not value:
+                continue
+            match = self.columns[col].positions.get(value)
+            if match is None:
+                return np.empty(0, dtype=np.intp)
+            matches.append((col, *match))
+        if not matches:
+            return None
+
+        matches.sort(key=lambda match: len(match[2]))
+        _, _, result = matches[0]
+        for col, code, _ in matches[1:]:
+            result = result[self.columns[col].codes[result] == code]
+        return result
+
+    def missing(self, column: str, positions: np.ndarray) -> np.ndarray:
+        """Keep the positions where ``column`` is missing (e.g. the rows of totals)."""
+        return positions[self.columns[column].codes[positions] < 0]
+
+    def select(self, **filters: str | None) -> pd.DataFrame:
+        """Rows of the table matching all given values (e.g. ``region="South"``)."""
+        positions = self.lookup(**filters)
+        if positions is None:
+            return self.df
+        return self.df.take(positions)
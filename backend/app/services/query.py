@@ -0,0 +1,335 @@
+"""Declarative group-by/aggregate queries over the listed tables.
+
+A query names a dataset, dimension filters, group-by keys and aggregates.
+It is normalized into a ``QuerySpec`` and compiled once into a
+``QueryPlan`` (plans are cached per spec and table columns), which runs as
+one vectorized filter and one grouped reduction over the cached frame.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Literal, get_args
+
+import numpy as np
+import pandas as pd
+
+from .dynamics import ALL_OWNERS
+
+Aggregate = Literal["sum", "mean", "min", "max", "share"]
+AGGREGATES: tuple[str, ...] = get_args(Aggregate)
+
+# Query keys of the dimensions and the columns holding them
+DIMENSIONS: dict[str, str] = {
+    "region": "region",
+    "subregion": "subregion",
+    "state": "state",
+    "species": "species_group",
+    "ownership": "ownership",
+    "year": "year",
+}
+
+
+class QueryError(ValueError):
+    """A query that cannot be compiled or exceeds the limits."""
+
+
+class UnknownMemberError(QueryError):
+    """A query filtering on a value its dataset does not have."""
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """A listed table that can be queried.
+
+    Hierarchical dimensions store their totals as rows. Unless the query
+    filters on such a dimension, it reads the ``totals`` member, or members
+    below it when grouping by the dimension, so that nothing is counted
+    twice. ``members`` lists the sets of members that add up to the total,
+    finest first; a grouped query uses the first set whose values add up to
+    the total of every aggregated measure. ``leaf_column`` marks the
+    rows that are not geographic totals (a missing value marks a total).
+    """
+
+    table: str
+    dimensions: tuple[str, ...]
+    totals: dict[str, str] = field(default_factory=dict)
+    members: dict[str, tuple[tuple[str, ...], ...]] = field(default_factory=dict)
+    leaf_column: str | None = None
+
+
+_STATE_DIMENSIONS = ("region", "subregion", "state")
+
+_OWNERSHIP_MEMBERS = (
+    ("National forest", "Other public", "Private corporate", "Private noncorporate"),
+    ("National forest", "Other public", "Total private"),
+)
+
+DATASETS: dict[str, Dataset] = {
+    "A-1a": Dataset("Table A-1a", _STATE_DIMENSIONS),
+    "A-2": Dataset("Table A-2", _STATE_DIMENSIONS),
+    "A-3": Dataset("forest_area_records", _STATE_DIMENSIONS + ("year",)),
+    # Table A-10 (timberland area by ownership)
+    "A-10": Dataset(
+        "timberland_cube",
+        _STATE_DIMENSIONS + ("ownership", "year"),
+        totals={"ownership": ALL_OWNERS},
+        members={"ownership": (
+            (
+                "National forest", "Bureau of Land Management", "Other federal", "State owned",
+                "County and municipal", "Private corporate", "Private noncorporate",
+            ),
+            ("Total federal", "State owned", "County and municipal", "Total private"),
+            ("Total public", "Total private"),
+        )},
+        leaf_column="state",
+    ),
+    "A-17": Dataset("Table A-17", _STATE_DIMENSIONS),
+    # Tables A-33 (growth), A-34 (mortality) and A-35 (removals)
+    "dynamics": Dataset(
+        "dynamics_cube",
+        ("region", "subregion", "species", "ownership", "year"),
+        totals={"species": "Total", "ownership": ALL_OWNERS},
+        members={
+            "species": (("Softwood", "Hardwood"),),
+            # Some measures (e.g. removals) are only reported for total private land
+            "ownership": _OWNERSHIP_MEMBERS,
+        },
+        leaf_column="subregion",
+    ),
+    # Tables A-18 to A-20 (growing stock volume by species group)
+    "growing_stock": Dataset(
+        "growing_stock_cube",
+        _STATE_DIMENSIONS + ("species", "ownership", "year"),
+        totals={"species": "Total", "ownership": ALL_OWNERS},
+        members={"species": (("Softwood", "Hardwood"),), "ownership": _OWNERSHIP_MEMBERS},
+        leaf_column="state",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """A normalized query: equal queries compile to the same plan."""
+
+    dataset: str
+    filters: tuple[tuple[str, tuple[str | int, ...]], ...] = ()
+    year_min: int | None = None
+    year_max: int | None = None
+    group_by: tuple[str, ...] = ()
+    aggregates: tuple[tuple[str, str], ...] = ()
+
+
+def normalize_query(
+    dataset: str,
+    filters: dict[str, list[str] | list[int] | None],
+    year_min: int | None = None,
+    year_max: int | None = None,
+    group_by: list[str] | None = None,
+    aggregates: list[str] | None = None,
+) -> QuerySpec:
+    """Build the spec of a query; aggregates are written ``func:measure``.
+
+    Filter values are sorted and deduplicated, and repeated group keys and
+    aggregates are dropped.
+    """
+    if dataset not in DATASETS:
+        raise KeyError(dataset)
+    parsed = []
+    for item in aggregates or []:
+        func, sep, measure = item.partition(":")
+        if not sep or func not in AGGREGATES or not measure:
+            raise QueryError(f"Aggregates are written func:measure with func one of {', '.join(AGGREGATES)}: {item}")
+        parsed.append((func, measure))
+    return QuerySpec(
+        dataset=dataset,
+        filters=tuple(sorted((key, tuple(sorted(set(values)))) for key, values in filters.items() if values)),
+        year_min=year_min,
+        year_max=year_max,
+        group_by=tuple(dict.fromkeys(group_by or [])),
+        aggregates=tuple(dict.fromkeys(parsed)),
+    )
+
+
+def _sum(values: pd.Series) -> float:
+    """Sum that is missing, not 0, for groups without values."""
+    return values.sum(min_count=1)
+
+
+_SUM = _sum.__name__
+_REDUCERS = {"sum": _sum}
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Row selection and grouped reduction compiled from a QuerySpec."""
+
+    table: str
+    conditions: tuple[tuple[str, tuple[str | int, ...]], ...]
+    year_range: tuple[int | None, int | None] | None
+    leaf_column: str | None
+    breakdowns: tuple[tuple[str, str, tuple[tuple[str, ...], ...]], ...]
+    measures: tuple[str, ...]
+    group_columns: tuple[str, ...]
+    group_keys: tuple[str, ...]
+    aggregates: tuple[tuple[str, str, str], ...]
+
+    @property
+    def output_columns(self) -> list[str]:
+        return [name for name, _, _ in self.aggregates]
+
+    def select(self, df: pd.DataFrame) -> np.ndarray:
+        """Positions of the rows the query reads.
+
+        Each grouped hierarchical dimension reads its first set of members
+        that is complete for the aggregated measures (see ``Dataset``).
+        """
+        mask = np.ones(len(df), dtype=bool)
+        if self.leaf_column is not None:
+            mask &= df[self.leaf_column].notna().to_numpy()
+        readable = mask.copy()
+        for column, values in self.conditions:
+            self._check_members(df[column][readable], values)
+            mask &= df[column].isin(values).to_numpy()
+        if self.year_range is not None:
+            low, high = self.year_range
+            years = df["year"].to_numpy()
+            if low is not None:
+                mask &= years >= low
+            if high is not None:
+                mask &= years <= high
+        for column, total, candidates in self.breakdowns:
+            mask &= df[column].isin(self._members(df, mask, column, total, candidates)).to_numpy()
+        return np.flatnonzero(mask)
+
+    @staticmethod
+    def _check_members(values: pd.Series, wanted: tuple[str | int, ...]) -> None:
+        """Reject filter values missing from the rows the query reads (e.g. totals left out)."""
+        known = set(values.dropna().unique().tolist())
+        unknown = [value for value in wanted if value not in known]
+        if unknown:
+            key = next(key for key, column in DIMENSIONS.items() if column == values.name)
+            raise UnknownMemberError(
+                f"Unknown {key}: {', '.join(map(str, unknown))}; "
+                f"values: {', '.join(map(str, sorted(known, key=str)))}",
+            )
+
+    def _members(
+        self, df: pd.DataFrame, mask: np.ndarray, column: str, total: str, candidates: tuple[tuple[str, ...], ...],
+    ) -> tuple[str, ...]:
+        """First set of members adding up to the selected totals for each measure.
+
+        The source tables hold 0 or nothing where a breakdown was not
+        reported, so a set only qualifies where its values match the total.
+        """
+        measures = list(dict.fromkeys(measure for _, measure, _ in self.aggregates))
+        keys = [col for col in df.columns if col != column and col not in self.measures]
+        frame = df[mask]
+        labels = frame[column].to_numpy()
+        values = {
+            member: frame.loc[labels == member].set_index(keys)[measures]
+            for member in {total}.union(*candidates)
+        }
+        totals = values[total]
+        for members in candidates:
+            # NaN in any member propagates, so an unreported member never matches
+            member_sum = sum(values[member].reindex(totals.index).to_numpy() for member in members)
+            matched = np.isclose(member_sum, totals.to_numpy(), rtol=1e-3, atol=0.5)
+            if (totals.isna().to_numpy() | matched).all():
+                return members
+        raise QueryError(
+            f"{', '.join(measures)} is not broken down by {column} for all selected rows; "
+            f"filter on {column} or narrow the rows (e.g. by year)",
+        )
+
+    def cost(self, rows: int) -> int:
+        """Cells reduced for ``rows`` input rows."""
+        return rows * len({column for _, column, _ in self.aggregates})
+
+    def execute(self, df: pd.DataFrame, positions: np.ndarray, max_groups: int) -> pd.DataFrame:
+        """Reduce the rows at ``positions``: one row per group, keyed by the query keys.
+
+        Groups without any value of a measure get a missing aggregate, not 0.
+        """
+        frame = df.take(positions)
+        measures = list(dict.fromkeys(column for _, column, _ in self.aggregates))
+        funcs = [_REDUCERS.get(func, func) for func in dict.fromkeys(
+            "sum" if func == "share" else func for _, _, func in self.aggregates
+        )]
+
+        if self.group_columns:
+            grouped = frame.groupby(list(self.group_columns), sort=False, observed=True, dropna=False)
+            if grouped.ngroups > max_groups:
+                raise QueryError(f"Query returns {grouped.ngroups} groups; at most {max_groups} are allowed")
+            reduced = grouped[measures].agg(funcs)
+        else:
+            reduced = frame[measures].agg(funcs).unstack().to_frame().T
+
+        result = pd.DataFrame(index=reduced.index)
+        for name, column, func in self.aggregates:
+            if func == "share":
+                sums = reduced[(column, _SUM)]
+                total = sums.sum()
+                result[name] = sums / total * 100 if total else np.nan
+            else:
+                result[name] = reduced[(column, _SUM if func == "sum" else func)]
+
+        if not self.group_columns:
+            return result.reset_index(drop=True)
+        result = result.reset_index()
+        return result.rename(columns=dict(zip(self.group_columns, self.group_keys)))
+
+
+@lru_cache(maxsize=256)
+def compile_query(spec: QuerySpec, columns: tuple[str, ...], measures: tuple[str, ...]) -> QueryPlan:
+    """Compile a query against a table's columns and numeric measure columns."""
+    dataset = DATASETS[spec.dataset]
+    for key in [key for key, _ in spec.filters] + list(spec.group_by):
+        if key not in dataset.dimensions:
+            raise QueryError(f"{spec.dataset} has no {key} dimension; dimensions: {', '.join(dataset.dimensions)}")
+    if (spec.year_min is not None or spec.year_max is not None) and "year" not in dataset.dimensions:
+        raise QueryError(f"{spec.dataset} has no year dimension")
+
+    conditions = [(DIMENSIONS[key], values) for key, values in spec.filters]
+    breakdowns = []
+    filtered = {key for key, _ in spec.filters}
+    for key, total in dataset.totals.items():
+        if key in filtered:
+            continue
+        if key in spec.group_by:
+            breakdowns.append((DIMENSIONS[key], total, dataset.members[key]))
+        else:
+            conditions.append((DIMENSIONS[key], (total,)))
+
+    aggregates = spec.aggregates or tuple(("sum", measure) for measure in measures)
+    for _, measure in aggregates:
+        if measure not in measures:
+            raise QueryError(f"{spec.dataset} has no measure {measure}; measures: {', '.join(measures)}")
+
+    group_columns = tuple(DIMENSIONS[key] for key in spec.group_by)
+    for column in group_columns:
+        if column not in columns:
+            raise QueryError(f"{spec.dataset} has no {column} column")
+
+    year_range = None
+    if spec.year_min is not None or spec.year_max is not None:
+        year_range = (spec.year_min, spec.year_max)
+    return QueryPlan(
+        table=dataset.table,
+        conditions=tuple(conditions),
+        year_range=year_range,
+        leaf_column=dataset.leaf_column,
+        breakdowns=tuple(breakdowns),
+        measures=measures,
+        group_columns=group_columns,
+        group_keys=spec.group_by,
+        aggregates=tuple((f"{measure}_{func}", measure, func) for func, measure in aggregates),
+    )
+
+
+def table_measures(df: pd.DataFrame) -> tuple[str, ...]:
+    """Numeric columns of a table that are not dimensions."""
+    dimension_columns = set(DIMENSIONS.values())
+    return tuple(
+        column for column in df.columns
+        if column not in dimension_columns and pd.api.types.is_numeric_dtype(df[column])
+    )
@@ -0,0 +1,296 @@
+"""Worksheet readers for the appendix workbook.
+
+``OpenpyxlReader`` goes through ``pd.read_excel`` and is the reference
+implementation. ``StreamingReader`` reads the xlsx package directly: it
+stream-parses only the requested ``xl/worksheets/sheetN.xml`` (plus the shared
+strings, once) with expat and scatters cell values straight into NumPy column
+buffers, without building openpyxl cell objects or loading styles.
+"""
+
+import posixpath
+from abc import ABC, abstractmethod
+from array import array
+import threading
+import zipfile
+from pathlib import Path
+from typing import Literal
+from xml.etree import ElementTree
+from xml.parsers import expat
+
+import numpy as np
+import pandas as pd
+
+ReaderEngine = Literal["openpyxl", "streaming"]
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Strings pandas treats as missing by default, in addition to the table's markers
+_DEFAULT_NA = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+])
+
+
+class SheetReader(ABC):
+    """Reads worksheets of an Excel file into DataFrames."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @property
+    @abstractmethod
+    def sheet_names(self) -> list[str]:
+        """Names of the worksheets, in workbook order."""
+
+    @abstractmethod
+    def read(self, sheet_name: str, header: int = 1, na_values: list[str] | None = None) -> pd.DataFrame:
+        """Read a worksheet, using row ``header`` (0-based) as column names."""
+
+
+class OpenpyxlReader(SheetReader):
+    """Reference reader using ``pd.read_excel`` with openpyxl.
+
+    The open workbook is not safe to share between threads, so reads are
+    serialized.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self._excel_file: pd.ExcelFile | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def excel_file(self) -> pd.ExcelFile:
+        """Lazy load the Excel file."""
+        with self._lock:
+            if self._excel_file is None:
+                self._excel_file = pd.ExcelFile(self.path)
+        return self._excel_file
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self.excel_file.sheet_names
+
+    def read(self, sheet_name: str, header: int = 1, na_values: list[str] | None = None) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_excel(self.excel_file, sheet_name, header=header, na_values=na_values)
+
+
+def _column_index(ref: str) -> int:
+    """Convert the letters of a cell reference such as ``AB12`` to a 0-based column."""
+    index = 0
+    for char in ref:
+        if char.isdigit():
+            break
+        index = index * 26 + ord(char) - 64
+    return index - 1
+
+
+def _to_python_number(value: float) -> int | float:
+    """Integral floats become ints, as openpyxl/pandas do."""
+    return int(value) if value.is_integer() else value
+
+
+class StreamingReader(SheetReader):
+    """Reader that streams a single worksheet out of the xlsx package."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        with zipfile.ZipFile(self.path) as zf:
+            self._sheet_paths = self._read_sheet_paths(zf)
+        self._shared_strings: list[str] | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _read_sheet_paths(zf: zipfile.ZipFile) -> dict[str, str]:
+        """Map sheet names to their worksheet part, in workbook order."""
+        rels = ElementTree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for rel in rels.iter(f"{_PKG_REL}Relationship"):
+            target = rel.get("Target")
+            if target.startswith("/"):
+                target = target.lstrip("/")
+            else:
+                target = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = target
+
+        workbook = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+        return {
+            sheet.get("name"): targets[sheet.get(f"{_DOC_REL}id")]
+            for sheet in workbook.iter(f"{_MAIN}sheet")
+        }
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return list(self._sheet_paths)
+
+    def _get_shared_strings(self, zf: zipfile.ZipFile) -> list[str]:
+        """Parse the shared string table once per reader."""
+        with self._lock:
+            if self._shared_strings is None:
+                strings = []
+                if "xl/sharedStrings.xml" in zf.namelist():
+                    with zf.open("xl/sharedStrings.xml") as f:
+                        for _, elem in ElementTree.iterparse(f):
+                            if elem.tag == f"{_MAIN}si":
+                                # Rich text is split into runs; join their text
+                                strings.append("".join(t.text or "" for t in elem.iter(f"{_MAIN}t")))
+                                elem.clear()
+                self._shared_strings = strings
+        return self._shared_strings
+
+    def read(self, sheet_name: str, header: int = 1, na_values: list[str] | None = None) -> pd.DataFrame:
+        na = _DEFAULT_NA.union(na_values or ())
+
+        # Cells are collected as (row, column, value) triples: numbers and
+        # strings separately, so numbers can be scattered in one NumPy pass.
+        num_rows = array("q")
+        num_cols = array("q")
+        num_values = array("d")
+        str_rows = array("q")
+        str_cols = array("q")
+        str_values: list[object] = []
+
+        columns: dict[str, int] = {}
+        cell: list = [None, "n"]
+        text: list[str] = []
+        collecting = False
+
+        def start_element(name: str, attrs: dict[str, str]) -> None:
+            nonlocal collecting
+            if name == "c":
+                cell[0] = attrs["r"]
+                cell[1] = attrs.get("t", "n")
+                text.clear()
+            elif name == "v" or name == "t":
+                collecting = True
+
+        def end_element(name: str) -> None:
+            nonlocal collecting
+            if name == "v" or name == "t":
+                collecting = False
+            elif name == "c":
+                ref, cell_type = cell
+                if not text or cell_type == "e":
+                    return
+                value = "".join(text)
+                letters = ref.rstrip("0123456789")
+                col = columns.get(letters)
+                if col is None:
+                    col = columns[letters] = _column_index(letters)
+                row = int(ref[len(letters):]) - 1
+
+                if cell_type == "n":
+                    num_rows.append(row)
+                    num_cols.append(col)
+                    num_values.append(float(value))
+                    return
+                if cell_type == "s":
+                    value = shared[int(value)]
+                elif cell_type == "b":
+                    value = value == "1"
+                if isinstance(value, str) and value in na:
+                    return
+                str_rows.append(row)
+                str_cols.append(col)
+                str_values.append(value)
+
+        def character_data(data: str) -> None:
+            if collecting:
+                text.append(data)
+
+        with zipfile.ZipFile(self.path) as zf:
+            shared = self._get_shared_strings(zf)
+            parser = expat.ParserCreate()
+            parser.buffer_text = True
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+            parser.CharacterDataHandler = character_data
+            with zf.open(self._sheet_paths[sheet_name]) as f:
+                parser.ParseFile(f)
+
+        return self._build_frame(
+            header,
+            np.frombuffer(num_rows, dtype=np.int64), np.frombuffer(num_cols, dtype=np.int64),
+            np.frombuffer(num_values, dtype=np.float64),
+            np.frombuffer(str_rows, dtype=np.int64), np.frombuffer(str_cols, dtype=np.int64),
+            str_values,
+        )
+
+    @staticmethod
+    def _build_frame(
+        header: int,
+        num_rows: np.ndarray,
+        num_cols: np.ndarray,
+        num_values: np.ndarray,
+        str_rows: np.ndarray,
+        str_cols: np.ndarray,
+        str_values: list[object],
+    ) -> pd.DataFrame:
+        n_rows = int(max(num_rows.max(initial=-1), str_rows.max(initial=-1))) + 1
+        n_cols = int(max(num_cols.max(initial=-1), str_cols.max(initial=-1))) + 1
+
+        numbers = np.full((n_rows, n_cols), np.nan)
+        numbers[num_rows, num_cols] = num_values
+        strings = np.full((n_rows, n_cols), None, dtype=object)
+        is_string = np.zeros((n_rows, n_cols), dtype=bool)
+        if str_values:
+            values = np.empty(len(str_values), dtype=object)
+            values[:] = str_values
+            strings[str_rows, str_cols] = values
+            is_string[str_rows, str_cols] = True
+        is_number = ~np.isnan(numbers)
+
+        # Column names, mangled the way pandas does for blanks and duplicates
+        names = []
+        seen: dict[object, int] = {}
+        for j in range(n_cols):
+            if header < n_rows and is_string[header, j]:
+                name = strings[header, j]
+            elif header < n_rows and is_number[header, j]:
+                name = _to_python_number(float(numbers[header, j]))
+            else:
+                name = f"Unnamed: {j}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+
+        body = slice(header + 1, n_rows)
+        columns = {}
+        for j in range(n_cols):
+            col_numbers = numbers[body, j]
+            col_is_number = is_number[body, j]
+            col_is_string = is_string[body, j]
+            if not col_is_string.any():
+                integral = col_is_number.all() and np.all(np.mod(col_numbers, 1) == 0)
+                columns[j] = col_numbers.astype(np.int64) if integral and len(col_numbers) else col_numbers
+                continue
+
+            values = np.full(len(col_numbers), np.nan, dtype=object)
+            values[col_is_string] = strings[body, j][col_is_string]
+            if col_is_number.any():
+                values[col_is_number] = [_to_python_number(v) for v in col_numbers[col_is_number]]
+                columns[j] = pd.Series(values, dtype=object)
+            else:
+                columns[j] = pd.Series(values, dtype="str")
+
+        df = pd.DataFrame(columns, copy=False)
+        df.columns = pd.Index(names)
+        return df
+
+
+READERS: dict[str, type[SheetReader]] = {
+    "openpyxl": OpenpyxlReader,
+    "streaming": StreamingReader,
+}
+
+
+def get_reader(engine: ReaderEngine, path: Path) -> SheetReader:
+    """Create a sheet reader for the given engine."""
+    return READERS[engine](path)
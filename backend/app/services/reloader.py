@@ -0,0 +1,79 @@
+"""Hot reload of the data files."""
+
+import asyncio
+import os
+from collections.abc import Awaitable, Callable
+
+from rich import print
+
+from .data_loader import DataLoader
+from .snapshot import file_checksum
+from .vintages import get_vintage_registry
+
+
+class DataReloader:
+    """Watches the data files and swaps in new dataset versions when they change.
+
+    The mtime and size of each loaded vintage's file are polled cheaply; the
+    content hash is only computed when they change. A new version is fully
+    preloaded in a worker thread before it replaces the current one, so
+    requests never see a partially loaded dataset. ``on_load`` runs on the
+    new loader before the swap too, e.g. to render responses ahead of time.
+    """
+
+    def __init__(self, interval: float, on_load: Callable[[DataLoader], Awaitable[object]] | None = None):
+        self.interval = interval
+        self.on_load = on_load
+        self._stats: dict[str, tuple[int, int]] = {}
+
+    @staticmethod
+    def _file_stat(loader: DataLoader) -> tuple[int, int]:
+        stat = os.stat(loader.data_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _has_changed(self, vintage: str, loader: DataLoader) -> bool:
+        """Check whether the data file content differs from the loaded version."""
+        stat = self._file_stat(loader)
+        if stat == self._stats.get(vintage):
+            return False
+        self._stats[vintage] = stat
+        return file_checksum(loader.data_file) != loader.checksum
+
+    @staticmethod
+    def _build(loader: DataLoader) -> DataLoader:
+        new_loader = DataLoader(data_file=loader.data_file, use_snapshot=loader.use_snapshot)
+        new_loader.preload_all()
+        return new_loader
+
+    async def check(self) -> int:
+        """Reload every loaded vintage whose data file changed.
+
+        Returns the number of vintages swapped.
+        """
+        registry = get_vintage_registry()
+        swapped = 0
+        for vintage, current in registry.loaded():
+            if not await asyncio.to_thread(self._has_changed, vintage, current):
+                continue
+
+            print(f"[blue]Data file changed, loading new version of {current.data_file}...[/blue]")
+            try:
+                new_loader = await asyncio.to_thread(self._build, current)
+                if self.on_load is not None:
+                    await self.on_load(new_loader)
+            except Exception as exc:
+                print(f"[red]Reload failed, keeping version {current.version}: {exc}[/red]")
+                continue
+
+            if registry.replace(vintage, current, new_loader):
+                swapped += 1
+                print(f"[green]Vintage {vintage}: version {current.version} -> {new_loader.version}[/green]")
+        return swapped
+
+    async def run(self) -> None:
+        """Poll the data files until cancelled."""
+        for vintage, loader in get_vintage_registry().loaded():
+            self._stats[vintage] = self._file_stat(loader)
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.check()
@@ -0,0 +1,34 @@
+"""Precomputed rollups of the state-level tables."""
+
+from typing import Literal
+
+import pandas as pd
+
+RollupLevel = Literal["nation", "region", "subregion", "state"]
+
+# Grouping keys of each level, from coarsest to finest
+LEVEL_KEYS: dict[str, list[str]] = {
+    "nation": [],
+    "region": ["region"],
+    "subregion": ["region", "subregion"],
+    "state": ["region", "subregion", "state"],
+}
+
+
+def build_rollup(df: pd.DataFrame, level: RollupLevel) -> pd.DataFrame:
+    """Sum every numeric column of a state-level table at one level.
+
+    Returns one row per group, keyed by the level's dimension columns, in
+    order of first appearance; the nation level is a single row. Missing
+    values count as zero, as with ``DataFrame.sum``.
+    """
+    keys = LEVEL_KEYS[level]
+    numeric = df.select_dtypes("number").columns
+    if not keys:
+        return df[numeric].sum().to_frame().T
+
+    return (
+        df.groupby(keys, sort=False, observed=True, dropna=False)[numeric]
+        .sum()
+        .reset_index()
+    )
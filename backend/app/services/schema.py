@@ -0,0 +1,160 @@
+"""Declarative schemas for the appendix tables.
+
+Each registered table lists its column renames, the dimension columns stored
+as categoricals and the dtype of its measure columns. Tables without a
+registered schema keep their headers and only get numeric conversion.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+# Markers used in the appendix for missing or suppressed values
+NA_MARKERS = ("--", "-", "N/A", "n/a", "")
+
+DIMENSION_COLUMNS = ("region", "subregion", "state")
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """Column layout and dtypes of one appendix table."""
+    columns: dict[str, str] = field(default_factory=dict)
+    categories: tuple[str, ...] = DIMENSION_COLUMNS
+    float_dtype: str = "float64"
+    dtypes: dict[str, str] = field(default_factory=dict)
+    na_values: tuple[str, ...] = NA_MARKERS
+
+    def dtype_for(self, column: str) -> str:
+        """Get the dtype a column is stored as after renaming."""
+        if column in self.categories:
+            return "category"
+        return self.dtypes.get(column, self.float_dtype)
+
+
+_DIMENSIONS = {"Region": "region", "Subregion": "subregion", "State": "state"}
+
+_DYNAMICS_SCHEMA = TableSchema(
+    columns={
+        "Region": "region",
+        "Subregion": "subregion",
+        "Species class": "species_group",
+    },
+    categories=("region", "subregion", "species_group"),
+)
+
+TABLE_SCHEMAS: dict[str, TableSchema] = {
+    "Table A-1a": TableSchema(columns={
+        **_DIMENSIONS,
+        "Total land area": "total_land_area",
+        "Total forest land": "total_forest_land",
+        "Total timberland": "total_timberland",
+        "Total planted timberland": "planted_timberland",
+        "Natural origin timberland": "natural_timberland",
+        "Productive reserved": "productive_reserved",
+        "Unproductive reserved": "unproductive_reserved",
+        "Other forest": "other_forest",
+        "Woodland area": "woodland_area",
+        "Other land": "other_land",
+    }),
+    "Table A-2": TableSchema(columns={
+        **_DIMENSIONS,
+        "All ownerships": "all_ownerships",
+        "Total public": "total_public",
+        "Total federal": "total_federal",
+        "National forest": "national_forest",
+        "Bureau of land management": "blm",
+        "Bureau of Land Management": "blm",
+        "Other": "other_federal",
+        "State own": "state_owned",
+        "State owned": "state_owned",
+        "County and municipal": "county_municipal",
+        "Total private": "total_private",
+        "Private corporate": "private_corporate",
+        "Private noncorporate": "private_noncorporate",
+        "Woodland": "woodland",
+    }),
+    # Year columns keep their headers, e.g. "2022"
+    "Table A-3": TableSchema(columns=dict(_DIMENSIONS)),
+    "Table A-10": TableSchema(
+        columns={
+            **_DIMENSIONS,
+            "Year": "year",
+            "All ownerships": "all_ownerships",
+            "Total public": "total_public",
+            "Total Federal": "total_federal",
+            "National forest": "national_forest",
+            "Bureau of Land Management": "blm",
+            "Other": "other_federal",
+            "State owned": "state_owned",
+            "County and municipal": "county_municipal",
+            "Total private": "total_private",
+            "Private corporate": "private_corporate",
+            "Private noncorporate": "private_noncorporate",
+        },
+        dtypes={"year": "int64"},
+    ),
+    "Table A-17": TableSchema(columns={
+        **_DIMENSIONS,
+        "All timber total": "all_timber_total",
+        "All timber softwoods": "all_timber_softwoods",
+        "All timber hardwoods": "all_timber_hardwoods",
+        "Total growing stock": "growing_stock_total",
+        "Softwoods growing stock": "growing_stock_softwoods",
+        "Hardwoods growing stock": "growing_stock_hardwoods",
+        "Total cull": "cull_total",
+        "Softwoods cull": "cull_softwoods",
+        "Hardwoods cull": "cull_hardwoods",
+        "Total sound dead": "sound_dead_total",
+        "Softwoods sound dead": "sound_dead_softwoods",
+        "Hardwoods sound dead": "sound_dead_hardwoods",
+    }),
+    # Ownership/year columns keep their headers, e.g. "All owners: 2022"
+    "Table A-18": TableSchema(columns=dict(_DIMENSIONS)),
+    "Table A-19": TableSchema(columns=dict(_DIMENSIONS)),
+    "Table A-20": TableSchema(columns=dict(_DIMENSIONS)),
+    "Table A-33": _DYNAMICS_SCHEMA,
+    "Table A-34": _DYNAMICS_SCHEMA,
+    "Table A-35": _DYNAMICS_SCHEMA,
+}
+
+
+def get_schema(table_name: str) -> TableSchema | None:
+    """Get the registered schema of a table, if any."""
+    return TABLE_SCHEMAS.get(table_name)
+
+
+def schema_fingerprint() -> str:
+    """Fingerprint of the registry, used to invalidate compiled snapshots."""
+    return hashlib.sha256(repr(sorted(TABLE_SCHEMAS.items())).encode()).hexdigest()
+
+
+def _to_category(series: pd.Series) -> pd.Series:
+    """Convert to a categorical whose categories keep order of appearance."""
+    return series.astype(pd.CategoricalDtype(series.dropna().unique()))
+
+
+def apply_schema(df: pd.DataFrame, schema: TableSchema | None) -> pd.DataFrame:
+    """Rename and type a freshly parsed table in one pass over its columns."""
+    if schema is None:
+        columns = {}
+        for i, (name, series) in enumerate(df.items()):
+            if pd.api.types.is_string_dtype(series.dtype) or series.dtype == object:
+                try:
+                    series = pd.to_numeric(series)
+                except (ValueError, TypeError):
+                    pass
+            columns[i] = series
+    else:
+        df = df.rename(columns=schema.columns)
+        columns = {}
+        for i, (name, series) in enumerate(df.items()):
+            dtype = schema.dtype_for(name)
+            if dtype == "category":
+                columns[i] = _to_category(series)
+            else:
+                columns[i] = pd.to_numeric(series, errors="coerce").astype(dtype)
+
+    result = pd.DataFrame(columns, copy=False)
+    result.columns = df.columns
+    return result
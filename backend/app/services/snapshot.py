@@ -0,0 +1,235 @@
+"""Compiled columnar snapshot of the appendix workbook.
+
+Parsing the workbook through openpyxl dominates cold start, so every sheet can
+be compiled once into a single binary file of column blocks plus a JSON
+manifest locating each block. The manifest records the workbook checksum and
+the schema registry fingerprint; a snapshot is only used while both still match.
+"""
+
+import fcntl
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from rich import print
+
+from .schema import schema_fingerprint
+
+SNAPSHOT_FORMAT_VERSION = 3
+MANIFEST_NAME = "manifest.json"
+BLOCKS_NAME = "columns.bin"
+
+
+def file_checksum(path: Path) -> str:
+    """Compute the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy scalars to plain Python values for the manifest."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class _BlockWriter:
+    """Appends column blocks to one binary file, aligned for memory-mapping."""
+
+    ALIGNMENT = 64
+
+    def __init__(self, f):
+        self.f = f
+        self.offset = 0
+
+    def write(self, array: np.ndarray) -> dict[str, Any]:
+        """Write an array and return its location in the block file."""
+        padding = -self.offset % self.ALIGNMENT
+        self.f.write(b"\0" * padding)
+        self.offset += padding
+        data = np.ascontiguousarray(array).tobytes()
+        self.f.write(data)
+        location = {"dtype": array.dtype.str, "offset": self.offset, "length": len(array)}
+        self.offset += len(data)
+        return location
+
+
+def _write_column(series: pd.Series, blocks: _BlockWriter) -> dict[str, Any]:
+    """Write one column block and return its manifest entry."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return {
+            "kind": "categorical",
+            "block": blocks.write(series.cat.codes.to_numpy()),
+            "values": series.cat.categories.tolist(),
+        }
+
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return {"kind": "numeric", "block": blocks.write(series.to_numpy())}
+
+    # Strings and mixed object columns are stored as integer codes into a
+    # small table of unique values kept in the manifest.
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    return {
+        "kind": "factorized",
+        "block": blocks.write(codes.astype(np.int32)),
+        "dtype": str(series.dtype),
+        "values": list(uniques),
+    }
+
+
+def _read_column(entry: dict[str, Any], buffer: np.ndarray) -> np.ndarray | pd.Categorical | pd.Series:
+    """Read one column, as a view into the memory-mapped block file."""
+    location = entry["block"]
+    dtype = np.dtype(location["dtype"])
+    if location["length"]:
+        block = np.frombuffer(buffer, dtype=dtype, count=location["length"], offset=location["offset"])
+    else:
+        block = np.empty(0, dtype=dtype)
+
+    if entry["kind"] == "numeric":
+        return block
+    if entry["kind"] == "categorical":
+        return pd.Categorical.from_codes(block, categories=entry["values"])
+
+    values = np.empty(len(entry["values"]) + 1, dtype=object)
+    values[:-1] = entry["values"]
+    values[-1] = pd.NA if entry["dtype"] == "object" else np.nan
+    # Missing values are stored as -1, which indexes the trailing NaN slot
+    return pd.Series(values.take(block), dtype=entry["dtype"])
+
+
+def build_snapshot(loader, snapshot_dir: Path) -> Path:
+    """Compile every sheet of the loader's workbook into a snapshot directory.
+
+    The snapshot is written to a temporary directory first and swapped into
+    place, so readers never observe a half-written snapshot.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    tmp_dir = snapshot_dir.with_name(snapshot_dir.name + ".tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+
+    tables = {}
+    with open(tmp_dir / BLOCKS_NAME, "wb") as f:
+        blocks = _BlockWriter(f)
+        for sheet_name in loader.sheet_names:
+            print(f"[blue]Compiling {sheet_name}...[/blue]")
+            df = loader.get_table(sheet_name)
+            columns = [
+                {"name": name, **_write_column(df.iloc[:, j], blocks)}
+                for j, name in enumerate(df.columns)
+            ]
+            tables[f"{sheet_name}_1"] = {"sheet": sheet_name, "rows": len(df), "columns": columns}
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "source": str(loader.data_file),
+        "checksum": loader.checksum,
+        "schema": schema_fingerprint(),
+        "sheet_names": list(loader.sheet_names),
+        "tables": tables,
+    }
+    with open(tmp_dir / MANIFEST_NAME, "w") as f:
+        json.dump(manifest, f, default=_json_default)
+
+    old_dir = snapshot_dir.with_name(snapshot_dir.name + ".old")
+    if snapshot_dir.exists():
+        snapshot_dir.rename(old_dir)
+    tmp_dir.rename(snapshot_dir)
+    if old_dir.exists():
+        shutil.rmtree(old_dir)
+
+    print(f"[green]Compiled {len(tables)} tables into {snapshot_dir}[/green]")
+    return snapshot_dir
+
+
+def publish_snapshot(loader, snapshot_dir: Path) -> "Snapshot":
+    """Open the snapshot of the loader's workbook, compiling it first if there is none.
+
+    Processes publishing to the same directory (e.g. the workers of one
+    host) hold an exclusive file lock while they check for it: the first
+    one compiles the snapshot and the others wait, then open the same block
+    file. Its read-only mapping is backed by the page cache, so the column
+    blocks are shared by all of them instead of copied into each.
+    """
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.parent.mkdir(parents=True, exist_ok=True)
+    with open(snapshot_dir.with_name(snapshot_dir.name + ".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        snapshot = Snapshot.open(snapshot_dir, loader.checksum)
+        if snapshot is None:
+            print(f"[blue]Publishing shared tables to {snapshot_dir}[/blue]")
+            build_snapshot(loader, snapshot_dir)
+            snapshot = Snapshot.open(snapshot_dir, loader.checksum)
+    return snapshot
+
+
+class Snapshot:
+    """Read-only view of a compiled snapshot directory."""
+
+    def __init__(self, snapshot_dir: Path, manifest: dict[str, Any]):
+        self.snapshot_dir = Path(snapshot_dir)
+        self.manifest = manifest
+        self._buffer: np.ndarray | None = None
+
+    @property
+    def buffer(self) -> np.ndarray:
+        """The block file, memory-mapped read-only on first use."""
+        if self._buffer is None:
+            path = self.snapshot_dir / BLOCKS_NAME
+            if path.stat().st_size:
+                self._buffer = np.memmap(path, dtype=np.uint8, mode="r")
+            else:
+                self._buffer = np.empty(0, dtype=np.uint8)
+        return self._buffer
+
+    @classmethod
+    def open(cls, snapshot_dir: Path, checksum: str) -> "Snapshot | None":
+        """Open a snapshot if it exists and matches the workbook checksum."""
+        manifest_path = Path(snapshot_dir) / MANIFEST_NAME
+        if not manifest_path.exists():
+            return None
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        if (
+            manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION
+            or manifest.get("schema") != schema_fingerprint()
+        ):
+            print(f"[yellow]Snapshot format changed, ignoring {snapshot_dir}[/yellow]")
+            return None
+        if manifest.get("checksum") != checksum:
+            print(f"[yellow]Snapshot is stale for {manifest.get('source')}, using workbook[/yellow]")
+            return None
+
+        return cls(snapshot_dir, manifest)
+
+    @property
+    def sheet_names(self) -> list[str]:
+        return self.manifest["sheet_names"]
+
+    def __contains__(self, cache_key: str) -> bool:
+        return cache_key in self.manifest["tables"]
+
+    def table_shape(self, cache_key: str) -> tuple[int, int]:
+        """Rows and columns of a compiled table, from the manifest."""
+        table = self.manifest["tables"][cache_key]
+        return table["rows"], len(table["columns"])
+
+    def load(self, cache_key: str) -> pd.DataFrame:
+        """Load a table whose numeric columns are views into the block file."""
+        table = self.manifest["tables"][cache_key]
+        columns = table["columns"]
+        arrays = {j: _read_column(entry, self.buffer) for j, entry in enumerate(columns)}
+        df = pd.DataFrame(arrays, copy=False)
+        df.columns = pd.Index([entry["name"] for entry in columns])
+        return df
@@ -0,0 +1,21 @@
+"""Precomputed sort orders of numeric columns."""
+
+import numpy as np
+import pandas as pd
+
+
+def sort_order(values: pd.Series, descending: bool = False) -> np.ndarray:
+    """Row positions ordering a numeric column.
+
+    Missing values come last in either direction and ties keep row order.
+    """
+    numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    # NaN sorts last for NumPy, and -NaN is NaN
+    return np.argsort(-numbers if descending else numbers, kind="stable")
+
+
+def ordered_positions(order: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Rearrange a subset of row positions in the order of a full sort order."""
+    selected = np.zeros(len(order), dtype=bool)
+    selected[positions] = True
+    return order[selected[order]]
@@ -0,0 +1,39 @@
+"""Long-format cube of timberland area by ownership (Table A-10)."""
+
+import numpy as np
+import pandas as pd
+
+from .bands import as_categories, melt_columns
+
+DIMENSIONS = ["region", "subregion", "state", "ownership", "year"]
+
+# Ownership columns of Table A-10 and the ownership class each holds
+OWNERSHIP_COLUMNS = {
+    "all_ownerships": "All owners",
+    "total_public": "Total public",
+    "total_federal": "Total federal",
+    "national_forest": "National forest",
+    "blm": "Bureau of Land Management",
+    "other_federal": "Other federal",
+    "state_owned": "State owned",
+    "county_municipal": "County and municipal",
+    "total_private": "Total private",
+    "private_corporate": "Private corporate",
+    "private_noncorporate": "Private noncorporate",
+}
+
+
+def build_timberland_cube(df: pd.DataFrame) -> pd.DataFrame:
+    """Unpivot the ownership columns of Table A-10 into one row per class.
+
+    There is one row per (region, subregion, state, ownership, year) with a
+    known area. State is missing on subregion and region totals, subregion
+    on region totals, and the nation is the region "United States".
+    """
+    rows = df[df["region"].notna()]
+    columns = {col: (ownership,) for col, ownership in OWNERSHIP_COLUMNS.items() if col in rows.columns}
+    cube = melt_columns(rows, ["region", "subregion", "state", "year"], columns, ["ownership"], "area")
+    cube = cube[cube["area"].notna()].reset_index(drop=True)
+    as_categories(cube, ["region", "subregion", "state", "ownership"])
+    cube["year"] = cube["year"].astype(np.int64)
+    return cube[DIMENSIONS + ["area"]]
@@ -0,0 +1,37 @@
+"""Long-format forest area trends (Table A-3)."""
+
+import numpy as np
+import pandas as pd
+
+
+def year_columns(df: pd.DataFrame) -> dict[str, int]:
+    """Map the year columns of Table A-3 to their years."""
+    # Year columns are strings like "2022", "2017", etc.
+    columns = {}
+    for col in df.columns:
+        if col in ["region", "subregion", "state"]:
+            continue
+        try:
+            columns[col] = int(float(col))
+        except (ValueError, TypeError):
+            continue
+    return columns
+
+
+def forest_area_records(df: pd.DataFrame) -> pd.DataFrame:
+    """Unpivot Table A-3 rows into one (state, year, area) row per known area.
+
+    Records follow the table's row order, then its year column order.
+    """
+    columns = year_columns(df)
+    n_years = len(columns)
+    areas = df[list(columns)].to_numpy(dtype=np.float64).reshape(-1)
+    known = ~np.isnan(areas)
+    records = pd.DataFrame({
+        col: np.repeat(df[col].to_numpy(dtype=object), n_years)[known]
+        for col in ["region", "subregion", "state"]
+    })
+    records["year"] = np.tile(np.array(list(columns.values()), dtype=np.int64), len(df))[known]
+    # Areas of zero have always been reported as null
+    records["area"] = np.where(areas[known] == 0, np.nan, areas[known])
+    return records
@@ -0,0 +1,236 @@
+"""Registry of dataset vintages (editions of the appendix tables)."""
+
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Any
+
+from fastapi import HTTPException, Query
+from rich import print
+
+from ..config import settings
+
+if TYPE_CHECKING:
+    # Imported when a loader is created: it pulls in pandas
+    from .data_loader import DataLoader
+
+
+class VintageRegistry:
+    """Lazily loaded dataset vintages with least-recently-used eviction.
+
+    Each vintage is served by its own DataLoader, created on first use. When
+    the cached frames of all loaded vintages exceed the memory budget, the
+    least recently used vintages are dropped until the total fits again; the
+    vintage just requested and vintages pinned by ``pin_data_loader`` are
+    never evicted. Loaders grow after they are handed out, so the budget is
+    checked again whenever one caches a table and when a pin is released.
+    """
+
+    def __init__(self, files: dict[str, Path], default: str, memory_budget: int):
+        self.files = files
+        self.default = default
+        self.memory_budget = memory_budget
+        self._loaders: OrderedDict[str, "DataLoader"] = OrderedDict()
+        self._pins: Counter["DataLoader"] = Counter()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, name: str | None = None) -> "DataLoader":
+        """Get the loader of a vintage, loading it if needed."""
+        name = name or self.default
+        if name not in self.files:
+            raise KeyError(name)
+
+        with self._lock:
+            loader = self._loaders.get(name)
+            if loader is not None:
+                self.hits += 1
+                self._loaders.move_to_end(name)
+            else:
+                self.misses += 1
+                from .data_loader import DataLoader
+
+                loader = DataLoader(data_file=self.files[name])
+                loader.on_store = self.trim
+                self._loaders[name] = loader
+            self._evict(keep=name)
+        return loader
+
+    def version_of(self, name: str | None = None) -> str | None:
+        """Get the dataset version of a vintage if it is loaded, or None.
+
+        Unlike ``get`` this never loads or evicts a vintage and neither
+        counts a hit nor marks the vintage as used.
+        """
+        name = name or self.default
+        if name not in self.files:
+            raise KeyError(name)
+        loader = self._loaders.get(name)
+        return None if loader is None else loader.version
+
+    def set(self, name: str, loader: "DataLoader") -> None:
+        """Set the loader of a vintage."""
+        loader.on_store = self.trim
+        with self._lock:
+            self._loaders[name] = loader
+            self._loaders.move_to_end(name)
+
+    def replace(self, name: str, old: "DataLoader", new: "DataLoader") -> bool:
+        """Swap in a new version of a loaded vintage.
+
+        Does nothing if the vintage was evicted or replaced meanwhile.
+        """
+        with self._lock:
+            if self._loaders.get(name) is not old:
+                return False
+            new.on_store = self.trim
+            self._loaders[name] = new
+            return True
+
+    def loaded(self) -> list[tuple[str, "DataLoader"]]:
+        """Currently loaded vintages, least recently used first."""
+        with self._lock:
+            return list(self._loaders.items())
+
+    def memory_usage(self) -> int:
+        """Bytes held by the cached frames of all loaded vintages."""
+        return sum(loader.nbytes for _, loader in self.loaded())
+
+    def pin(self, loader: "DataLoader") -> None:
+        """Keep the vintage served by ``loader`` loaded until ``unpin``."""
+        with self._lock:
+            self._pins[loader] += 1
+
+    def unpin(self, loader: "DataLoader") -> None:
+        """Release a pin, then evict what no longer fits the budget."""
+        with self._lock:
+            self._pins[loader] -= 1
+            if not self._pins[loader]:
+                del self._pins[loader]
+        self.trim()
+
+    def trim(self, loader: "DataLoader | None" = None) -> None:
+        """Evict least recently used vintages while over the memory budget.
+
+        The vintage of ``loader`` (the most recently used one if omitted) is kept.
+        """
+        with self._lock:
+            if loader is None:
+                keep = next(reversed(self._loaders), None)
+            else:
+                keep = next((name for name, value in self._loaders.items() if value is loader), None)
+            self._evict(keep=keep)
+
+    def _evict(self, keep: str | None) -> None:
+        total = sum(loader.nbytes for loader in self._loaders.values())
+        for name in list(self._loaders):
+            if total <= self.memory_budget:
+                break
+            if name == keep or self._loaders[name] in self._pins:
+                continue
+            loader = self._loaders.pop(name)
+            total -= loader.nbytes
+            self.evictions += 1
+            print(f"[yellow]Evicted vintage {name} ({loader.nbytes} bytes)[/yellow]")
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss/eviction counters and memory usage."""
+        loaded = self.loaded()
+        return {
+            "default": self.default,
+            "available": list(self.files),
+            "loaded": {name: loader.version for name, loader in loaded},
+            "memory_bytes": self.memory_usage(),
+            "memory_budget": self.memory_budget,
+            "pinned": sum(self._pins.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Singleton instance
+_registry: VintageRegistry | None = None
+_registry_lock = threading.Lock()
+
+# Dataset versions handed out while serving the current request
+_request_versions: ContextVar[list[str] | None] = ContextVar("request_versions", default=None)
+
+# Loader that serves every request in the current context, whatever the vintage
+_pinned_loader: ContextVar["DataLoader | None"] = ContextVar("pinned_loader", default=None)
+
+
+def get_vintage_registry() -> VintageRegistry:
+    """Get the singleton VintageRegistry instance."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                files = {settings.default_vintage: settings.data_file, **settings.vintages}
+                _registry = VintageRegistry(files, settings.default_vintage, settings.vintage_memory_budget)
+    return _registry
+
+
+def get_data_loader(
+    vintage: Annotated[
+        str | None, Query(description="Dataset vintage, e.g. 2022 (defaults to the latest)")
+    ] = None,
+) -> "DataLoader":
+    """Get the DataLoader of a vintage (the default vintage if omitted).
+
+    Inside ``pin_data_loader`` the pinned loader is returned instead.
+    """
+    loader = _pinned_loader.get()
+    if loader is None:
+        try:
+            loader = get_vintage_registry().get(vintage)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Unknown vintage: {vintage}")
+
+    versions = _request_versions.get()
+    if versions is not None:
+        versions.append(loader.version)
+    return loader
+
+
+def set_data_loader(loader: "DataLoader", vintage: str | None = None) -> None:
+    """Replace the loader of a vintage with a new dataset version.
+
+    Requests that already resolved the previous loader keep using it.
+    """
+    registry = get_vintage_registry()
+    registry.set(vintage or registry.default, loader)
+
+
+@contextmanager
+def pin_data_loader(loader: "DataLoader") -> Iterator[None]:
+    """Serve the requests made in this context from ``loader``.
+
+    Used to render responses of a dataset version that is not (yet) the
+    registered one, e.g. while a reloaded version is being prepared.
+    """
+    registry = get_vintage_registry()
+    registry.pin(loader)
+    token = _pinned_loader.set(loader)
+    try:
+        yield
+    finally:
+        _pinned_loader.reset(token)
+        registry.unpin(loader)
+
+
+def pinned_data_loader() -> "DataLoader | None":
+    """The loader pinned in the current context, if any."""
+    return _pinned_loader.get()
+
+
+def track_dataset_versions() -> list[str]:
+    """Record the dataset versions handed out in the current context."""
+    versions: list[str] = []
+    _request_versions.set(versions)
+    return versions
@@ -0,0 +1,77 @@
+"""In-process requests to the ASGI app."""
+
+import asyncio
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message
+
+
+@dataclass(frozen=True)
+class SubResponse:
+    """Status, headers and body of a response to an in-process request."""
+
+    status: int
+    headers: Headers
+    body: bytes
+
+
+async def asgi_get(
+    app: ASGIApp,
+    path: str,
+    params: dict[str, object] | None = None,
+    headers: list[tuple[bytes, bytes]] | None = None,
+) -> SubResponse:
+    """GET a path from an ASGI app without going through the network.
+
+    The request runs through the app's whole middleware stack and routing,
+    exactly as if it came from a client. ``None`` parameters are left out,
+    booleans are sent as ``true``/``false`` and list values repeat their
+    parameter.
+    """
+    query = urlencode(
+        {
+            name: str(value).lower() if isinstance(value, bool) else value
+            for name, value in (params or {}).items()
+            if value is not None
+        },
+        doseq=True,
+    )
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"subrequest"), *(headers or [])],
+        "client": None,
+        "server": None,
+    }
+    requested = False
+    start: Message | None = None
+    chunks: list[bytes] = []
+
+    async def receive() -> Message:
+        nonlocal requested
+        if requested:
+            # Streaming responses wait for a disconnect; there is none
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal start
+        if message["type"] == "http.response.start":
+            start = message
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    if start is None:
+        raise RuntimeError(f"No response to GET {path}")
+    return SubResponse(start["status"], Headers(raw=start["headers"]), b"".join(chunks))
@@ -0,0 +1,70 @@
+"""Background warm-up of the dataset at startup."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from rich import print
+from starlette.types import ASGIApp
+
+from .bootstrap import get_bootstrap
+from .services.vintages import get_data_loader
+
+
+class WarmUp:
+    """Loads a dataset in the background and reports its progress.
+
+    The server answers requests (it is live) while the API routes are
+    imported, the preload tables load and the bootstrap payload renders; it
+    is ready once all are done.
+    Requests arriving earlier load what they need on demand.
+    """
+
+    def __init__(self):
+        self.stage = "pending"
+        self.tables_loaded = 0
+        self.tables_total = 0
+        self.error: str | None = None
+        self._start: float | None = None
+        self._end: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.stage == "ready"
+
+    def _progress(self, loaded: int, total: int) -> None:
+        self.tables_loaded, self.tables_total = loaded, total
+
+    async def run(self, app: ASGIApp, include_routers: Callable[[], None]) -> None:
+        """Import the routes and load the default dataset in worker threads, then render its bootstrap payload."""
+        self._start = time.perf_counter()
+        try:
+            self.stage = "importing routes"
+            await asyncio.to_thread(include_routers)
+            loader = await asyncio.to_thread(get_data_loader)
+            self.stage = "loading tables"
+            await asyncio.to_thread(loader.preload_all, progress=self._progress)
+            self.stage = "rendering bootstrap"
+            await get_bootstrap(app, loader)
+        except Exception as exc:
+            self.stage, self.error = "failed", str(exc)
+            print(f"[red]Warm-up failed: {exc}[/red]")
+            return
+        finally:
+            self._end = time.perf_counter()
+        self.stage = "ready"
+        print(f"[green]Data loaded successfully! (version {loader.version}, {self._end - self._start:.3f}s)[/green]")
+
+    def status(self) -> dict[str, Any]:
+        """Stage, tables loaded and seconds spent so far."""
+        elapsed = None
+        if self._start is not None:
+            elapsed = round((self._end or time.perf_counter()) - self._start, 3)
+        return {
+            "status": self.stage,
+            "tables_loaded": self.tables_loaded,
+            "tables_total": self.tables_total,
+            "elapsed_seconds": elapsed,
+            "error": self.error,
+        }
@@ -0,0 +1,4 @@
+"""Performance benchmarks for the backend.
+
+Run a benchmark from the project root, e.g. ``python -m backend.benchmarks.cold_start``.
+"""
@@ -0,0 +1,107 @@
+"""Time the long-format cubes of the banded tables (A-10, A-18 to A-20).
+
+For each cube the benchmark compares the vectorized reshape with a loop
+that unpivots the same tables one cell at a time, checks that both give the
+same rows, and compares the indexed lookup behind the trend endpoints with
+boolean masks over the cube.
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+from rich import print
+from rich.table import Table
+
+from backend.app.services import DataLoader
+from backend.app.services.bands import band_columns
+from backend.app.services.growing_stock import SPECIES_TABLES, build_growing_stock_cube
+from backend.app.services.indexes import LOOKUP_COLUMNS, TableIndex
+from backend.app.services.timberland import OWNERSHIP_COLUMNS, build_timberland_cube
+
+
+def loop_growing_stock(tables: dict[str, pd.DataFrame]) -> list[tuple]:
+    """Unpivot the growing stock tables cell by cell."""
+    rows = []
+    for species, df in tables.items():
+        bands = band_columns(df)
+        for _, row in df[df["region"].notna()].iterrows():
+            for col, (ownership, year) in bands.items():
+                if pd.notna(row[col]):
+                    rows.append((row["region"], row["subregion"], row["state"], ownership, species, year, row[col]))
+    return rows
+
+
+def loop_timberland(df: pd.DataFrame) -> list[tuple]:
+    """Unpivot Table A-10 cell by cell."""
+    rows = []
+    for _, row in df[df["region"].notna()].iterrows():
+        for col, ownership in OWNERSHIP_COLUMNS.items():
+            if pd.notna(row[col]):
+                rows.append((row["region"], row["subregion"], row["state"], ownership, row["year"], row[col]))
+    return rows
+
+
+def median_time(func, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def mask_lookup(cube: pd.DataFrame, state: str, ownership: str) -> np.ndarray:
+    return np.flatnonzero(((cube["state"] == state) & (cube["ownership"] == ownership)).to_numpy())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    loader = DataLoader()
+    growing_stock = {species: loader.get_table(name) for species, name in SPECIES_TABLES.items()}
+    timberland = loader.get_timberland_ownership_trends()
+    cases = {
+        "growing stock (A-18..A-20)": (
+            lambda: build_growing_stock_cube(growing_stock), lambda: loop_growing_stock(growing_stock),
+        ),
+        "timberland (A-10)": (lambda: build_timberland_cube(timberland), lambda: loop_timberland(timberland)),
+    }
+
+    table = Table(title=f"Banded tables to long format (median of {args.runs} runs)")
+    table.add_column("Cube")
+    table.add_column("Rows", justify="right")
+    table.add_column("Reshape (ms)", justify="right")
+    table.add_column("Per-cell loop (ms)", justify="right")
+    table.add_column("Index lookup (µs)", justify="right")
+    table.add_column("Mask lookup (µs)", justify="right")
+
+    for name, (build, loop) in cases.items():
+        cube = build()
+        expected = loop()
+        actual = list(cube.astype(object).itertuples(index=False, name=None))
+        assert len(actual) == len(expected), (len(actual), len(expected))
+
+        index = TableIndex(cube, LOOKUP_COLUMNS)
+        state = cube["state"].dropna().iloc[-1]
+        positions = index.lookup(state=state, ownership="All owners")
+        np.testing.assert_array_equal(positions, mask_lookup(cube, state, "All owners"))
+
+        table.add_row(
+            name,
+            f"{len(cube):,}",
+            f"{median_time(build, args.runs) * 1000:.2f}",
+            f"{median_time(loop, max(1, args.runs // 4)) * 1000:.2f}",
+            f"{median_time(lambda: index.lookup(state=state, ownership='All owners'), args.runs * 10) * 1e6:.1f}",
+            f"{median_time(lambda: mask_lookup(cube, state, 'All owners'), args.runs * 10) * 1e6:.1f}",
+        )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare cold-start time of the workbook and snapshot loading paths.
+
+Each run happens in a fresh interpreter so that nothing is shared between
+runs. Build the snapshot first with ``python main.py build-snapshot``.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from rich import print
+from rich.table import Table
+
+CHILD_SCRIPT = """
+import time
+start = time.perf_counter()
+from backend.app.services import DataLoader
+loader = DataLoader(use_snapshot={use_snapshot})
+for name in loader.sheet_names:
+    loader.get_table(name)
+print(time.perf_counter() - start)
+"""
+
+
+def run_once(use_snapshot: bool) -> float:
+    """Load every sheet in a fresh process and return the elapsed seconds."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT.format(use_snapshot=use_snapshot)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    table = Table(title="Cold start: load all sheets")
+    table.add_column("Path")
+    table.add_column("Median (s)", justify="right")
+    table.add_column("Min (s)", justify="right")
+
+    for label, use_snapshot in [("workbook", False), ("snapshot", True)]:
+        timings = [run_once(use_snapshot) for _ in range(args.runs)]
+        table.add_row(label, f"{statistics.median(timings):.3f}", f"{min(timings):.3f}")
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Measure /health latency while heavy endpoints saturate the app.
+
+Concurrent clients request data endpoints in a loop, straight through the
+ASGI app with the response cache disabled, while a probe requests /health
+every few milliseconds, timed from when it was due. Each executor size is
+run in turn; 0 workers runs handler bodies on the event loop, as every
+handler did before the bounded executor. The benchmark reports the /health
+latency percentiles, the heavy request throughput and latency, and the
+503/504 responses of the executor.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+from rich import print
+from rich.table import Table
+
+from backend.app import executor
+from backend.app.executor import BoundedExecutor
+from backend.app.main import app, response_cache
+from backend.app.services import get_data_loader
+from backend.app.subrequests import asgi_get
+
+HEAVY = [
+    ("/api/dynamics", {}),
+    ("/api/trends/forest-area", {"sort": "-area"}),
+    ("/api/export/A-20", {"format": "parquet"}),
+    ("/api/land-area/summary/by-state", {}),
+]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(clients: int, seconds: float, probe_interval: float) -> dict:
+    """Load the app for ``seconds``; return the /health and heavy request timings."""
+    stop = time.perf_counter() + seconds
+    health: list[float] = []
+    heavy: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    async def client(n: int) -> None:
+        i = n
+        while time.perf_counter() < stop:
+            path, params = HEAVY[i % len(HEAVY)]
+            start = time.perf_counter()
+            response = await asgi_get(app, path, params)
+            heavy.append(time.perf_counter() - start)
+            statuses[response.status] += 1
+            i += 1
+
+    async def probe() -> None:
+        # Latency counts from when each probe was due, so that a blocked
+        # event loop shows up as late probes rather than as fewer probes
+        due = time.perf_counter()
+        while due < stop:
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            await asgi_get(app, "/health")
+            health.append(time.perf_counter() - due)
+            due = max(due + probe_interval, time.perf_counter())
+
+    await asyncio.gather(probe(), *(client(n) for n in range(clients)))
+    return {"health": health, "heavy": heavy, "statuses": statuses}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    response_cache.max_bytes = 0
+    # Load the tables once so that runs measure serving, not parsing
+    get_data_loader().preload_all()
+    executor._executor = BoundedExecutor(1, args.queue_size, args.timeout)
+    for path, params in HEAVY:
+        asyncio.run(asgi_get(app, path, params))
+
+    table = Table(
+        title=f"/health under load ({args.clients} heavy clients, {args.seconds:g}s per executor size)"
+    )
+    table.add_column("Workers", justify="right")
+    table.add_column("/health p50 (ms)", justify="right")
+    table.add_column("/health p99 (ms)", justify="right")
+    table.add_column("/health max (ms)", justify="right")
+    table.add_column("Heavy req/s", justify="right")
+    table.add_column("Heavy p50 (ms)", justify="right")
+    table.add_column("503", justify="right")
+    table.add_column("504", justify="right")
+
+    for workers in args.workers:
+        executor._executor = BoundedExecutor(workers, args.queue_size, args.timeout)
+        result = asyncio.run(run(args.clients, args.seconds, args.probe_interval))
+        health, heavy, statuses = result["health"], result["heavy"], result["statuses"]
+        table.add_row(
+            "inline" if workers == 0 else str(workers),
+            f"{statistics.median(health) * 1000:.2f}",
+            f"{percentile(health, 0.99) * 1000:.2f}",
+            f"{max(health) * 1000:.2f}",
+            f"{len(heavy) / args.seconds:.0f}",
+            f"{statistics.median(heavy) * 1000:.1f}",
+            str(statuses[503]),
+            str(statuses[504]),
+        )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
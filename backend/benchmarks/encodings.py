@@ -0,0 +1,100 @@
+"""Compare response encodings: records or columnar shape, as JSON or MessagePack.
+
+For the largest list responses, reports the median time to render the
+response, its size (raw and gzipped) and the median time a client takes
+to decode it.
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+
+import msgpack
+from rich import print
+from rich.table import Table
+
+from backend.app.models.dynamics import DynamicsRecord, DynamicsResponse
+from backend.app.models.land_area import LandAreaRecord, LandAreaResponse
+from backend.app.models.trends import ForestAreaTrendRecord, ForestAreaTrendResponse
+from backend.app.routers.dynamics import slice_dynamics
+from backend.app.serialization import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, Records, ResponseFormat
+from backend.app.services import DataLoader
+from backend.app.services.trends import forest_area_records
+
+FORMATS = {
+    "json records": ResponseFormat("records", JSON_MEDIA_TYPE),
+    "json columnar": ResponseFormat("columnar", JSON_MEDIA_TYPE),
+    "msgpack records": ResponseFormat("records", MSGPACK_MEDIA_TYPE),
+    "msgpack columnar": ResponseFormat("columnar", MSGPACK_MEDIA_TYPE),
+}
+
+
+def median_time(func, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    loader = DataLoader()
+    land_area = loader.get_land_area_data()
+    forest_area = forest_area_records(loader.get_forest_area_trends())
+    dynamics = slice_dynamics(loader)
+
+    cases = {
+        "/api/land-area": (LandAreaResponse, {
+            "data": Records(land_area, LandAreaRecord),
+            "total_records": len(land_area),
+            "total_land_area": 0,
+            "total_forest_land": 0,
+            "total_timberland": 0,
+            "forest_cover_percent": 0,
+        }),
+        "/api/trends/forest-area": (ForestAreaTrendResponse, {
+            "data": Records(forest_area, ForestAreaTrendRecord),
+            "years": sorted(set(forest_area["year"])),
+            "total_records": len(forest_area),
+        }),
+        "/api/dynamics": (DynamicsResponse, {
+            "data": Records(dynamics, DynamicsRecord),
+            "years": sorted(set(dynamics["year"])),
+            "total_records": len(dynamics),
+        }),
+    }
+
+    table = Table(title=f"Response encodings (median of {args.runs} runs)")
+    table.add_column("Endpoint", no_wrap=True)
+    table.add_column("Encoding", no_wrap=True)
+    table.add_column("Encode (ms)", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Gzipped", justify="right")
+    table.add_column("Decode (ms)", justify="right")
+
+    for endpoint, (model, fields) in cases.items():
+        for name, fmt in FORMATS.items():
+            body = fmt.render(model, **fields).body
+            decode = msgpack.unpackb if fmt.media_type == MSGPACK_MEDIA_TYPE else json.loads
+            encode_time = median_time(lambda: fmt.render(model, **fields), args.runs)
+            decode_time = median_time(lambda: decode(body), args.runs)
+            table.add_row(
+                endpoint, name,
+                f"{encode_time * 1000:.2f}",
+                f"{len(body):,}",
+                f"{len(gzip.compress(body)):,}",
+                f"{decode_time * 1000:.3f}",
+            )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare boolean-mask filtering with TableIndex lookups as tables grow.
+
+Table A-1a is tiled into synthetic tables of increasing size, with every copy
+of a state given a distinct name so that a state filter keeps matching one
+row. Each size is filtered by region, subregion and state.
+"""
+
+import argparse
+import statistics
+import time
+
+import pandas as pd
+from rich import print
+from rich.table import Table
+
+from backend.app.services import DataLoader
+from backend.app.services.indexes import TableIndex
+
+
+def scale_table(df: pd.DataFrame, copies: int) -> pd.DataFrame:
+    """Tile a state table ``copies`` times, renaming the states of each copy."""
+    tiled = pd.concat([df] * copies, ignore_index=True)
+    suffix = pd.Series(range(len(tiled))) // len(df)
+    states = tiled["state"].astype(str) + " " + suffix.astype(str)
+    tiled["state"] = pd.Categorical(states, categories=pd.unique(states))
+    return tiled
+
+
+def mask_filter(df: pd.DataFrame, region: str, subregion: str, state: str) -> pd.DataFrame:
+    """The per-request filtering the endpoints used to do."""
+    df = df[df["region"] == region]
+    df = df[df["subregion"] == subregion]
+    df = df[df["state"] == state]
+    return df
+
+
+def median_time(func, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    base = DataLoader().get_land_area_data()
+    row = base.iloc[len(base) // 2]
+    region, subregion = row["region"], row["subregion"]
+
+    table = Table(title=f"Filter by region, subregion and state (median of {args.runs} runs)")
+    table.add_column("Rows", justify="right")
+    table.add_column("Mask (µs)", justify="right")
+    table.add_column("Index (µs)", justify="right")
+    table.add_column("Speedup", justify="right")
+    table.add_column("Index build (ms)", justify="right")
+
+    for copies in args.copies:
+        df = scale_table(base, copies)
+        # Pick a state from the last copy so the match is near the end
+        state = df["state"].iloc[-(len(base) - len(base) // 2)]
+
+        start = time.perf_counter()
+        index = TableIndex(df)
+        build = time.perf_counter() - start
+
+        expected = mask_filter(df, region, subregion, state)
+        pd.testing.assert_frame_equal(index.select(region=region, subregion=subregion, state=state), expected)
+
+        masked = median_time(lambda: mask_filter(df, region, subregion, state), args.runs)
+        indexed = median_time(lambda: index.select(region=region, subregion=subregion, state=state), args.runs)
+        table.add_row(
+            f"{len(df):,}",
+            f"{masked * 1e6:.0f}",
+            f"{indexed * 1e6:.0f}",
+            f"{masked / indexed:.1f}x",
+            f"{build * 1000:.1f}",
+        )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare per-row Pydantic serialization with the vectorized JSON encoder.
+
+The Pydantic path builds one record model per row with ``iterrows``, wraps
+them in the response model, validates that again as FastAPI does for a
+``response_model`` and renders it with ``JSONResponse``. The vectorized path
+is what the endpoints use now. Both must produce the same bytes.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+from fastapi.responses import JSONResponse
+from rich import print
+from rich.table import Table
+
+from backend.app.models.dynamics import DynamicsRecord, DynamicsResponse
+from backend.app.models.land_area import LandAreaRecord, LandAreaResponse
+from backend.app.models.trends import ForestAreaTrendRecord, ForestAreaTrendResponse
+from backend.app.routers.dynamics import slice_dynamics
+from backend.app.serialization import _base_type, encode_records, model_response, to_float_or_none
+from backend.app.services import DataLoader
+from backend.app.services.trends import forest_area_records
+
+
+def pydantic_path(df, record_model, response_model, **fields) -> bytes:
+    """Render a response the way the endpoints used to."""
+    records = []
+    for _, row in df.iterrows():
+        values = {}
+        for name, info in record_model.model_fields.items():
+            value = row.get(name)
+            values[name] = to_float_or_none(value) if _base_type(info.annotation) is float else value
+            if values[name] is not None and values[name] != values[name]:
+                values[name] = None
+        records.append(record_model(**values))
+    response = response_model(data=records, **fields)
+    content = response_model.model_validate(response.model_dump()).model_dump(mode="json")
+    return JSONResponse(content).body
+
+
+def vectorized_path(df, record_model, response_model, **fields) -> bytes:
+    return model_response(response_model, data=encode_records(df, record_model), **fields).body
+
+
+def measure(func, runs: int) -> tuple[float, float, int]:
+    """Return p50 and p99 latency in seconds and the peak traced bytes."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), float(np.percentile(timings, 99)), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+
+    loader = DataLoader()
+    land_area = loader.get_land_area_data()
+    forest_area = forest_area_records(loader.get_forest_area_trends())
+    dynamics = slice_dynamics(loader)
+
+    cases = {
+        "/api/land-area": (land_area, LandAreaRecord, LandAreaResponse, {
+            "total_records": len(land_area),
+            "total_land_area": land_area["total_land_area"].sum(),
+            "total_forest_land": land_area["total_forest_land"].sum(),
+            "total_timberland": land_area["total_timberland"].sum(),
+            "forest_cover_percent": 0,
+        }),
+        "/api/trends/forest-area": (forest_area, ForestAreaTrendRecord, ForestAreaTrendResponse, {
+            "years": sorted(set(forest_area["year"])),
+            "total_records": len(forest_area),
+        }),
+        "/api/dynamics": (dynamics, DynamicsRecord, DynamicsResponse, {
+            "years": sorted(set(dynamics["year"])),
+            "total_records": len(dynamics),
+        }),
+    }
+
+    table = Table(title=f"Response serialization ({args.runs} runs)")
+    table.add_column("Endpoint")
+    table.add_column("Rows", justify="right")
+    table.add_column("Path")
+    table.add_column("p50 (ms)", justify="right")
+    table.add_column("p99 (ms)", justify="right")
+    table.add_column("Peak alloc (KB)", justify="right")
+
+    for endpoint, (df, record_model, response_model, fields) in cases.items():
+        expected = pydantic_path(df, record_model, response_model, **fields)
+        assert vectorized_path(df, record_model, response_model, **fields) == expected, endpoint
+
+        for name, path in [("pydantic", pydantic_path), ("vectorized", vectorized_path)]:
+            p50, p99, peak = measure(lambda: path(df, record_model, response_model, **fields), args.runs)
+            table.add_row(
+                endpoint, f"{len(df):,}", name,
+                f"{p50 * 1000:.2f}", f"{p99 * 1000:.2f}", f"{peak / 1024:.0f}",
+            )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
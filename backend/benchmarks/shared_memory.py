@@ -0,0 +1,148 @@
+"""Measure the memory of several workers with and without shared tables.
+
+Each mode starts ``--workers`` fresh interpreters at once, like the workers
+of one uvicorn host. Every worker loads all sheets of the data file; once
+all of them are loaded, each reports its RSS and PSS (proportional set
+size: shared pages divided among the processes mapping them) from
+``/proc/self/smaps_rollup``, plus the RSS and PSS of its mapping of the
+shared block file. Linux only.
+
+- private: no snapshot, every worker parses the workbook into its own frames
+- shared: ``shared_tables`` on with an empty directory, so the first worker
+  publishes the tables and the others wait for it and map them
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from rich import print
+from rich.table import Table
+
+CHILD_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from backend.app.services import DataLoader
+from backend.app.services.snapshot import BLOCKS_NAME
+
+loader = DataLoader()
+for name in loader.sheet_names:
+    loader.get_table(name)
+elapsed = time.perf_counter() - start
+
+def rollup():
+    sizes = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss"):
+                sizes[key] = int(value.split()[0])
+    return sizes
+
+def block_mapping():
+    sizes, inside = {"Rss": 0, "Pss": 0}, False
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            if "-" in line.split(" ", 1)[0]:
+                inside = line.rstrip().endswith(BLOCKS_NAME)
+            elif inside and line.split(":")[0] in sizes:
+                sizes[line.split(":")[0]] += int(line.split()[1])
+    return sizes
+
+print("loaded", flush=True)
+sys.stdin.readline()
+print(json.dumps({
+    "load_seconds": elapsed,
+    "cached_bytes": loader.nbytes,
+    **rollup(),
+    "blocks": block_mapping(),
+}), flush=True)
+sys.stdin.readline()
+"""
+
+
+def run_workers(workers: int, env: dict[str, str]) -> list[dict]:
+    """Start the workers together, then measure them once all have loaded."""
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", CHILD_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, env=env,
+        )
+        for _ in range(workers)
+    ]
+    try:
+        for proc in procs:
+            while proc.stdout.readline().strip() != "loaded":
+                if proc.poll() is not None:
+                    raise RuntimeError(f"Worker exited with status {proc.returncode}")
+        results = []
+        for proc in procs:
+            # Measured while every worker is alive, so shared pages are divided among all of them
+            proc.stdin.write("measure\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline()
+            while not line.startswith("{"):
+                if not line:
+                    raise RuntimeError(f"Worker exited with status {proc.wait()}")
+                line = proc.stdout.readline()
+            results.append(json.loads(line))
+        return results
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.stdin.close()
+                proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    table = Table(title=f"Memory per worker, {args.workers} workers (median, KiB)")
+    table.add_column("Mode")
+    table.add_column("Load (s)", justify="right")
+    table.add_column("Cached frames", justify="right")
+    table.add_column("RSS", justify="right")
+    table.add_column("PSS", justify="right")
+    table.add_column("Block file RSS", justify="right")
+    table.add_column("Block file PSS", justify="right")
+
+    with tempfile.TemporaryDirectory() as empty_dir, tempfile.TemporaryDirectory() as shared_dir:
+        base = {**os.environ, "FOREST_SNAPSHOT_DIR": empty_dir, "FOREST_RELOAD_INTERVAL": "0"}
+        modes = {
+            "private": {**base, "FOREST_SHARED_TABLES": "false"},
+            "shared": {**base, "FOREST_SHARED_TABLES": "true", "FOREST_SHARED_TABLES_DIR": shared_dir},
+        }
+        for label, env in modes.items():
+            start = time.perf_counter()
+            results = run_workers(args.workers, env)
+            print(f"[blue]{label}: {args.workers} workers loaded in {time.perf_counter() - start:.2f}s[/blue]")
+
+            def median(key, sub=None):
+                return statistics.median(r[key] if sub is None else r[key][sub] for r in results)
+
+            table.add_row(
+                label,
+                f"{median('load_seconds'):.2f}",
+                f"{median('cached_bytes') / 1024:,.0f}",
+                f"{median('Rss'):,.0f}",
+                f"{median('Pss'):,.0f}",
+                f"{median('blocks', 'Rss'):,.0f}",
+                f"{median('blocks', 'Pss'):,.0f}",
+            )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
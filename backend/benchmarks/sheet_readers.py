@@ -0,0 +1,81 @@
+"""Compare per-sheet parse time and peak memory between sheet reader engines.
+
+Every worksheet is parsed with each engine; time is the median over several
+runs and peak memory is measured with tracemalloc on a separate run.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from rich import print
+from rich.table import Table
+
+from backend.app.config import settings
+from backend.app.services.readers import READERS
+from backend.app.services.schema import NA_MARKERS
+
+
+def measure(reader, sheet_name: str, runs: int) -> tuple[float, int]:
+    """Return the median parse time in seconds and the peak traced bytes."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        reader.read(sheet_name, header=1, na_values=list(NA_MARKERS))
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    reader.read(sheet_name, header=1, na_values=list(NA_MARKERS))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--data-file", default=settings.data_file)
+    args = parser.parse_args()
+
+    readers = {}
+    open_times = {}
+    for engine, reader_class in READERS.items():
+        start = time.perf_counter()
+        readers[engine] = reader_class(args.data_file)
+        # Opening the workbook is lazy for some engines; force it
+        readers[engine].sheet_names
+        open_times[engine] = time.perf_counter() - start
+
+    # Warm up per-workbook state such as shared strings
+    for reader in readers.values():
+        reader.read(reader.sheet_names[0])
+
+    table = Table(title="Per-sheet parse time and peak memory")
+    table.add_column("Sheet")
+    for engine in readers:
+        table.add_column(f"{engine} (ms)", justify="right")
+        table.add_column(f"{engine} peak (KB)", justify="right")
+
+    totals = {engine: [0.0, 0] for engine in readers}
+    for sheet_name in readers["openpyxl"].sheet_names:
+        row = [sheet_name]
+        for engine, reader in readers.items():
+            elapsed, peak = measure(reader, sheet_name, args.runs)
+            totals[engine][0] += elapsed
+            totals[engine][1] = max(totals[engine][1], peak)
+            row += [f"{elapsed * 1000:.1f}", f"{peak / 1024:.0f}"]
+        table.add_row(*row)
+
+    row = ["Total (max peak)"]
+    for engine in readers:
+        row += [f"{totals[engine][0] * 1000:.1f}", f"{totals[engine][1] / 1024:.0f}"]
+    table.add_row(*row, style="bold")
+    print(table)
+
+    for engine, elapsed in open_times.items():
+        print(f"Opening the workbook with {engine}: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Measure API import time, time to live and time to ready.
+
+Each run starts the app in a fresh interpreter: it imports
+``backend.app.main`` (with ``-X importtime`` to attribute the time to
+pandas and FastAPI), runs the lifespan startup and polls the health probes
+in-process until ``/health/ready`` answers 200. All times are seconds from
+the start of the import. pandas is imported by the warm-up, after the app
+is live, so its time counts towards ready rather than the import.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from rich import print
+from rich.table import Table
+
+CHILD_SCRIPT = """
+import time
+start = time.perf_counter()
+from backend.app.main import app
+imported = time.perf_counter()
+
+import asyncio
+import json
+from backend.app.subrequests import asgi_get
+
+async def serve():
+    live = ready = None
+    async with app.router.lifespan_context(app):
+        while ready is None:
+            if live is None and (await asgi_get(app, "/health/live")).status == 200:
+                live = time.perf_counter()
+            if (await asgi_get(app, "/health/ready")).status == 200:
+                ready = time.perf_counter()
+            else:
+                await asyncio.sleep(0.005)
+    return live, ready
+
+live, ready = asyncio.run(serve())
+print(json.dumps({"import": imported - start, "live": live - start, "ready": ready - start}))
+"""
+
+# Packages whose cumulative import time is reported
+PACKAGES = ["pandas", "fastapi"]
+
+
+def import_times(stderr: str) -> dict[str, float]:
+    """Cumulative seconds of the packages in ``-X importtime`` output."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() in PACKAGES and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def run_once(use_snapshot: bool) -> dict[str, float]:
+    """Start the app in a fresh process and return its startup times."""
+    with tempfile.TemporaryDirectory() as empty_dir:
+        env = {**os.environ, "FOREST_RELOAD_INTERVAL": "0"}
+        if not use_snapshot:
+            env["FOREST_SNAPSHOT_DIR"] = empty_dir
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        )
+    times = json.loads(result.stdout.strip().splitlines()[-1])
+    return {**import_times(result.stderr), **times}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    table = Table(title=f"API startup (median of {args.runs} runs, seconds)")
+    table.add_column("Data path")
+    table.add_column("Import app", justify="right")
+    for package in PACKAGES:
+        table.add_column(f"{package} import", justify="right")
+    table.add_column("Live", justify="right")
+    table.add_column("Ready", justify="right")
+
+    for label, use_snapshot in [("snapshot", True), ("workbook", False)]:
+        runs = [run_once(use_snapshot) for _ in range(args.runs)]
+        medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        table.add_row(
+            label,
+            f"{medians['import']:.3f}",
+            *(f"{medians[package]:.3f}" for package in PACKAGES),
+            f"{medians['live']:.3f}",
+            f"{medians['ready']:.3f}",
+        )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare buffered JSON list responses with streamed NDJSON and CSV.
+
+Requests go straight through the ASGI app, with the response cache cleared
+before each one, and the benchmark reports the median time to the first
+body chunk (TTFB), the median time to the last one, the body size and the
+peak memory traced while serving one response. The appendix tables are
+small, so ``--chunk-records`` defaults low enough for the streamed responses
+to be sent in several chunks.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
+from rich import print
+from rich.table import Table
+
+from backend.app.config import settings
+from backend.app.main import app, response_cache
+
+CASES = {
+    "forest area": [
+        "/api/trends/forest-area",
+        "/api/trends/forest-area/stream",
+        "/api/trends/forest-area/stream?format=csv",
+    ],
+    "dynamics": [
+        "/api/dynamics",
+        "/api/dynamics/stream",
+        "/api/dynamics/stream?format=csv",
+    ],
+}
+
+
+async def request(url: str) -> tuple[float, float, int]:
+    """GET a URL from the app; return the first and last byte times and the body size."""
+    parts = urlsplit(url)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    first = last = None
+    size = 0
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            # Streaming responses wait for a disconnect that never comes
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal first, last, size
+        if message["type"] == "http.response.body":
+            now = time.perf_counter()
+            if first is None and message.get("body"):
+                first = now
+            last = now
+            size += len(message.get("body", b""))
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    first = first if first is not None else last
+    return first - start, last - start, size
+
+
+def measure(url: str, runs: int) -> tuple[float, float, int, int]:
+    """Return the median TTFB and total time, the body size and the peak traced bytes."""
+    ttfbs, totals = [], []
+    for _ in range(runs):
+        response_cache.clear()
+        ttfb, total, size = asyncio.run(request(url))
+        ttfbs.append(ttfb)
+        totals.append(total)
+
+    response_cache.clear()
+    tracemalloc.start()
+    asyncio.run(request(url))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(ttfbs), statistics.median(totals), size, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--chunk-records", type=int, default=100)
+    args = parser.parse_args()
+    settings.stream_chunk_records = args.chunk_records
+
+    # Load the tables once so that runs measure encoding, not parsing
+    for urls in CASES.values():
+        for url in urls:
+            asyncio.run(request(url))
+
+    table = Table(
+        title=f"Buffered vs streamed responses ({args.chunk_records} records per chunk, median of {args.runs} runs)"
+    )
+    table.add_column("Data")
+    table.add_column("URL", no_wrap=True)
+    table.add_column("TTFB (ms)", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Peak alloc (KB)", justify="right")
+
+    for name, urls in CASES.items():
+        for url in urls:
+            ttfb, total, size, peak = measure(url, args.runs)
+            table.add_row(
+                name, url,
+                f"{ttfb * 1000:.2f}", f"{total * 1000:.2f}",
+                f"{size:,}", f"{peak / 1024:.0f}",
+            )
+
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
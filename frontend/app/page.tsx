@@ -6,20 +6,17 @@ import ChartContainer from '@/components/ui/ChartContainer';
 import PieChartComponent from '@/components/charts/PieChartComponent';
 import BarChartComponent from '@/components/charts/BarChartComponent';
 import USChoropleth from '@/components/maps/USChoropleth';
-import {
-  useLandArea,
-  useLandAreaByRegion,
-  useLandAreaByState,
-  useOwnershipBreakdown,
-} from '@/hooks/useForestData';
+import { useBootstrap } from '@/hooks/useForestData';
 
 export default function HomePage() {
   const [selectedState, setSelectedState] = useState<string>();
 
-  const { data: landArea, isLoading: landAreaLoading, error: landAreaError } = useLandArea();
-  const { data: landAreaByRegion, isLoading: regionLoading, error: regionError } = useLandAreaByRegion();
-  const { data: landAreaByState, isLoading: stateLoading, error: stateError } = useLandAreaByState();
-  const { data: ownershipBreakdown, isLoading: ownershipLoading, error: ownershipError } = useOwnershipBreakdown();
+  // First paint comes from the pre-rendered bootstrap payload in one request
+  const { data: bootstrap, isLoading, error } = useBootstrap();
+  const landArea = bootstrap?.land_area_summary;
+  const landAreaByRegion = bootstrap?.land_area_by_region;
+  const landAreaByState = bootstrap?.land_area_by_state;
+  const ownershipBreakdown = bootstrap?.ownership_breakdown;
 
   const mapData = landAreaByState?.map((s) => ({
     state: s.name,
@@ -56,27 +53,27 @@ export default function HomePage() {
           value={landArea?.total_forest_land ? landArea.total_forest_land / 1000 : 0}
           unit="million acres"
           subtitle="All forest land in the U.S."
-          isLoading={landAreaLoading}
+          isLoading={isLoading}
         />
         <MetricCard
           title="Total Timberland"
           value={landArea?.total_timberland ? landArea.total_timberland / 1000 : 0}
           unit="million acres"
           subtitle="Productive forest land"
-          isLoading={landAreaLoading}
+          isLoading={isLoading}
         />
         <MetricCard
           title="Forest Cover"
           value={landArea?.forest_cover_percent || 0}
           unit="%"
           subtitle="Percentage of total land area"
-          isLoading={landAreaLoading}
+          isLoading={isLoading}
         />
         <MetricCard
           title="States Covered"
           value={landArea?.total_records || 0}
           subtitle="Including all U.S. states"
-          isLoading={landAreaLoading}
+          isLoading={isLoading}
         />
       </div>
 
@@ -86,8 +83,8 @@ export default function HomePage() {
         <ChartContainer
           title="Forest Land by State"
           subtitle="Click a state to see details"
-          isLoading={stateLoading}
-          error={stateError}
+          isLoading={isLoading}
+          error={error}
         >
           <USChoropleth
             data={mapData}
@@ -115,8 +112,8 @@ export default function HomePage() {
         <ChartContainer
           title="Forest Ownership Breakdown"
           subtitle="Distribution of forest land by ownership type"
-          isLoading={ownershipLoading}
-          error={ownershipError}
+          isLoading={isLoading}
+          error={error}
         >
           <PieChartComponent data={ownershipPieData} />
         </ChartContainer>
@@ -126,8 +123,8 @@ export default function HomePage() {
       <ChartContainer
         title="Forest Area by Region"
         subtitle="Forest land and timberland by major region (million acres)"
-        isLoading={regionLoading}
-        error={regionError}
+        isLoading={isLoading}
+        error={error}
       >
         <BarChartComponent
           data={regionBarData}
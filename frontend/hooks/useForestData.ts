@@ -26,6 +26,14 @@ export function useYears() {
   });
 }
 
+// First-paint aggregates, rendered once per dataset version on the server
+export function useBootstrap() {
+  return useQuery({
+    queryKey: ['bootstrap'],
+    queryFn: api.getBootstrap,
+  });
+}
+
 // Land Area hooks
 export function useLandArea(filters?: FilterState) {
   return useQuery({
@@ -13,6 +13,10 @@ import type {
   DynamicsSummary,
   RegionalDynamics,
   FilterState,
+  BatchQuery,
+  BatchResult,
+  BatchResponse,
+  Bootstrap,
 } from './types';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
@@ -118,3 +122,24 @@ export async function getDynamicsSummary(year?: number): Promise<DynamicsSummary
 export async function getDynamicsByRegion(year?: number, species?: string): Promise<RegionalDynamics[]> {
   return fetchApi<RegionalDynamics[]>('/api/dynamics/by-region', { year, species });
 }
+
+// Batch endpoint
+export async function batch(queries: BatchQuery[]): Promise<Record<string, BatchResult>> {
+  const response = await fetch(`${API_BASE_URL}/api/batch`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ requests: queries }),
+  });
+
+  if (!response.ok) {
+    throw new Error(`API error: ${response.status} ${response.statusText}`);
+  }
+
+  const data: BatchResponse = await response.json();
+  return data.results;
+}
+
+// Bootstrap endpoint: the first-paint aggregates, pre-rendered on the server
+export async function getBootstrap(): Promise<Bootstrap> {
+  return fetchApi<Bootstrap>('/api/bootstrap');
+}
@@ -135,6 +135,7 @@ export interface DynamicsRecord {
   region: string;
   subregion: string | null;
   species_group: string;
+  ownership: string;
   year: number;
   growth: number | null;
   mortality: number | null;
@@ -173,3 +174,37 @@ export type FilterState = {
   year?: number;
   [key: string]: string | number | undefined;
 }
+
+// Batch types
+export interface BatchQuery {
+  id: string;
+  route: string;
+  params?: Record<string, string | number | boolean | string[] | undefined>;
+}
+
+export interface BatchResult<T = unknown> {
+  status: number;
+  body: T;
+}
+
+export interface BatchResponse {
+  results: Record<string, BatchResult>;
+}
+
+// Bootstrap payload (keys follow bootstrap_routes in the backend settings;
+// a route that failed is null)
+export interface Bootstrap {
+  dataset_version: string;
+  land_area_summary: LandAreaResponse | null;
+  regions: RegionInfo[] | null;
+  states: string[] | null;
+  years: number[] | null;
+  land_area_by_region: LandAreaSummary[] | null;
+  land_area_by_state: LandAreaSummary[] | null;
+  ownership_breakdown: OwnershipBreakdown[] | null;
+  timber_breakdown: TimberBreakdown[] | null;
+  timber_by_region: Record<string, unknown>[] | null;
+  forest_area_national: TimeSeriesPoint[] | null;
+  dynamics_summary: DynamicsSummary | null;
+  dynamics_by_region: RegionalDynamics[] | null;
+}
@@ -1,5 +1,31 @@
+import argparse
+from pathlib import Path
+
+from backend.app.config import settings
+
+
+def build_snapshot(args: argparse.Namespace) -> None:
+    """Compile the Excel data file into a columnar snapshot."""
+    from backend.app.services import DataLoader
+    from backend.app.services.snapshot import build_snapshot
+
+    loader = DataLoader(data_file=args.data_file, use_snapshot=False)
+    build_snapshot(loader, args.output)
+
+
 def main():
-    print("Hello from forest-resources-report!")
+    parser = argparse.ArgumentParser(description="U.S. Forest Resources data tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = subparsers.add_parser(
+        "build-snapshot", help="Compile the appendix workbook into a columnar snapshot"
+    )
+    snapshot_parser.add_argument("--data-file", type=Path, default=settings.data_file)
+    snapshot_parser.add_argument("--output", type=Path, default=settings.snapshot_dir)
+    snapshot_parser.set_defaults(func=build_snapshot)
+
+    args = parser.parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":